@@ -2,7 +2,11 @@ import random
 import string
 import base64
 import hashlib
+import json
 import os
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID
 
 
 def generate_code(length: int = 5) -> str:
@@ -37,4 +41,49 @@ def get_video_duration(duration_sec: float) -> str:
 def generate_email_verification_token() -> tuple[str, str]:
     raw = base64.urlsafe_b64encode(os.urandom(32)).decode().rstrip("=")
     token_hash = hashlib.sha256(raw.encode()).hexdigest()
-    return raw, token_hash
\ No newline at end of file
+    return raw, token_hash
+
+def encode_cursor(sort_value: datetime, row_id: UUID | str) -> str:
+    """
+    キーセットページネーション用の不透明カーソルを生成
+
+    Args:
+        sort_value (datetime): 並び順のキー（作成日時など）
+        row_id (UUID | str): 同一日時内の並び順を確定させるID
+
+    Returns:
+        str: カーソル文字列
+    """
+    raw = json.dumps({"t": sort_value.isoformat(), "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    カーソル文字列を (日時, ID) に復元
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return datetime.fromisoformat(data["t"]), UUID(data["id"])
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+def paginate_rows(rows: list, limit: int, key: Callable[[Any], tuple[datetime, UUID]]) -> tuple[list, str | None]:
+    """
+    limit + 1 件取得した結果から、表示分と次ページのカーソルを返す
+
+    Args:
+        rows (list): limit + 1 件まで取得した行
+        limit (int): 1ページの件数
+        key (Callable): 行から (日時, ID) を取り出す関数
+
+    Returns:
+        tuple[list, str | None]: 表示する行と次ページのカーソル（最終ページはNone）
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
@@ -1,7 +1,10 @@
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
+import csv
+import io
 from uuid import UUID
 from os import getenv
 from app.db.base import get_db
@@ -36,8 +39,13 @@ from app.crud.admin_crud import (
     get_posts_paginated,
     update_post_status,
     get_post_by_id,
+    get_platform_sales,
+    iter_platform_sales_transactions,
 )
+from app.crud.purchases_crud import refund_purchase
+from app.crud.orders_crud import complete_order
 from app.services.s3.presign import presign_get
+from app.services.cache.top_page import mark_top_page_stale
 from app.constants.enums import MediaAssetKind
 
 router = APIRouter()
@@ -363,6 +371,8 @@ def update_post_status(
     success = update_post_status(db, post_id, status)
     if not success:
         raise HTTPException(status_code=404, detail="投稿が見つかりません")
+
+    mark_top_page_stale()
     
     return {"message": "投稿ステータスを更新しました"}
 
@@ -391,58 +401,109 @@ def get_post(
     return AdminPostDetailResponse(**post_data)
 
 
+@router.post("/purchases/{purchase_id}/refund")
+def refund_purchase_endpoint(
+    purchase_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: Users = Depends(get_current_admin_user)
+):
+    """購入を返金扱いにする（売上・残高から差し引く）"""
+    try:
+        refunded = refund_purchase(db, purchase_id)
+        if not refunded:
+            raise HTTPException(status_code=404, detail="購入が見つからないか、返金済みです")
+        db.commit()
+        return {"message": "購入を返金扱いにしました"}
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        print(f"返金処理エラー: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/orders/{order_id}/complete")
+def complete_order_endpoint(
+    order_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: Users = Depends(get_current_admin_user)
+):
+    """注文を決済完了にする（明細を売上台帳・残高へ計上する）"""
+    try:
+        completed = complete_order(db, order_id)
+        if not completed:
+            raise HTTPException(status_code=404, detail="注文が見つからないか、決済待ちではありません")
+        db.commit()
+        return {"message": "注文を決済完了にしました"}
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        print(f"決済完了処理エラー: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/sales", response_model=List[AdminSalesData])
 def get_sales_data(
     period: str = Query("monthly", regex="^(daily|weekly|monthly|yearly)$"),
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     db: Session = Depends(get_db),
     current_admin: Users = Depends(get_current_admin_user)
 ):
     """売上データを取得"""
-    
-    # 仮のデータを返す
-    mock_data = [
-        {
-            "period": "2024-01",
-            "total_revenue": 500000,
-            "platform_revenue": 50000,
-            "creator_revenue": 450000,
-            "transaction_count": 100
-        },
-        {
-            "period": "2024-02",
-            "total_revenue": 600000,
-            "platform_revenue": 60000,
-            "creator_revenue": 540000,
-            "transaction_count": 120
-        }
-    ]
-    
-    return [AdminSalesData(**data) for data in mock_data]
+    try:
+        sales = get_platform_sales(db, period, start_date, end_date)
+        return [AdminSalesData(**data) for data in sales]
+    except Exception as e:
+        print(f"売上データ取得エラー: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/sales/report")
 def get_sales_report(
-    start_date: str,
-    end_date: str,
+    start_date: date,
+    end_date: date,
     format: str = Query("csv", regex="^(csv|json)$"),
+    period: str = Query("monthly", regex="^(daily|weekly|monthly|yearly)$"),
     db: Session = Depends(get_db),
     current_admin: Users = Depends(get_current_admin_user)
 ):
-    """売上レポートを出力"""
-    
-    # 仮のCSVデータ
-    csv_data = """期間,総売上,プラットフォーム収益,クリエイター収益,取引件数
-2024-01,500000,50000,450000,100
-2024-02,600000,60000,540000,120"""
-    
-    if format == "csv":
-        return csv_data
-    
-    # JSONフォーマットの場合
-    return {
-        "data": [
-            {"period": "2024-01", "total_revenue": 500000, "platform_revenue": 50000, "creator_revenue": 450000, "transaction_count": 100},
-            {"period": "2024-02", "total_revenue": 600000, "platform_revenue": 60000, "creator_revenue": 540000, "transaction_count": 120}
-        ]
-    }
\ No newline at end of file
+    """
+    売上レポートを出力
+
+    json は期間（period）ごとの集計、csv は取引ごとの明細を逐次出力する（1年分でもメモリに載せない）
+    """
+
+    if format == "json":
+        return {"data": get_platform_sales(db, period, start_date, end_date)}
+
+    def _csv_lines():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def _flush():
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return value
+
+        writer.writerow(["計上日時", "種別", "取引ID", "クリエイターID", "売上", "プラットフォーム収益", "クリエイター収益"])
+        yield _flush()
+        for data in iter_platform_sales_transactions(db, start_date, end_date):
+            writer.writerow([
+                data["created_at"].isoformat(),
+                data["source"],
+                data["transaction_id"],
+                data["creator_user_id"],
+                data["amount"],
+                data["platform_revenue"],
+                data["creator_revenue"],
+            ])
+            yield _flush()
+
+    filename = f"sales_report_{start_date.isoformat()}_{end_date.isoformat()}.csv"
+    return StreamingResponse(
+        _csv_lines(),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
\ No newline at end of file
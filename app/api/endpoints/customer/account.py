@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import Dict
-from app.db.base import get_db
-from app.deps.auth import get_current_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable, Dict, Literal, Optional
+from uuid import UUID
+import asyncio
+from app.core.config import settings
+from app.db.base import get_db, get_async_db, AsyncSessionLocal
+from app.deps.auth import get_current_user, get_current_user_async
 from app.models.user import Users
 from app.schemas.account import (
     Kind,
@@ -12,6 +16,7 @@ from app.schemas.account import (
     AvatarPresignRequest,
     AccountPresignResponse,
     AccountPostStatusResponse,
+    AccountPostListResponse,
     AccountPostResponse,
     LikedPostResponse,
     ProfileInfo,
@@ -31,6 +36,8 @@ from app.crud.post_crud import (
     get_total_likes_by_user_id,
     get_posts_count_by_user_id,
     get_post_status_by_user_id,
+    get_posts_by_status_for_user,
+    POST_STATUS_SECTIONS,
     get_liked_posts_by_user_id,
     get_bookmarked_posts_by_user_id,
     get_liked_posts_list_by_user_id,
@@ -43,22 +50,143 @@ from app.crud.user_crud import check_profile_name_exists, update_user
 from app.crud.profile_crud import get_profile_by_user_id, get_profile_info_by_user_id, update_profile
 from app.services.s3.keygen import account_asset_key
 from app.services.s3.presign import presign_put_public
+from app.api.commons.utils import decode_cursor, paginate_rows
 import os
 
 router = APIRouter()
 BASE_URL = os.getenv("CDN_BASE_URL")
 
+def _load_profile_info(db: Session, user_id: UUID) -> ProfileInfo:
+    """プロフィール情報"""
+    profile_info_data = get_profile_info_by_user_id(db, user_id)
+    return ProfileInfo(
+        profile_name=profile_info_data["profile_name"] or "",
+        username=profile_info_data["username"] or "",
+        avatar_url=f"{BASE_URL}/{profile_info_data['avatar_url']}" if profile_info_data["avatar_url"] else None,
+        cover_url=f"{BASE_URL}/{profile_info_data['cover_url']}" if profile_info_data["cover_url"] else None,
+    )
+
+def _load_social_info(db: Session, user_id: UUID) -> SocialInfo:
+    """フォロー数・いいね数・いいねした投稿"""
+    # いいね数とタプルをLikedPostResponseオブジェクトに変換
+    total_likes = get_total_likes_by_user_id(db, user_id)
+    liked_posts_data = get_liked_posts_by_user_id(db, user_id)
+    liked_posts = []
+    for post_tuple in liked_posts_data:
+        post, profile_name, username, avatar_url, thumbnail_key, duration_sec, created_at = post_tuple
+        liked_post = LikedPostResponse(
+            id=post.id,
+            description=post.description,
+            creator_user_id=post.creator_user_id,
+            profile_name=profile_name,
+            username=username,
+            avatar_url=f"{BASE_URL}/{avatar_url}" if avatar_url else None,
+            thumbnail_key=f"{BASE_URL}/{thumbnail_key}" if thumbnail_key else None,
+            duration_sec=duration_sec,
+            created_at=created_at,
+            updated_at=post.updated_at
+        )
+        liked_posts.append(liked_post)
+
+    follower_data = get_follower_count(db, user_id)
+    return SocialInfo(
+        followers_count=follower_data["followers_count"] if follower_data else 0,
+        following_count=follower_data["following_count"] if follower_data else 0,
+        total_likes=total_likes or 0,
+        liked_posts=liked_posts,
+    )
+
+def _load_posts_info(db: Session, user_id: UUID) -> PostsInfo:
+    """投稿数"""
+    posts_data = get_posts_count_by_user_id(db, user_id)
+    return PostsInfo(
+        pending_posts_count=posts_data["peding_posts_count"] if posts_data else 0,
+        rejected_posts_count=posts_data["rejected_posts_count"] if posts_data else 0,
+        unpublished_posts_count=posts_data["unpublished_posts_count"] if posts_data else 0,
+        deleted_posts_count=posts_data["deleted_posts_count"] if posts_data else 0,
+        approved_posts_count=posts_data["approved_posts_count"] if posts_data else 0,
+    )
+
+def _load_sales_info(db: Session, user_id: UUID) -> SalesInfo:
+    """売上"""
+    total_sales = get_total_sales(db, user_id)
+    return SalesInfo(
+        total_sales=total_sales or 0,
+    )
+
+def _load_plan_info(db: Session, user_id: UUID) -> PlanInfo:
+    """加入プラン・単品購入"""
+    plan_data = get_plan_by_user_id(db, user_id)
+    # 単品購入データ
+    single_purchases_count = get_single_purchases_count_by_user_id(db, user_id)
+    single_purchases_data = get_single_purchases_by_user_id(db, user_id)
+
+    # subscribed_plan_detailsのURLを構築
+    subscribed_plan_details = []
+    for plan in plan_data.get("subscribed_plan_details", []):
+        subscribed_plan_details.append({
+            **plan,
+            "creator_avatar_url": f"{BASE_URL}/{plan['creator_avatar_url']}" if plan.get('creator_avatar_url') else None,
+            "thumbnail_keys": [f"{BASE_URL}/{key}" for key in plan.get('thumbnail_keys', [])]
+        })
+
+    return PlanInfo(
+        plan_count=plan_data["plan_count"] if plan_data else 0,
+        total_price=plan_data["total_price"] if plan_data else 0,
+        subscribed_plan_count=plan_data["subscribed_plan_count"] if plan_data else 0,
+        subscribed_total_price=plan_data["subscribed_total_price"] if plan_data else 0,
+        subscribed_plan_details=subscribed_plan_details,
+        single_purchases_count=single_purchases_count if single_purchases_count else 0,
+        single_purchases_data=single_purchases_data if single_purchases_data else [],
+    )
+
+# /info のセクション名と取得関数（互いに独立しているため並行に取得する）
+ACCOUNT_INFO_SECTIONS: Dict[str, Callable[[Session, UUID], Any]] = {
+    "profile_info": _load_profile_info,
+    "social_info": _load_social_info,
+    "posts_info": _load_posts_info,
+    "sales_info": _load_sales_info,
+    "plan_info": _load_plan_info,
+}
+
+async def _load_account_info_sections(db: AsyncSession, user_id: UUID) -> Dict[str, Any]:
+    """
+    セクションを最大 ACCOUNT_INFO_CONCURRENCY 個の AsyncSession で並行に取得する
+
+    リクエストのセッション（認証で使用済み）を1つ目として使い、足りない分だけセッションを開く。
+    同期プールの接続は使わず、1リクエストが同時に使う接続数は ACCOUNT_INFO_CONCURRENCY で頭打ちになる。
+    """
+    extra_sessions = [AsyncSessionLocal() for _ in range(max(settings.ACCOUNT_INFO_CONCURRENCY, 1) - 1)]
+    sessions: asyncio.Queue = asyncio.Queue()
+    for session in [db, *extra_sessions]:
+        sessions.put_nowait(session)
+
+    async def _load(loader: Callable[[Session, UUID], Any]) -> Any:
+        # 空いているセッションを1つ借りて使う（AsyncSession は同時に1つの処理でしか使えない）
+        session = await sessions.get()
+        try:
+            return await session.run_sync(loader, user_id)
+        finally:
+            sessions.put_nowait(session)
+
+    try:
+        results = await asyncio.gather(*(_load(loader) for loader in ACCOUNT_INFO_SECTIONS.values()))
+    finally:
+        for session in extra_sessions:
+            await session.close()
+    return dict(zip(ACCOUNT_INFO_SECTIONS, results))
+
 @router.get("/info", response_model=AccountInfoResponse)
-def get_account_info(
-    current_user: Users = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_account_info(
+    current_user: Users = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     アカウント情報を取得
 
     Args:
         current_user (Users): 現在のユーザー
-        db (Session): データベースセッション
+        db (AsyncSession): データベースセッション
 
     Returns:
         AccountInfoResponse: アカウント情報
@@ -67,92 +195,7 @@ def get_account_info(
         HTTPException: エラーが発生した場合
     """
     try:
-
-        # プロフィール情報
-        profile_info_data = get_profile_info_by_user_id(db, current_user.id)
-        profile_info = ProfileInfo(
-            profile_name=profile_info_data["profile_name"] or "",
-            username=profile_info_data["username"] or "",
-            avatar_url=f"{BASE_URL}/{profile_info_data['avatar_url']}" if profile_info_data["avatar_url"] else None,
-            cover_url=f"{BASE_URL}/{profile_info_data['cover_url']}" if profile_info_data["cover_url"] else None,
-        )
-
-        # いいね数とタプルをLikedPostResponseオブジェクトに変換
-        total_likes = get_total_likes_by_user_id(db, current_user.id)
-        liked_posts_data = get_liked_posts_by_user_id(db, current_user.id)
-        liked_posts = []
-        for post_tuple in liked_posts_data:
-            post, profile_name, username, avatar_url, thumbnail_key, duration_sec, created_at = post_tuple
-            liked_post = LikedPostResponse(
-                id=post.id,
-                description=post.description,
-                creator_user_id=post.creator_user_id,
-                profile_name=profile_name,
-                username=username,
-                avatar_url=f"{BASE_URL}/{avatar_url}" if avatar_url else None,
-                thumbnail_key=f"{BASE_URL}/{thumbnail_key}" if thumbnail_key else None,
-                duration_sec=duration_sec,
-                created_at=created_at,
-                updated_at=post.updated_at
-            )
-            liked_posts.append(liked_post)
-        
-        follower_data = get_follower_count(db, current_user.id)
-        social_info = SocialInfo(
-            followers_count=follower_data["followers_count"] if follower_data else 0,
-            following_count=follower_data["following_count"] if follower_data else 0,
-            total_likes=total_likes or 0,
-            liked_posts=liked_posts,
-        )
-
-        # 投稿数
-        posts_data = get_posts_count_by_user_id(db, current_user.id)
-        posts_info = PostsInfo(
-            pending_posts_count=posts_data["peding_posts_count"] if posts_data else 0,
-            rejected_posts_count=posts_data["rejected_posts_count"] if posts_data else 0,
-            unpublished_posts_count=posts_data["unpublished_posts_count"] if posts_data else 0,
-            deleted_posts_count=posts_data["deleted_posts_count"] if posts_data else 0,
-            approved_posts_count=posts_data["approved_posts_count"] if posts_data else 0,
-        )
-        
-        # 売上
-        total_sales = get_total_sales(db, current_user.id)
-        sales_info = SalesInfo(
-            total_sales=total_sales or 0,
-        )
-
-        # プラン情報
-        plan_data = get_plan_by_user_id(db, current_user.id)
-        # 単品購入データ
-        single_purchases_count = get_single_purchases_count_by_user_id(db, current_user.id)
-        single_purchases_data = get_single_purchases_by_user_id(db, current_user.id)
-
-        # subscribed_plan_detailsのURLを構築
-        subscribed_plan_details = []
-        for plan in plan_data.get("subscribed_plan_details", []):
-            subscribed_plan_details.append({
-                **plan,
-                "creator_avatar_url": f"{BASE_URL}/{plan['creator_avatar_url']}" if plan.get('creator_avatar_url') else None,
-                "thumbnail_keys": [f"{BASE_URL}/{key}" for key in plan.get('thumbnail_keys', [])]
-            })
-
-        plan_info = PlanInfo(
-            plan_count=plan_data["plan_count"] if plan_data else 0,
-            total_price=plan_data["total_price"] if plan_data else 0,
-            subscribed_plan_count=plan_data["subscribed_plan_count"] if plan_data else 0,
-            subscribed_total_price=plan_data["subscribed_total_price"] if plan_data else 0,
-            subscribed_plan_details=subscribed_plan_details,
-            single_purchases_count=single_purchases_count if single_purchases_count else 0,
-            single_purchases_data=single_purchases_data if single_purchases_data else [],
-        )
-
-        return AccountInfoResponse(
-            profile_info=profile_info,
-            social_info=social_info,
-            posts_info=posts_info,
-            sales_info=sales_info,
-            plan_info=plan_info,
-        )
+        return AccountInfoResponse(**await _load_account_info_sections(db, current_user.id))
     except Exception as e:
         print("アカウント情報取得エラーが発生しました", e)
         # エラー時はデフォルト値で返す
@@ -276,42 +319,75 @@ def presign_upload(
 
 @router.get("/posts")
 def get_post_status(
+    limit: int = Query(20, ge=1, le=100, description="ステータスごとの件数"),
     user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    投稿ステータスを取得
+    投稿ステータスを取得（ステータスごとに limit 件まで、続きは /posts/{status} で取得）
     """
     try:
-        posts_data = get_post_status_by_user_id(db, user.id)
-        
-        # データ変換用のヘルパー関数
-        def convert_posts(posts_list):
-            return [
-                AccountPostResponse(
-                    id=str(post.Posts.id),
-                    description=post.Posts.description,
-                    thumbnail_url=f"{BASE_URL}/{post.thumbnail_key}" if post.thumbnail_key else None,
-                    likes_count=post.likes_count,
-                    creator_name=post.profile_name,
-                    username=post.username,
-                    creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
-                    price=post.post_price,
-                    currency=post.post_currency
-                )
-                for post in posts_list
-            ]
-        
-        return AccountPostStatusResponse(
-            pending_posts=convert_posts(posts_data["pending_posts"]),
-            rejected_posts=convert_posts(posts_data["rejected_posts"]),
-            unpublished_posts=convert_posts(posts_data["unpublished_posts"]),
-            deleted_posts=convert_posts(posts_data["deleted_posts"]),
-            approved_posts=convert_posts(posts_data["approved_posts"])
-        )
+        posts_data = get_post_status_by_user_id(db, user.id, limit_per_status=limit)
+
+        sections = {}
+        next_cursors = {}
+        for section, rows in posts_data.items():
+            rows, next_cursor = paginate_rows(
+                rows, limit, key=lambda row: (row.Posts.created_at, row.Posts.id)
+            )
+            sections[section] = [_to_account_post_response(post) for post in rows]
+            next_cursors[section] = next_cursor
+
+        return AccountPostStatusResponse(**sections, next_cursors=next_cursors)
     except Exception as e:
         print("投稿ステータス取得エラーが発生しました", e)
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/posts/{status}", response_model=AccountPostListResponse)
+def get_posts_by_status(
+    status: Literal["pending", "rejected", "unpublished", "deleted", "approved"],
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    指定ステータスの投稿の続きを取得
+    """
+    try:
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        rows, next_cursor = paginate_rows(
+            get_posts_by_status_for_user(
+                db, user.id, POST_STATUS_SECTIONS[f"{status}_posts"], limit=limit + 1, cursor=cursor_key
+            ),
+            limit,
+            key=lambda row: (row.Posts.created_at, row.Posts.id),
+        )
+        return AccountPostListResponse(
+            posts=[_to_account_post_response(post) for post in rows],
+            next_cursor=next_cursor
+        )
+    except Exception as e:
+        print("投稿一覧取得エラーが発生しました", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _to_account_post_response(post) -> AccountPostResponse:
+    """ステータス別投稿一覧の行をレスポンスに変換"""
+    return AccountPostResponse(
+        id=str(post.Posts.id),
+        description=post.Posts.description,
+        thumbnail_url=f"{BASE_URL}/{post.thumbnail_key}" if post.thumbnail_key else None,
+        likes_count=post.likes_count,
+        creator_name=post.profile_name,
+        username=post.username,
+        creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
+        price=post.post_price,
+        currency=post.post_currency
+    )
     
 @router.get("/plans")
 def get_plans(
@@ -347,6 +423,8 @@ def get_plans(
 
 @router.get("/bookmarks", response_model=BookmarkedPostsResponse)
 def get_bookmarks(
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
     current_user: Users = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -354,7 +432,16 @@ def get_bookmarks(
     ブックマークした投稿一覧を取得
     """
     try:
-        bookmarks_data = get_bookmarked_posts_by_user_id(db, current_user.id)
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        bookmarks_data, next_cursor = paginate_rows(
+            get_bookmarked_posts_by_user_id(db, current_user.id, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.bookmarked_at, row.Posts.id),
+        )
 
         bookmarks = []
         for post, profile_name, username, avatar_url, thumbnail_key, duration_sec, likes_count, comments_count, bookmarked_at in bookmarks_data:
@@ -380,13 +467,15 @@ def get_bookmarks(
             )
             bookmarks.append(bookmark)
 
-        return BookmarkedPostsResponse(bookmarks=bookmarks)
+        return BookmarkedPostsResponse(bookmarks=bookmarks, next_cursor=next_cursor)
     except Exception as e:
         print("ブックマーク一覧取得エラー:", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/likes", response_model=LikedPostsListResponse)
 def get_likes(
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
     current_user: Users = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -394,7 +483,16 @@ def get_likes(
     いいねした投稿一覧を取得
     """
     try:
-        liked_posts_data = get_liked_posts_list_by_user_id(db, current_user.id)
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        liked_posts_data, next_cursor = paginate_rows(
+            get_liked_posts_list_by_user_id(db, current_user.id, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.liked_at, row.Posts.id),
+        )
 
         liked_posts = []
         for post, profile_name, username, avatar_url, thumbnail_key, duration_sec, likes_count, comments_count, liked_at in liked_posts_data:
@@ -420,13 +518,15 @@ def get_likes(
             )
             liked_posts.append(liked_post)
 
-        return LikedPostsListResponse(liked_posts=liked_posts)
+        return LikedPostsListResponse(liked_posts=liked_posts, next_cursor=next_cursor)
     except Exception as e:
         print("いいね一覧取得エラー:", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/bought", response_model=BoughtPostsResponse)
 def get_bought(
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
     current_user: Users = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -434,7 +534,16 @@ def get_bought(
     購入済み投稿一覧を取得
     """
     try:
-        bought_posts_data = get_bought_posts_by_user_id(db, current_user.id)
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        bought_posts_data, next_cursor = paginate_rows(
+            get_bought_posts_by_user_id(db, current_user.id, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.purchased_at, row.Posts.id),
+        )
 
         bought_posts = []
         for post, profile_name, username, avatar_url, thumbnail_key, duration_sec, likes_count, comments_count, purchased_at in bought_posts_data:
@@ -460,7 +569,7 @@ def get_bought(
             )
             bought_posts.append(bought_post)
 
-        return BoughtPostsResponse(bought_posts=bought_posts)
+        return BoughtPostsResponse(bought_posts=bought_posts, next_cursor=next_cursor)
     except Exception as e:
         print("購入済み一覧取得エラー:", e)
         raise HTTPException(status_code=500, detail=str(e))
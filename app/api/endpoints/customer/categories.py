@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.db.base import get_db
+from app.db.base import get_read_db
 from app.schemas.categories import CategoryOut, GenreOut
 from app.crud.categories_crud import get_categories, get_genres, get_recommended_categories, get_recently_used_categories
 from app.deps.auth import get_current_user
@@ -9,7 +9,7 @@ from typing import List
 router = APIRouter()
 
 @router.get("/genres", response_model=List[GenreOut])
-def get_genres_api(db: Session = Depends(get_db)):
+def get_genres_api(db: Session = Depends(get_read_db)):
     try:
         genres = get_genres(db)
         return [GenreOut(id=genre.id, slug=genre.slug, name=genre.name) for genre in genres]
@@ -17,7 +17,7 @@ def get_genres_api(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/categories", response_model=List[CategoryOut])
-def get_categories_api(db: Session = Depends(get_db)):
+def get_categories_api(db: Session = Depends(get_read_db)):
     try:
         categories = get_categories(db)
         return [CategoryOut(id=category.id, slug=category.slug, name=category.name, genre_id=category.genre_id) for category in categories]
@@ -25,7 +25,7 @@ def get_categories_api(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/recommended", response_model=List[CategoryOut])
-def get_recommended_categories_api(db: Session = Depends(get_db)):
+def get_recommended_categories_api(db: Session = Depends(get_read_db)):
     try:
         categories = get_recommended_categories(db)
         return [CategoryOut(id=category.id, slug=category.slug, name=category.name, genre_id=category.genre_id) for category in categories]
@@ -33,7 +33,7 @@ def get_recommended_categories_api(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/recent", response_model=List[CategoryOut])
-def get_recent_categories_api(current_user = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_recent_categories_api(current_user = Depends(get_current_user), db: Session = Depends(get_read_db)):
     try:
         categories = get_recently_used_categories(db, current_user.id)
         return [CategoryOut(id=category.id, slug=category.slug, name=category.name, genre_id=category.genre_id) for category in categories]
@@ -1,24 +1,36 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
-from app.db.base import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import get_async_read_db
 from app.crud.post_crud import get_posts_by_category_slug
-from app.schemas.post import PostCategoryResponse
+from app.schemas.post import PostCategoryResponse, PostCategoryListResponse
+from app.api.commons.utils import decode_cursor, paginate_rows
 from os import getenv
-from typing import List
+from typing import Optional
 
 router = APIRouter()
 
 BASE_URL = getenv("CDN_BASE_URL")
 
-@router.get("/", response_model=List[PostCategoryResponse])
+@router.get("/", response_model=PostCategoryListResponse)
 async def get_category_by_slug(
     slug: str = Query(..., description="Category Slug"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
+    try:
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
     try:
         # TODO: ランキングの返却
-        posts = get_posts_by_category_slug(db, slug)
-        return [PostCategoryResponse(
+        posts, next_cursor = paginate_rows(
+            await db.run_sync(get_posts_by_category_slug, slug, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.Posts.created_at, row.Posts.id),
+        )
+        return PostCategoryListResponse(posts=[PostCategoryResponse(
             id=post.Posts.id,
             description=post.Posts.description,
             thumbnail_url=f"{BASE_URL}/{post.thumbnail_key}" if post.thumbnail_key else None,
@@ -26,7 +38,7 @@ async def get_category_by_slug(
             creator_name=post.profile_name,
             username=post.username,
             creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None
-        ) for post in posts]
+        ) for post in posts], next_cursor=next_cursor)
     except Exception as e:
         print("カテゴリー取得に失敗しました", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.schemas.creator import (
-    CreatorCreate, CreatorUpdate, CreatorOut,
+    CreatorCreate, CreatorUpdate, CreatorOut, CreatorProfileOut,
     IdentityVerificationCreate, IdentityVerificationOut,
     IdentityDocumentCreate, IdentityDocumentOut
 )
@@ -122,7 +122,7 @@ def get_verification_status(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/profile", response_model=CreatorOut)
+@router.get("/profile", response_model=CreatorProfileOut)
 def get_creator_profile(
     user_id: UUID,
     db: Session = Depends(get_db)
@@ -135,7 +135,7 @@ def get_creator_profile(
         db (Session): データベースセッション
     
     Returns:
-        CreatorOut: クリエイター情報
+        CreatorProfileOut: クリエイター情報とフォロワー数・いいね数・投稿数
     """
     try:
 
@@ -122,7 +122,7 @@ async def presign_post_media_video(
         for f in request.files:
             key = post_media_video_key(str(user.id), str(f.post_id), f.ext, f.kind)
 
-            response = presign_put("ingest", key, f.content_type)
+            response = presign_put("ingest", key, f.content_type, checksum_sha256=f.sha256)
 
             uploads[f.kind] = PresignResponseItem(
                 key=response["key"],
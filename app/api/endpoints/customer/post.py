@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
-from app.db.base import get_db
-from app.deps.auth import get_current_user_optional
-from app.schemas.post import PostCreateRequest, PostResponse, NewArrivalsResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import get_db, get_async_db, get_async_read_db
+from app.deps.auth import get_current_user_optional, get_current_user_id_optional
+from app.schemas.post import PostCreateRequest, PostResponse, NewArrivalsResponse, NewArrivalsListResponse
 from app.constants.enums import PostVisibility, PostType, PlanStatus, PriceType
-from app.crud.post_crud import create_post, get_post_detail_by_id
+from app.crud.post_crud import create_post, get_public_post_detail_by_id, is_post_purchased
 from app.crud.plan_crud import create_plan
 from app.crud.price_crud import create_price
 from app.crud.post_plans_crud import create_post_plan
@@ -13,10 +14,12 @@ from app.crud.post_tags_crud import create_post_tag
 from app.crud.post_categories_crud import create_post_category
 from app.crud.top_crud import get_recent_posts
 from app.models.tags import Tags
-from typing import List
+from typing import Optional
 import os
 from os import getenv
-from app.api.commons.utils import get_video_duration
+from app.api.commons.utils import get_video_duration, decode_cursor, paginate_rows
+from app.services.cache.post_detail import post_detail_cache
+from uuid import UUID
 
 router = APIRouter()
 
@@ -102,86 +105,58 @@ async def create_post_endpoint(
 @router.get("/detail")
 async def get_post_detail(
     post_id: str = Query(..., description="投稿ID"),
-    user = Depends(get_current_user_optional),
-    db: Session = Depends(get_db)
+    user_id: UUID | None = Depends(get_current_user_id_optional),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        # CRUD関数を使用して投稿詳細を取得
-        user_id = user.id if user else None
-        post_data = get_post_detail_by_id(db, post_id, user_id)
-        
-        if not post_data:
-            raise HTTPException(status_code=404, detail="投稿が見つかりません")
-        
-        # 環境変数から設定を取得
-        media_cdn_url = os.getenv("MEDIA_CDN_URL", "")
-        cdn_base_url = os.getenv("CDN_BASE_URL", "")
-        
-        # レスポンス用のデータを構築
-        video_url = None
-        if post_data["video_rendition"]:
-            video_url = f"{media_cdn_url}/{post_data['video_rendition']}"
-        
-        thumbnail_url = None
-        if post_data["thumbnail_key"]:
-            thumbnail_url = f"{cdn_base_url}/{post_data['thumbnail_key']}"
-        
-        creator_avatar = None
-        if post_data["creator_profile"] and post_data["creator_profile"].avatar_url:
-            creator_avatar = f"{cdn_base_url}/{post_data['creator_profile'].avatar_url}"
-        
-        
-        # カテゴリ情報を整形
-        categories_data = []
-        if post_data["categories"]:
-            categories_data = [
-                {
-                    "id": str(category.id),
-                    "name": category.name,
-                    "slug": category.slug
-                }
-                for category in post_data["categories"]
-            ]
-        
-        post_detail = {
-            "id": str(post_data["post"].id),
-            "title": post_data["post"].description or "無題",
-            "description": post_data["post"].description,
-            "purchased": post_data["purchased"],
+        cache_key = str(UUID(post_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="投稿が見つかりません")
+
+    try:
+        # 閲覧者に依存しない部分はキャッシュから取得
+        public_detail = post_detail_cache.get(cache_key)
+        if public_detail is None:
+            post_data = await db.run_sync(get_public_post_detail_by_id, cache_key)
+            if not post_data:
+                raise HTTPException(status_code=404, detail="投稿が見つかりません")
+            public_detail = _build_public_post_detail(post_data)
+            post_detail_cache.set(cache_key, public_detail)
+
+        # 閲覧者の購入状況に応じて表示する動画を決定
+        purchased = await db.run_sync(is_post_purchased, user_id, cache_key)
+        video_url = public_detail["main_video_url"] if purchased else public_detail["sample_video_url"]
+
+        return {
+            **public_detail["detail"],
+            "purchased": purchased,
             "video_url": video_url,
-            "thumbnail": thumbnail_url,
-            "main_video_duration": post_data["main_video_duration"],
-            "sample_video_duration": post_data["sample_video_duration"],
-            "views": 0,
-            "likes": post_data["likes_count"],
-            "creator": {
-                "name": post_data["creator_profile"].username if post_data["creator_profile"] else post_data["creator"].email,
-                "profile_name": post_data["creator"].profile_name if post_data["creator_profile"] else post_data["creator"].email,
-                "avatar": creator_avatar,
-                "verified": True
-            },
-            "single": post_data["single"],
-            "subscription": post_data["subscription"],
-            "categories": categories_data,
-            "created_at": post_data["post"].created_at.isoformat(),
-            "updated_at": post_data["post"].updated_at.isoformat()
         }
         
-        return post_detail
-        
     except HTTPException:
         raise
     except Exception as e:
         print("投稿詳細取得エラーが発生しました", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/new-arrivals" , response_model=List[NewArrivalsResponse])
+@router.get("/new-arrivals" , response_model=NewArrivalsListResponse)
 async def get_new_arrivals(
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     try:
-        recent_posts = get_recent_posts(db, limit=50)
-        return [NewArrivalsResponse(
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        recent_posts, next_cursor = paginate_rows(
+            await db.run_sync(get_recent_posts, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.Posts.created_at, row.Posts.id),
+        )
+        return NewArrivalsListResponse(posts=[NewArrivalsResponse(
             id=str(post.Posts.id),
             description=post.Posts.description,
             thumbnail_url=f"{BASE_URL}/{post.thumbnail_key}" if post.thumbnail_key else None,
@@ -190,13 +165,75 @@ async def get_new_arrivals(
             creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
             duration=get_video_duration(post.duration_sec) if post.duration_sec else None,
             likes_count=post.likes_count or 0
-        ) for post in recent_posts]
+        ) for post in recent_posts], next_cursor=next_cursor)
     except Exception as e:
         print("新着投稿取得エラーが発生しました", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # utils
+def _build_public_post_detail(post_data: dict) -> dict:
+    """投稿詳細のうち閲覧者に依存しない部分をレスポンス形式に整形する"""
+    # 環境変数から設定を取得
+    media_cdn_url = os.getenv("MEDIA_CDN_URL", "")
+    cdn_base_url = os.getenv("CDN_BASE_URL", "")
+
+    main_video_url = None
+    if post_data["main_video_key"]:
+        main_video_url = f"{media_cdn_url}/{post_data['main_video_key']}"
+
+    sample_video_url = None
+    if post_data["sample_video_key"]:
+        sample_video_url = f"{media_cdn_url}/{post_data['sample_video_key']}"
+
+    thumbnail_url = None
+    if post_data["thumbnail_key"]:
+        thumbnail_url = f"{cdn_base_url}/{post_data['thumbnail_key']}"
+
+    creator_avatar = None
+    if post_data["creator_profile"] and post_data["creator_profile"].avatar_url:
+        creator_avatar = f"{cdn_base_url}/{post_data['creator_profile'].avatar_url}"
+
+    # カテゴリ情報を整形
+    categories_data = []
+    if post_data["categories"]:
+        categories_data = [
+            {
+                "id": str(category["id"]),
+                "name": category["name"],
+                "slug": category["slug"]
+            }
+            for category in post_data["categories"]
+        ]
+
+    detail = {
+        "id": str(post_data["post"].id),
+        "title": post_data["post"].description or "無題",
+        "description": post_data["post"].description,
+        "thumbnail": thumbnail_url,
+        "main_video_duration": post_data["main_video_duration"],
+        "sample_video_duration": post_data["sample_video_duration"],
+        "views": 0,
+        "likes": post_data["likes_count"],
+        "creator": {
+            "name": post_data["creator_profile"].username if post_data["creator_profile"] else post_data["creator"].email,
+            "profile_name": post_data["creator"].profile_name if post_data["creator_profile"] else post_data["creator"].email,
+            "avatar": creator_avatar,
+            "verified": True
+        },
+        "single": post_data["single"],
+        "subscription": post_data["subscription"],
+        "categories": categories_data,
+        "created_at": post_data["post"].created_at.isoformat(),
+        "updated_at": post_data["post"].updated_at.isoformat()
+    }
+
+    return {
+        "detail": detail,
+        "main_video_url": main_video_url,
+        "sample_video_url": sample_video_url,
+    }
+
 def _determine_visibility(single: bool, plan: bool) -> int:
     """投稿の可視性を判定する"""
     if single and plan:
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.db.base import get_db
 from app.deps.auth import get_current_user
+from typing import Optional
+from datetime import date
 from app.schemas.purchases import (
     PurchaseCreateRequest,
     SalesDataResponse,
+    SalesTransactionResponse,
     SalesTransactionsListResponse
 )
 from app.crud.purchases_crud import (
@@ -12,6 +15,8 @@ from app.crud.purchases_crud import (
     get_sales_data_by_creator_id,
     get_sales_transactions_by_creator_id
 )
+from app.api.commons.utils import decode_cursor, paginate_rows
+from app.constants.enums import PlanStatus
 
 router = APIRouter()
 
@@ -60,6 +65,8 @@ async def create_purchase_endpoint(
 @router.get("/sales", response_model=SalesDataResponse)
 async def get_sales_data(
     period: str = "today",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -68,12 +75,14 @@ async def get_sales_data(
 
     Args:
         period: 期間（"today", "monthly", "last_5_days"）デフォルトは"today"
+        start_date: 任意期間の開始日（指定時は period より優先）
+        end_date: 任意期間の終了日（省略時は今日）
 
     Returns:
         SalesDataResponse: 売上サマリーデータ
     """
     try:
-        sales_data = get_sales_data_by_creator_id(db, user.id, period)
+        sales_data = get_sales_data_by_creator_id(db, user.id, period, start_date, end_date)
         return SalesDataResponse(**sales_data)
     except Exception as e:
         print("売上データ取得に失敗しました", e)
@@ -81,7 +90,8 @@ async def get_sales_data(
 
 @router.get("/transactions", response_model=SalesTransactionsListResponse)
 async def get_sales_transactions(
-    limit: int = 50,
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    limit: int = Query(50, ge=1, le=100),
     user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -89,14 +99,36 @@ async def get_sales_transactions(
     クリエイターの売上履歴を取得
 
     Args:
+        cursor: 前ページの next_cursor
         limit: 取得件数（デフォルト50件）
 
     Returns:
         SalesTransactionsListResponse: 売上履歴リスト
     """
     try:
-        transactions = get_sales_transactions_by_creator_id(db, user.id, limit)
-        return SalesTransactionsListResponse(transactions=transactions)
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    try:
+        rows, next_cursor = paginate_rows(
+            get_sales_transactions_by_creator_id(db, user.id, limit=limit + 1, cursor=cursor_key),
+            limit,
+            key=lambda row: (row.CreatorSalesLedger.created_at, row.CreatorSalesLedger.id),
+        )
+
+        transactions = []
+        for entry, buyer_name, buyer_username in rows:
+            transactions.append(SalesTransactionResponse(
+                id=str(entry.purchase_id or entry.id),
+                date=entry.created_at.strftime('%Y/%m/%d'),
+                type="single" if entry.type == PlanStatus.SINGLE else "plan",
+                title=entry.title,
+                amount=int(entry.amount),
+                buyer=buyer_name or buyer_username or ""
+            ))
+
+        return SalesTransactionsListResponse(transactions=transactions, next_cursor=next_cursor)
     except Exception as e:
         print("売上履歴取得に失敗しました", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.base import get_db
-from app.crud.post_crud import (
-    get_ranking_posts_all_time,
-    get_ranking_posts_monthly,
-    get_ranking_posts_weekly,
-    get_ranking_posts_daily
-)
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import get_async_read_db
+from app.crud.ranking_crud import get_ranking_snapshot
+from app.constants.enums import RankingPeriod
 from app.schemas.ranking import (
     RankingPostsAllTimeResponse,
     RankingPostsMonthlyResponse,
@@ -22,13 +18,14 @@ router = APIRouter()
 
 @router.get("/")
 async def get_ranking(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
-        ranking_posts_all_time = get_ranking_posts_all_time(db, limit=50)
-        ranking_posts_monthly = get_ranking_posts_monthly(db, limit=50)
-        ranking_posts_weekly = get_ranking_posts_weekly(db, limit=50)
-        ranking_posts_daily = get_ranking_posts_daily(db, limit=50)
+        # 定期ジョブで作成したスナップショットを参照する
+        ranking_posts_all_time = await db.run_sync(get_ranking_snapshot, RankingPeriod.ALL_TIME, limit=50)
+        ranking_posts_monthly = await db.run_sync(get_ranking_snapshot, RankingPeriod.MONTHLY, limit=50)
+        ranking_posts_weekly = await db.run_sync(get_ranking_snapshot, RankingPeriod.WEEKLY, limit=50)
+        ranking_posts_daily = await db.run_sync(get_ranking_snapshot, RankingPeriod.DAILY, limit=50)
 
         return RankingResponse(
             all_time=[RankingPostsAllTimeResponse(
@@ -39,8 +36,8 @@ async def get_ranking(
                 creator_name=post.profile_name,
                 username=post.username,
                 creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
-                rank=idx + 1
-            ) for idx, post in enumerate(ranking_posts_all_time)],
+                rank=post.rank
+            ) for post in ranking_posts_all_time],
             monthly=[RankingPostsMonthlyResponse(
                 id=str(post.Posts.id),  # UUIDを文字列に変換
                 description=post.Posts.description,
@@ -49,8 +46,8 @@ async def get_ranking(
                 creator_name=post.profile_name,
                 username=post.username,
                 creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
-                rank=idx + 1
-            ) for idx, post in enumerate(ranking_posts_monthly)],
+                rank=post.rank
+            ) for post in ranking_posts_monthly],
             weekly=[RankingPostsWeeklyResponse(
                 id=str(post.Posts.id),  # UUIDを文字列に変換
                 description=post.Posts.description,
@@ -59,8 +56,8 @@ async def get_ranking(
                 creator_name=post.profile_name,
                 username=post.username,
                 creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
-                rank=idx + 1
-            ) for idx, post in enumerate(ranking_posts_weekly)],
+                rank=post.rank
+            ) for post in ranking_posts_weekly],
             daily=[RankingPostsDailyResponse(
                 id=str(post.Posts.id),  # UUIDを文字列に変換
                 description=post.Posts.description,
@@ -69,8 +66,8 @@ async def get_ranking(
                 creator_name=post.profile_name,
                 username=post.username,
                 creator_avatar_url=f"{BASE_URL}/{post.avatar_url}" if post.avatar_url else None,
-                rank=idx + 1
-            ) for idx, post in enumerate(ranking_posts_daily)],
+                rank=post.rank
+            ) for post in ranking_posts_daily],
         )
 
 
@@ -4,18 +4,74 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.db.base import get_db
-from app.deps.auth import get_current_user
+from app.deps.auth import get_current_user, get_current_user_optional
 from app.models.user import Users
 from app.models.social import Follows, Likes, Comments, Bookmarks
-from app.crud import followes_crud, likes_crud, comments_crud, bookmarks_crud
+from app.crud import followes_crud, likes_crud, comments_crud, bookmarks_crud, purchases_crud, post_stats_crud
+from app.services.cache.top_page import mark_top_page_stale
 from app.schemas.social import (
     CommentCreate, CommentResponse, CommentUpdate,
     FollowResponse, LikeResponse, BookmarkResponse,
-    UserBasicResponse
+    UserBasicResponse, ViewerStateResponse,
+    PostViewerState, CreatorViewerState
 )
 
 router = APIRouter()
 
+# 閲覧者状態の一括取得で指定できるIDの最大件数
+VIEWER_STATE_MAX_IDS = 100
+
+# 閲覧者状態の一括取得
+@router.get("/state", response_model=ViewerStateResponse)
+def get_viewer_state(
+    post_ids: List[UUID] = Query(default=[], description="投稿ID（最大100件）"),
+    creator_ids: List[UUID] = Query(default=[], description="クリエイターのユーザーID（最大100件）"),
+    current_user: Optional[Users] = Depends(get_current_user_optional),
+    db: Session = Depends(get_db)
+):
+    """
+    投稿カード・クリエイター一覧の表示に必要な状態をまとめて取得
+
+    リレーションごとに IN (...) の1クエリで取得する。未ログインの場合は件数のみ返す。
+    """
+    if len(post_ids) > VIEWER_STATE_MAX_IDS or len(creator_ids) > VIEWER_STATE_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"IDは最大{VIEWER_STATE_MAX_IDS}件まで指定できます")
+
+    post_ids = list(dict.fromkeys(post_ids))
+    creator_ids = list(dict.fromkeys(creator_ids))
+
+    stats = post_stats_crud.get_post_stats_by_ids(db, post_ids)
+    followers_counts = followes_crud.get_followers_counts(db, creator_ids)
+
+    liked = bookmarked = purchased = following = set()
+    if current_user:
+        liked = likes_crud.get_liked_post_ids(db, current_user.id, post_ids)
+        bookmarked = bookmarks_crud.get_bookmarked_post_ids(db, current_user.id, post_ids)
+        purchased = purchases_crud.get_purchased_post_ids(db, current_user.id, post_ids)
+        following = followes_crud.get_following_creator_ids(db, current_user.id, creator_ids)
+
+    posts = {}
+    for post_id in post_ids:
+        post_stats = stats.get(post_id)
+        posts[post_id] = PostViewerState(
+            liked=post_id in liked,
+            bookmarked=post_id in bookmarked,
+            purchased=post_id in purchased,
+            likes_count=post_stats.likes_count if post_stats else 0,
+            comments_count=post_stats.comments_count if post_stats else 0,
+            bookmarks_count=post_stats.bookmarks_count if post_stats else 0,
+        )
+
+    creators = {
+        creator_id: CreatorViewerState(
+            following=creator_id in following,
+            followers_count=followers_counts.get(creator_id, 0),
+        )
+        for creator_id in creator_ids
+    }
+
+    return ViewerStateResponse(posts=posts, creators=creators)
+
 # フォロー関連エンドポイント
 @router.post("/follow/{user_id}", response_model=dict)
 def toggle_follow(
@@ -80,7 +136,9 @@ def toggle_like(
     db: Session = Depends(get_db)
 ):
     """いいね/いいね取り消しのトグル"""
-    return likes_crud.toggle_like(db, current_user.id, post_id)
+    result = likes_crud.toggle_like(db, current_user.id, post_id)
+    mark_top_page_stale()
+    return result
 
 @router.get("/like/status/{post_id}", response_model=dict)
 def get_like_status(
@@ -1,6 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.base import get_db
+from fastapi import APIRouter, HTTPException
+from app.db.base import ReadSessionLocal
 from app.schemas.top import (
     GenreResponse, RankingPostResponse, CreatorResponse, 
     RecentPostResponse, TopPageResponse
@@ -9,6 +8,7 @@ from app.crud.top_crud import (
     get_top_genres, get_ranking_posts, get_top_creators,
     get_new_creators, get_recent_posts
 )
+from app.services.cache.top_page import top_page_cache, TOP_PAGE_CACHE_KEY
 from os import getenv
 from app.api.commons.utils import get_video_duration
 
@@ -17,10 +17,26 @@ router = APIRouter()
 BASE_URL = getenv("CDN_BASE_URL")
 
 @router.get("/", response_model=TopPageResponse)
-def get_top_page_data(db: Session = Depends(get_db)) -> TopPageResponse:
+def get_top_page_data() -> TopPageResponse:
     """
     トップページ用データを取得
+
+    全ユーザー共通のため stale-while-revalidate キャッシュから返却する
     """
+    try:
+        return top_page_cache.get(TOP_PAGE_CACHE_KEY, _build_top_page_data)
+    except Exception as e:
+        print("トップページデータ取得エラー: ", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _build_top_page_data() -> TopPageResponse:
+    """
+    トップページ用データを集計する
+
+    リクエスト終了後に裏側で再計算されることがあるため、専用のセッション（読み取りレプリカ）を使う
+    """
+    db = ReadSessionLocal()
     try:
         genres = get_top_genres(db, limit=8)
         ranking_posts = get_ranking_posts(db, limit=5)
@@ -72,6 +88,5 @@ def get_top_page_data(db: Session = Depends(get_db)) -> TopPageResponse:
                 likes_count=p.likes_count or 0
             ) for p in recent_posts]
         )
-    except Exception as e:
-        print("トップページデータ取得エラー: ", e)
-        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        db.close()
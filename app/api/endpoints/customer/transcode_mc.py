@@ -2,32 +2,31 @@ from fastapi import APIRouter, HTTPException, Depends, Path
 from sqlalchemy.orm import Session
 from app.db.base import get_db
 from app.services.s3.media_covert import build_media_rendition_job_settings, build_hls_abr4_settings
-from app.crud.media_assets_crud import get_media_asset_by_post_id
-from app.schemas.post_media import PoseMediaCovertRequest
-from app.services.s3.keygen import (
-    transcode_mc_hls_prefix, 
-    transcode_mc_ffmpeg_key
-)
-from app.services.s3.image_screening import (
-    _s3_download_bytes, 
-    _s3_put_bytes,
-    _is_supported_magic,
-    _sanitize_and_variants,
-    _moderation_check,
-    _make_variant_keys,
-)
-from app.services.s3.client import s3_client_for_mc, ENV, MEDIA_BUCKET_NAME, INGEST_BUCKET
+from app.crud.media_assets_crud import get_media_asset_by_post_id, set_media_asset_hash
+from app.schemas.post_media import PoseMediaCovertRequest, MediaRenditionJobListResponse
+from app.services.s3.keygen import transcode_mc_hls_prefix
+from app.services.s3.client import s3_client_for_mc, ENV, INGEST_BUCKET
+from app.services.s3.content_hash import s3_object_sha256_checksum
 from app.constants.enums import (
     MediaRenditionJobKind, 
     MediaRenditionJobBackend, 
     MediaRenditionJobStatus,
-    MediaRenditionKind,
     PostStatus,
     PostType,
 )
-from app.crud.media_rendition_jobs_crud import create_media_rendition_job, update_media_rendition_job
-from app.crud.media_rendition_crud import create_media_rendition
+from app.crud.media_rendition_jobs_crud import (
+    create_media_rendition_job,
+    update_media_rendition_job,
+    enqueue_image_rendition_jobs,
+    get_media_rendition_jobs_by_post_id,
+)
+from app.crud.media_rendition_crud import (
+    create_media_rendition,
+    get_reusable_video_rendition,
+    rendition_copy_data,
+)
 from app.crud.post_crud import update_post_status
+from app.services.cache.top_page import mark_top_page_stale
 import boto3
 from typing import Dict, Any, Optional
 
@@ -111,66 +110,50 @@ def _create_media_convert_job(
     return media_rendition_job
 
 
-def _process_image_asset(
-    db: Session,
-    asset_row: Any,
-    post_id: str
-) -> Optional[Any]:
+def _reuse_hls_rendition(db: Session, asset_row: Any) -> bool:
     """
-    画像アセットを処理する共通処理
-    
+    同じクリエイターの同じ内容（SHA-256）の動画が HLS 変換済みであれば、そのレンディションを再利用する
+
+    ハッシュはアップロード時に S3 が検証したチェックサム（プレサイン時に sha256 を指定した場合のみ）を使い、
+    リクエスト内で動画本体は読み込まない。チェックサムがない動画は通常どおり変換する。
+
     Args:
         db: データベースセッション
         asset_row: メディアアセット行
-        post_id: 投稿ID
-    
+
     Returns:
-        作成されたメディアレンディション（最後のもの）
+        bool: 再利用した場合 True（MediaConvert ジョブは不要）
     """
-    # 1) 取り込み元の取得
-    src_key = asset_row.storage_key
-    img_bytes = _s3_download_bytes(INGEST_BUCKET, src_key)
-
-    # 2) マジックナンバー/整合性チェック
-    if not _is_supported_magic(img_bytes):
-        raise HTTPException(400, "Unsupported image format")
-
-    # 3) 任意: モデレーション
-    mod = _moderation_check(img_bytes, min_conf=80.0)
-    if mod["flagged"]:
-        # ここでDBをREJECTにする等の処理を行っても良い
-        raise HTTPException(status_code=400, detail=f"Image rejected by moderation: {mod['labels']}")
-
-    # 4) 正規化＋派生生成
-    variants = _sanitize_and_variants(img_bytes)
-
-    # 出力先key
-    base_output_key = transcode_mc_ffmpeg_key(
-        creator_id=asset_row.creator_user_id,
-        post_id=asset_row.post_id,
-        ext="jpg", 
-    )
+    hash_sha256 = asset_row.hash_sha256
+    if hash_sha256 is None:
+        try:
+            hash_sha256 = s3_object_sha256_checksum(INGEST_BUCKET, asset_row.storage_key)
+        except Exception as e:
+            # チェックサムが取れない場合は通常どおり変換する
+            print(f"Error getting media asset checksum: {e}")
+            return False
+        if hash_sha256 is None:
+            return False
+        set_media_asset_hash(db, asset_row.id, hash_sha256)
 
-    # ベースキーから派生ファイルの最終保存キーを決定
-    variant_keys = _make_variant_keys(base_output_key)
-
-    last_rendition = None
-    # 5) アップロード（SSE-KMS, CacheControl 付き）
-    for filename, (bytes_data, ctype) in variants.items():
-        dst_key = variant_keys[filename]
-        _s3_put_bytes(MEDIA_BUCKET_NAME, dst_key, bytes_data, ctype)
-
-        # 6) DB: media_rendition 登録（bytesは保存サイズ）
-        media_rendition_data = {
-            "asset_id": asset_row.id,
-            "kind": MediaRenditionKind.FFMPEG,  # 既存Enum流用。新設するなら IMAGE_PIPELINE に変更
-            "storage_key": dst_key,
-            "mime_type": ctype,
-            "bytes": len(bytes_data),
-        }
-        last_rendition = create_media_rendition(db, media_rendition_data)
-    
-    return last_rendition
+    source_rendition = get_reusable_video_rendition(db, asset_row.id, asset_row.creator_user_id, hash_sha256)
+    if source_rendition is None:
+        return False
+
+    # レンディションを複製し、完了済みのジョブとして記録
+    media_rendition = create_media_rendition(db, rendition_copy_data(source_rendition, asset_row.id))
+    create_media_rendition_job(db, {
+        "asset_id": asset_row.id,
+        "rendition_id": media_rendition.id,
+        "kind": MediaRenditionJobKind.HLS_ABR4,
+        "input_key": asset_row.storage_key,
+        "output_key": source_rendition.storage_key,
+        "backend": MediaRenditionJobBackend.MEDIACONVERT,
+        "status": MediaRenditionJobStatus.COMPLETE,
+        "percent_complete": 100,
+        "extra": {"reused": True},
+    })
+    return True
 
 
 @router.post("/transcode_mc/{post_id}/{post_type}")
@@ -181,6 +164,9 @@ def transcode_mc_unified(
 ):
     """
     投稿メディアコンバート統合処理（HLS ABR4 + FFmpeg）
+
+    画像投稿はアセットごとに画像派生ジョブを登録してすぐに応答する。
+    変換は app.jobs.process_image_jobs が行い、すべて完了した時点で投稿が承認済みになる。
     
     Args:
         post_id: str
@@ -203,11 +189,19 @@ def transcode_mc_unified(
         if not assets:
             raise HTTPException(status_code=404, detail="Media asset not found")
 
-        last_rendition = None
+        # 画像派生ジョブ登録（画像の場合のみ）
+        if type == "image":
+            enqueued = enqueue_image_rendition_jobs(db, post_id)
+            db.commit()
+            return {"status": True, "message": f"Media conversion queued for {type}", "jobs": enqueued}
 
         for row in assets:
             # HLS ABR4処理（ビデオの場合のみ）
             if type == "video":
+                # 同じ内容の動画が変換済みであれば MediaConvert に送信しない
+                if _reuse_hls_rendition(db, row):
+                    continue
+
                 output_prefix = transcode_mc_hls_prefix(
                     creator_id=row.creator_user_id,
                     post_id=row.post_id,
@@ -224,17 +218,10 @@ def transcode_mc_unified(
                     build_settings_func=build_hls_abr4_settings
                 )
 
-            # FFmpeg処理（画像の場合のみ）
-            if type == "image":
-                last_rendition = _process_image_asset(db, row, post_id)
-
         # 投稿ステータスの更新
         post = update_post_status(db, post_id, PostStatus.APPROVED)
         db.commit()
-        
-        if last_rendition:
-            db.refresh(last_rendition)
-            db.refresh(post)
+        mark_top_page_stale()
 
         return {"status": True, "message": f"Media conversion completed for {type}"}
 
@@ -244,4 +231,27 @@ def transcode_mc_unified(
     except Exception as e:
         db.rollback()
         print(f"メディアコンバート処理にてエラーが発生しました。: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/transcode_mc/{post_id}/jobs", response_model=MediaRenditionJobListResponse)
+def get_transcode_jobs(
+    post_id: str = Path(..., description="Post ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    投稿のメディアレンディションジョブの状態を取得する
+
+    Args:
+        post_id: str
+        db: Session
+
+    Returns:
+        MediaRenditionJobListResponse: ジョブ一覧
+    """
+    try:
+        jobs = get_media_rendition_jobs_by_post_id(db, post_id)
+        return MediaRenditionJobListResponse(post_id=post_id, jobs=jobs)
+    except Exception as e:
+        print(f"メディアレンディションジョブ取得エラーが発生しました: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from app.schemas.user import UserCreate, UserOut, UserProfileResponse
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
 from sqlalchemy.orm import Session
 from app.crud.user_crud import (
     create_user,
@@ -77,7 +77,7 @@ def register_user(
 @router.get("/profile", response_model=UserProfileResponse)
 def get_user_profile_by_username_endpoint(
     username: str = Query(..., description="ユーザー名"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     ユーザー名によるユーザープロフィール取得
@@ -0,0 +1,28 @@
+# app/api/endpoints/debug/debug_db.py
+from fastapi import APIRouter
+from app.core.config import settings
+from app.db.base import engine, async_engine, read_engine, async_read_engine
+from app.db.pool_stats import pool_status
+router = APIRouter()
+
+@router.get("/db-pool")
+def db_pool_status():
+    """
+    コネクションプールの状態（ワーカープロセス単位）
+    """
+    status = {
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout_sec": settings.DB_POOL_TIMEOUT_SEC,
+            "pool_recycle_sec": settings.DB_POOL_RECYCLE_SEC,
+            "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool),
+    }
+    if settings.HAS_READ_REPLICA:
+        status["read_sync"] = pool_status(read_engine.pool)
+        status["read_async"] = pool_status(async_read_engine.pool)
+    return status
@@ -14,6 +14,7 @@ from app.crud.post_crud import update_post_status
 from app.constants.enums import MediaRenditionJobStatus, MediaRenditionKind, PostStatus
 from app.db.base import get_db
 from app.services.s3.client import MEDIA_BUCKET_NAME, AWS_REGION
+from app.services.cache.top_page import mark_top_page_stale
 
 # Constants
 HLS_VARIANT_SUFFIXES = (
@@ -61,6 +62,7 @@ async def mediaconvert_webhook(
             raise HTTPException(400, f"Unsupported job type: {webhook_data['type']}")
             
         db.commit()
+        mark_top_page_stale()
         return {"ok": True}
         
     except HTTPException:
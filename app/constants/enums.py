@@ -97,11 +97,13 @@ class RenditionJobStatus:
 class MediaRenditionJobKind:
     PREVIEW_MP4 = 1 # プレビュービデオ
     HLS_ABR4 = 2 # HLS_ABR4
+    IMAGE_VARIANTS = 3 # 画像派生（original / 1080w / thumb）
 
 # メディアレンディションのバックエンド
 class MediaRenditionJobBackend:
     MEDIACONVERT = 1 # MediaConvert
     FARGATE_FFMPEG = 2 # Fargate FFmpeg
+    IMAGE_WORKER = 3 # 画像処理ワーカー（app.jobs.process_image_jobs）
 
 # メディアレンディションのステータス
 class MediaRenditionJobStatus:
@@ -125,4 +127,24 @@ class ConversationType:
     SUPPORT = 1 # サポート会話
     DM = 2 # DM
     GROUP = 3 # グループ
-    DELUSION = 4 # 妄想の間
\ No newline at end of file
+    DELUSION = 4 # 妄想の間
+
+# ランキングの集計期間
+class RankingPeriod:
+    DAILY = 1 # 日間
+    WEEKLY = 2 # 週間
+    MONTHLY = 3 # 月間
+    ALL_TIME = 4 # 全期間
+
+# 注文のステータス
+class OrderStatus:
+    PENDING = 1 # 決済待ち
+    COMPLETED = 2 # 決済完了
+    CANCELED = 3 # キャンセル
+    REFUNDED = 4 # 返金
+
+# 支払いのステータス
+class PayoutStatus:
+    PENDING = 1 # 支払い待ち
+    PAID = 2 # 支払い済み
+    FAILED = 3 # 失敗
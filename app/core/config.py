@@ -14,9 +14,30 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_SERVER: str
     POSTGRES_PORT: int
+    # 読み取り専用レプリカ（未設定の場合はプライマリを使う）
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    # 書き込み後、この秒数はプライマリから読む（read-your-writes）
+    RECENT_WRITE_PIN_SEC: int = 5
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
 
+    # コネクションプール設定（ワーカーごとの値。最大接続数は (pool_size + max_overflow) × ワーカー数）
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SEC: int = 30
+    DB_POOL_RECYCLE_SEC: int = 1800
+    # SQLAlchemy のコンパイル済みSQLキャッシュ件数
+    DB_QUERY_CACHE_SIZE: int = 500
+    # asyncpg のプリペアドステートメントキャッシュ件数（0で無効、PgBouncer の transaction モード利用時など）
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # /account/info でセクションを並行に取得する数（1リクエストが同時に使う非同期接続の上限。認証の接続を含む）
+    ACCOUNT_INFO_CONCURRENCY: int = 3
+
+    # SQL計測（同一形のSQLが1リクエストでこの回数を超えたら N+1 の疑いとしてログに出す）
+    SQL_TIMING_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
     # トークン設定
     ACCESS_TOKEN_EXPIRE_MIN: int = 43200
     REFRESH_TOKEN_EXPIRE_DAYS: int = 14
@@ -42,6 +63,15 @@ class Settings(BaseSettings):
     AWS_REGION: str = "ap-northeast-1"
     SES_CONFIGURATION_SET: str | None = "stg-outbound"
 
+    # キャッシュ設定（秒）
+    TOP_PAGE_CACHE_TTL_SEC: int = 60
+    TOP_PAGE_CACHE_STALE_SEC: int = 600
+    POST_DETAIL_CACHE_TTL_SEC: int = 60
+    POST_DETAIL_CACHE_MAX_ENTRIES: int = 5000
+
+    # 画像の派生生成（original.jpg の長辺の上限px。未設定の場合は元の解像度のまま保存する）
+    IMAGE_ORIGINAL_MAX_SIZE: int | None = None
+
     model_config = SettingsConfigDict(
         env_file=[".env.development", ".env", ".env.local"],
         case_sensitive=False,
@@ -55,4 +85,33 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+
+    @property
+    def HAS_READ_REPLICA(self) -> bool:
+        return bool(self.POSTGRES_REPLICA_SERVER)
+
+    @property
+    def READ_DATABASE_URL(self) -> str:
+        if not self.HAS_READ_REPLICA:
+            return self.DATABASE_URL
+        return (
+            f"postgresql+psycopg2://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_REPLICA_SERVER}:{self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+
+    @property
+    def ASYNC_READ_DATABASE_URL(self) -> str:
+        if not self.HAS_READ_REPLICA:
+            return self.ASYNC_DATABASE_URL
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_REPLICA_SERVER}:{self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+
 settings = Settings()
@@ -5,6 +5,8 @@ from app.core.config import settings
 ACCESS_COOKIE = "access_token"
 REFRESH_COOKIE = "refresh_token"
 CSRF_COOKIE = "csrf_token"
+RECENT_WRITE_COOKIE = "recent_write"
+RECENT_WRITE_HEADER = "X-Read-Primary"
 
 def set_auth_cookies(response: Response, access_token: str, refresh_token: str, csrf_token: str):
     common = {
@@ -40,3 +42,15 @@ def clear_auth_cookies(response: Response):
         response.delete_cookie(
             name, domain=settings.COOKIE_DOMAIN, path=settings.COOKIE_PATH
         )
+
+def set_recent_write_cookie(response: Response):
+    """書き込み直後の読み取りをプライマリへ固定するための短命Cookie"""
+    response.set_cookie(
+        RECENT_WRITE_COOKIE, "1",
+        max_age=settings.RECENT_WRITE_PIN_SEC,
+        domain=settings.COOKIE_DOMAIN,
+        secure=settings.COOKIE_SECURE,
+        httponly=True,
+        samesite=settings.COOKIE_SAMESITE,
+        path=settings.COOKIE_PATH,
+    )
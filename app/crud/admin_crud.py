@@ -1,7 +1,7 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, asc
-from datetime import datetime
+from sqlalchemy import func, desc, asc, select, union_all, literal
+from datetime import datetime, date, timedelta
 from uuid import UUID
 
 from app.models.user import Users
@@ -9,14 +9,36 @@ from app.models.creators import Creators
 from app.models.identity import IdentityVerifications
 from app.models.posts import Posts
 from app.models.profiles import Profiles
-from app.models.orders import Orders
+from app.models.orders import Orders, OrderItems
+from app.models.purchases import Purchases
+from app.models.plans import Plans
+from app.crud.price_crud import plan_price_subquery
+from app.constants.enums import OrderStatus
 from app.models.subscriptions import Subscriptions
 from app.models.media_assets import MediaAssets
 from app.models.media_rendition_jobs import MediaRenditionJobs
+from app.services.cache.post_detail import invalidate_post_detail_on_commit
 import os
 
 CDN_URL = os.getenv("CDN_BASE_URL")
 
+# プラットフォーム手数料率（クリエイターの出金可能額は売上の90%）
+PLATFORM_FEE_RATE = 0.1
+
+# 売上集計の期間ごとの date_trunc 単位と表示形式
+SALES_PERIOD_UNITS = {
+    "daily": "day",
+    "weekly": "week",
+    "monthly": "month",
+    "yearly": "year",
+}
+SALES_PERIOD_FORMATS = {
+    "daily": "YYYY-MM-DD",
+    "weekly": 'IYYY-"W"IW',
+    "monthly": "YYYY-MM",
+    "yearly": "YYYY",
+}
+
 
 
 """管理機能用のCRUD操作クラス"""
@@ -57,8 +79,9 @@ def get_dashboard_info(db: Session) -> Dict[str, Any]:
             .count()
         )
         
-        # 月間売上（仮の値 - 実際のOrdersテーブルから計算する場合）
-        monthly_revenue = 100000
+        # 月間売上（当月1日から今日まで）
+        today = date.today()
+        monthly_revenue = get_platform_revenue(db, today.replace(day=1), today)
         
         # アクティブな購読数
         active_subscriptions = (
@@ -424,6 +447,7 @@ def update_post_status(db: Session, post_id: str, status: str) -> bool:
         status_map = {"published": 2, "archived": 3, "draft": 1}
         post.status = status_map.get(status, 2)
         post.updated_at = datetime.utcnow()
+        invalidate_post_detail_on_commit(db, post.id)
         
         db.commit()
         return True
@@ -531,3 +555,143 @@ def get_post_by_id(db: Session, post_id: str) -> Dict[str, Any]:
             for ma in media_assets if ma['storage_key']
         }  # メディアアセットIDをキー、kindとstorage_keyを含む辞書を値とする辞書
     }
+
+
+# ========== 売上集計 ==========
+
+def _sales_lines(start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """
+    売上明細（計上日時・種別・取引ID・クリエイターID・金額）のサブクエリを作成
+
+    購入履歴（プランの最初に登録された価格）と決済完了した注文の明細を1つの明細として扱う。
+    """
+    plan_prices = plan_price_subquery()
+    purchase_lines = (
+        select(
+            Purchases.created_at.label("created_at"),
+            literal("purchase").label("source"),
+            Purchases.id.label("transaction_id"),
+            Plans.creator_user_id.label("creator_user_id"),
+            plan_prices.c.price.label("amount"),
+        )
+        .join(plan_prices, plan_prices.c.plan_id == Purchases.plan_id)
+        .join(Plans, Plans.id == Purchases.plan_id)
+        .where(Purchases.deleted_at.is_(None))
+    )
+    order_lines = (
+        select(
+            Orders.created_at.label("created_at"),
+            literal("order").label("source"),
+            OrderItems.id.label("transaction_id"),
+            OrderItems.creator_user_id.label("creator_user_id"),
+            OrderItems.amount.label("amount"),
+        )
+        .join(Orders, OrderItems.order_id == Orders.id)
+        .where(Orders.status == OrderStatus.COMPLETED)
+    )
+
+    # 終了日は当日分を含める
+    if start_date is not None:
+        purchase_lines = purchase_lines.where(Purchases.created_at >= start_date)
+        order_lines = order_lines.where(Orders.created_at >= start_date)
+    if end_date is not None:
+        purchase_lines = purchase_lines.where(Purchases.created_at < end_date + timedelta(days=1))
+        order_lines = order_lines.where(Orders.created_at < end_date + timedelta(days=1))
+
+    return union_all(purchase_lines, order_lines).subquery()
+
+def _platform_sales_query(period: str, start_date: Optional[date], end_date: Optional[date]):
+    """
+    期間（日・週・月・年）ごとのプラットフォーム売上を集計するクエリ
+    """
+    lines = _sales_lines(start_date, end_date)
+    bucket = func.date_trunc(SALES_PERIOD_UNITS[period], lines.c.created_at)
+    total_revenue = func.coalesce(func.sum(lines.c.amount), 0)
+    platform_revenue = func.floor(total_revenue * PLATFORM_FEE_RATE)
+
+    return (
+        select(
+            func.to_char(bucket, SALES_PERIOD_FORMATS[period]).label("period"),
+            total_revenue.label("total_revenue"),
+            platform_revenue.label("platform_revenue"),
+            (total_revenue - platform_revenue).label("creator_revenue"),
+            func.count().label("transaction_count"),
+        )
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+
+def _to_sales_data(row) -> Dict[str, Any]:
+    return {
+        "period": row.period,
+        "total_revenue": int(row.total_revenue),
+        "platform_revenue": int(row.platform_revenue),
+        "creator_revenue": int(row.creator_revenue),
+        "transaction_count": row.transaction_count,
+    }
+
+def get_platform_sales(
+    db: Session,
+    period: str = "monthly",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    プラットフォーム全体の売上を期間ごとに集計
+
+    Args:
+        db: データベースセッション
+        period: 集計単位（"daily", "weekly", "monthly", "yearly"）
+        start_date: 開始日（省略時は全期間）
+        end_date: 終了日（当日を含む、省略時は全期間）
+
+    Returns:
+        List[Dict[str, Any]]: 期間ごとの売上（古い順）
+    """
+    rows = db.execute(_platform_sales_query(period, start_date, end_date)).all()
+    return [_to_sales_data(row) for row in rows]
+
+def iter_platform_sales_transactions(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    batch_size: int = 1000
+) -> Iterator[Dict[str, Any]]:
+    """
+    期間内の売上明細を1取引ずつ取得（サーバーサイドカーソルで逐次取得、計上日時の古い順）
+
+    レポート出力用。1年分の取引でも全件メモリに載せずに batch_size 件ずつ取得する。
+    """
+    lines = _sales_lines(start_date, end_date)
+    platform_fee = func.floor(lines.c.amount * PLATFORM_FEE_RATE)
+    stmt = (
+        select(
+            lines.c.created_at,
+            lines.c.source,
+            lines.c.transaction_id,
+            lines.c.creator_user_id,
+            lines.c.amount,
+            platform_fee.label("platform_revenue"),
+            (lines.c.amount - platform_fee).label("creator_revenue"),
+        )
+        .order_by(lines.c.created_at, lines.c.transaction_id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in db.execute(stmt):
+        yield {
+            "created_at": row.created_at,
+            "source": row.source,
+            "transaction_id": str(row.transaction_id),
+            "creator_user_id": str(row.creator_user_id),
+            "amount": int(row.amount),
+            "platform_revenue": int(row.platform_revenue),
+            "creator_revenue": int(row.creator_revenue),
+        }
+
+def get_platform_revenue(db: Session, start_date: date, end_date: date) -> int:
+    """
+    期間内のプラットフォーム全体の総売上を取得（終了日は当日を含む）
+    """
+    lines = _sales_lines(start_date, end_date)
+    total = db.execute(select(func.coalesce(func.sum(lines.c.amount), 0))).scalar_one()
+    return int(total)
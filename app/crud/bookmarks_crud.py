@@ -2,8 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from app.models.social import Bookmarks
 from app.models.posts import Posts
+from app.crud import post_stats_crud
 from uuid import UUID
-from typing import List
+from typing import List, Set
 
 def create_bookmark(db: Session, user_id: UUID, post_id: UUID) -> Bookmarks:
     """
@@ -14,6 +15,8 @@ def create_bookmark(db: Session, user_id: UUID, post_id: UUID) -> Bookmarks:
         post_id=post_id
     )
     db.add(bookmark)
+    db.flush()
+    post_stats_crud.update_post_stats(db, post_id, bookmarks=1)
     db.commit()
     db.refresh(bookmark)
     return bookmark
@@ -35,6 +38,8 @@ def delete_bookmark(db: Session, user_id: UUID, post_id: UUID) -> bool:
     
     if bookmark:
         db.delete(bookmark)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, bookmarks=-1)
         db.commit()
         return True
     
@@ -56,6 +61,20 @@ def is_bookmarked(db: Session, user_id: UUID, post_id: UUID) -> bool:
     )
     return bookmark is not None
 
+def get_bookmarked_post_ids(db: Session, user_id: UUID, post_ids: List[UUID]) -> Set[UUID]:
+    """
+    指定した投稿のうち、ユーザーがブックマークしている投稿IDを取得（1クエリ）
+    """
+    if not post_ids:
+        return set()
+    rows = (
+        db.query(Bookmarks.post_id)
+        .filter(Bookmarks.user_id == user_id)
+        .filter(Bookmarks.post_id.in_(post_ids))
+        .all()
+    )
+    return {post_id for (post_id,) in rows}
+
 def get_bookmarks_by_user_id(
     db: Session, 
     user_id: UUID, 
@@ -103,11 +122,15 @@ def toggle_bookmark(db: Session, user_id: UUID, post_id: UUID) -> dict:
     if existing_bookmark:
         # ブックマーク削除
         db.delete(existing_bookmark)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, bookmarks=-1)
         db.commit()
         return {"bookmarked": False, "message": "ブックマークを削除しました"}
     else:
         # ブックマーク追加
         bookmark = Bookmarks(user_id=user_id, post_id=post_id)
         db.add(bookmark)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, bookmarks=1)
         db.commit()
         return {"bookmarked": True, "message": "ブックマークに追加しました"}
\ No newline at end of file
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
 from app.models.social import Comments
 from app.models.user import Users
+from app.crud import post_stats_crud
 from uuid import UUID
 from typing import Optional, List
 from datetime import datetime
@@ -24,6 +25,8 @@ def create_comment(
         status=1
     )
     db.add(comment)
+    db.flush()
+    post_stats_crud.update_post_stats(db, post_id, comments=1)
     db.commit()
     db.refresh(comment)
     return comment
@@ -141,6 +144,7 @@ def delete_comment(
     
     if comment:
         comment.deleted_at = datetime.now()
+        post_stats_crud.update_post_stats(db, comment.post_id, comments=-1)
         db.commit()
         return True
     
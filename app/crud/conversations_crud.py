@@ -252,23 +252,25 @@ def get_all_delusion_conversations_for_admin(
             desc(Conversations.last_message_at))
         .offset(skip).limit(limit).all())
 
+    # 最後のメッセージを会話ごとに1件ずつ、まとめて取得
+    conversation_ids = [conv.id for conv in conversations if conv.last_message_at]
+    last_messages = {}
+    if conversation_ids:
+        last_messages = dict(
+            db.query(
+                ConversationMessages.conversation_id,
+                ConversationMessages.body_text)
+            .filter(
+                ConversationMessages.conversation_id.in_(conversation_ids))
+            .distinct(ConversationMessages.conversation_id)
+            .order_by(
+                ConversationMessages.conversation_id,
+                desc(ConversationMessages.created_at))
+            .all())
+
     result = []
     for conv in conversations:
-        # 最後のメッセージを取得
-        last_message = None
-        if conv.last_message_at:
-            last_message_obj = (
-                db.query(
-                    ConversationMessages)
-                .join(
-                    Conversations)
-                .filter(
-                    Conversations.id == conv.id)
-                .order_by(desc(ConversationMessages.created_at))
-                .first())
-
-            if last_message_obj:
-                last_message = last_message_obj.body_text
+        last_message = last_messages.get(conv.id)
 
         result.append({
             "id": conv.id,
@@ -0,0 +1,131 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update, case
+from sqlalchemy.dialects.postgresql import insert
+from app.models.payouts import CreatorBalances
+from app.models.creator_sales_ledger import CreatorSalesLedger
+from app.models.purchases import Purchases
+from uuid import UUID
+from datetime import datetime
+from typing import List, Optional
+
+def get_balance(db: Session, creator_id: UUID) -> Optional[CreatorBalances]:
+    """
+    クリエイターの残高を取得（主キー検索）
+    """
+    return db.get(CreatorBalances, creator_id)
+
+def add_pending(db: Session, creator_id: UUID, amount: int) -> None:
+    """
+    未確定残高へ売上を差分で加算（呼び出し元と同じトランザクションで実行される）
+
+    INSERT ... ON CONFLICT DO UPDATE SET pending = pending + :amount で加算するため、
+    同一クリエイターへの同時購入でも読み取り→書き込みの競合が起きない。
+    返金は add_refund を使う。
+    """
+    if not amount:
+        return
+
+    stmt = insert(CreatorBalances).values(
+        creator_user_id=creator_id,
+        pending=amount,
+        available=0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CreatorBalances.creator_user_id],
+        set_={"pending": CreatorBalances.pending + stmt.excluded.pending},
+    )
+    db.execute(stmt)
+
+def add_refund(db: Session, creator_id: UUID, amount: int, sold_at: datetime) -> None:
+    """
+    返金（負数）を残高へ反映（呼び出し元と同じトランザクションで実行される）
+
+    返金した売上が確定済み（計上日時が settled_until 以前）であれば available からすぐに差し引き、
+    未確定であれば pending で売上と相殺する（確定処理は返金行も売上の計上日時で扱うため、売上と同時に確定して0になる）。
+    どちらかの判定は残高行の settled_until を読む1つの UPSERT で行うため、確定処理と同時に実行されても食い違わない。
+    """
+    if not amount:
+        return
+
+    stmt = insert(CreatorBalances).values(
+        creator_user_id=creator_id,
+        pending=amount,
+        available=0,
+    )
+    already_settled = func.coalesce(CreatorBalances.settled_until >= sold_at, False)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CreatorBalances.creator_user_id],
+        set_={
+            "pending": CreatorBalances.pending + case((already_settled, 0), else_=stmt.excluded.pending),
+            "available": CreatorBalances.available + case((already_settled, stmt.excluded.pending), else_=0),
+        },
+    )
+    db.execute(stmt)
+
+def ledger_sold_at():
+    """
+    台帳行の売上の計上日時（確定・支払いの判定に使う）
+
+    返金行は返金日時ではなく返金した購入の日時で扱い、売上と同じ確定処理で相殺する。
+    Purchases を外部結合したクエリで使う。
+    """
+    return func.coalesce(Purchases.created_at, CreatorSalesLedger.created_at)
+
+def settle_pending_balances(
+    db: Session,
+    cutoff: datetime,
+    after_creator_id: Optional[UUID] = None,
+    batch_size: int = 1000
+) -> List[UUID]:
+    """
+    cutoff 以前の未確定売上を pending から available へ移す（クリエイターID順に batch_size 件ずつ）
+
+    前回確定した日時（settled_until）から cutoff までに計上された売上（返金は元の売上の計上日時で扱う）を
+    台帳から集計し、1回の UPDATE で反映する。残高行は先にロックし、集計中に返金が反映されないようにする。
+
+    Args:
+        db: データベースセッション
+        cutoff: この日時までの売上を確定する
+        after_creator_id: 前バッチ最後のクリエイターID
+        batch_size: 1バッチのクリエイター数
+
+    Returns:
+        List[UUID]: 処理したクリエイターID（空の場合は全件処理済み）
+    """
+    batch = (
+        select(CreatorBalances.creator_user_id)
+        .order_by(CreatorBalances.creator_user_id)
+        .limit(batch_size)
+        .with_for_update()
+    )
+    if after_creator_id is not None:
+        batch = batch.where(CreatorBalances.creator_user_id > after_creator_id)
+    creator_ids = list(db.execute(batch).scalars())
+    if not creator_ids:
+        return []
+
+    settled_until = func.coalesce(CreatorBalances.settled_until, datetime.min)
+    sold_at = ledger_sold_at()
+    settled_amount = (
+        select(func.coalesce(func.sum(CreatorSalesLedger.amount), 0))
+        .select_from(CreatorSalesLedger)
+        .outerjoin(Purchases, Purchases.id == CreatorSalesLedger.purchase_id)
+        .where(CreatorSalesLedger.creator_user_id == CreatorBalances.creator_user_id)
+        # 返金行の作成日時は売上の計上日時以降のため、インデックスで settled_until 以降の行に絞ってから判定する
+        .where(CreatorSalesLedger.created_at > settled_until)
+        .where(sold_at > settled_until)
+        .where(sold_at <= cutoff)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(CreatorBalances)
+        .where(CreatorBalances.creator_user_id.in_(creator_ids))
+        .where(func.coalesce(CreatorBalances.settled_until, datetime.min) < cutoff)
+        .values(
+            pending=CreatorBalances.pending - settled_amount,
+            available=CreatorBalances.available + settled_amount,
+            settled_until=cutoff,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    return creator_ids
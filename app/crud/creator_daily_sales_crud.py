@@ -0,0 +1,121 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, delete
+from sqlalchemy.dialects.postgresql import insert
+from app.models.creator_daily_sales import CreatorDailySales
+from app.models.purchases import Purchases
+from app.models.plans import Plans
+from app.crud.price_crud import plan_price_subquery
+from app.constants.enums import PlanStatus
+from uuid import UUID
+from datetime import date
+from typing import Dict
+
+def record_purchase_sale(db: Session, plan_id: UUID, delta: int = 1, day: date | None = None) -> None:
+    """
+    購入1件分の売上を日別売上へ反映（呼び出し元と同じトランザクションで実行される）
+
+    売上額はプランの価格（最初に登録されたもの）、計上先はプランのクリエイター。
+    計上日は購入日（rebuild_creator_daily_sales と同じ created_at の日付）で、省略時はDBの当日。
+    返金（delta=-1）は購入日の行から差し引く。行がない場合は負の値で作成し、差し引きを失わない。
+    """
+    plan_prices = plan_price_subquery()
+    plan = (
+        db.query(Plans.creator_user_id, Plans.type, plan_prices.c.price)
+        .join(plan_prices, Plans.id == plan_prices.c.plan_id)
+        .filter(Plans.id == plan_id)
+        .first()
+    )
+    if not plan:
+        return
+
+    amount = (plan.price or 0) * delta
+    single_amount = amount if plan.type == PlanStatus.SINGLE else 0
+    plan_amount = amount if plan.type == PlanStatus.PLAN else 0
+
+    stmt = insert(CreatorDailySales).values(
+        creator_user_id=plan.creator_user_id,
+        day=day if day is not None else func.current_date(),
+        single_item_sales=single_amount,
+        plan_sales=plan_amount,
+        purchases_count=delta,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CreatorDailySales.creator_user_id, CreatorDailySales.day],
+        set_={
+            "single_item_sales": CreatorDailySales.single_item_sales + single_amount,
+            "plan_sales": CreatorDailySales.plan_sales + plan_amount,
+            "purchases_count": CreatorDailySales.purchases_count + delta,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+def rebuild_creator_daily_sales(db: Session, since: date | None = None) -> int:
+    """
+    購入履歴から日別売上を再構築する
+
+    Args:
+        db (Session): データベースセッション
+        since (date | None): この日以降のみ再構築（Noneの場合は全期間）
+
+    Returns:
+        int: 作成した行数
+    """
+    plan_prices = plan_price_subquery()
+    purchase_day = func.date(Purchases.created_at)
+
+    source = (
+        select(
+            Plans.creator_user_id,
+            purchase_day,
+            func.coalesce(func.sum(plan_prices.c.price).filter(Plans.type == PlanStatus.SINGLE), 0),
+            func.coalesce(func.sum(plan_prices.c.price).filter(Plans.type == PlanStatus.PLAN), 0),
+            func.count(),
+        )
+        .select_from(Purchases)
+        .join(Plans, Purchases.plan_id == Plans.id)
+        .join(plan_prices, plan_prices.c.plan_id == Plans.id)
+        .where(Purchases.deleted_at.is_(None))
+        .where(Plans.deleted_at.is_(None))
+    )
+    delete_stmt = delete(CreatorDailySales)
+    if since is not None:
+        source = source.where(Purchases.created_at >= since)
+        delete_stmt = delete_stmt.where(CreatorDailySales.day >= since)
+    source = source.group_by(Plans.creator_user_id, purchase_day)
+
+    db.execute(delete_stmt)
+    result = db.execute(
+        insert(CreatorDailySales).from_select(
+            ["creator_user_id", "day", "single_item_sales", "plan_sales", "purchases_count"],
+            source,
+        )
+    )
+    return result.rowcount or 0
+
+def get_sales_summary(db: Session, creator_id: UUID, start_date: date, end_date: date) -> Dict[str, int]:
+    """
+    日別売上から総売上と期間内の売上を1クエリで集計
+
+    Returns:
+        Dict[str, int]: total_sales, period_sales, single_item_sales, plan_sales
+    """
+    in_period = CreatorDailySales.day.between(start_date, end_date)
+    day_total = CreatorDailySales.single_item_sales + CreatorDailySales.plan_sales
+
+    row = (
+        db.query(
+            func.coalesce(func.sum(day_total), 0).label('total_sales'),
+            func.coalesce(func.sum(day_total).filter(in_period), 0).label('period_sales'),
+            func.coalesce(func.sum(CreatorDailySales.single_item_sales).filter(in_period), 0).label('single_item_sales'),
+            func.coalesce(func.sum(CreatorDailySales.plan_sales).filter(in_period), 0).label('plan_sales'),
+        )
+        .filter(CreatorDailySales.creator_user_id == creator_id)
+        .one()
+    )
+    return {
+        "total_sales": int(row.total_sales),
+        "period_sales": int(row.period_sales),
+        "single_item_sales": int(row.single_item_sales),
+        "plan_sales": int(row.plan_sales),
+    }
@@ -0,0 +1,158 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, literal
+from sqlalchemy.dialects.postgresql import insert
+from app.models.creator_sales_ledger import CreatorSalesLedger
+from app.models.purchases import Purchases
+from app.models.orders import Orders, OrderItems
+from app.constants.enums import PlanStatus
+from app.models.plans import Plans
+from app.crud.price_crud import plan_price_subquery
+from app.models.posts import Posts
+from app.models.user import Users
+from app.models.profiles import Profiles
+from uuid import UUID
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+def _ledger_source(sign: int = 1):
+    """
+    購入履歴から台帳行を作成する SELECT
+
+    売上額はプランの価格（最初に登録されたもの）、計上先はプランのクリエイター、
+    タイトルはプラン名 → 購入した投稿の説明（先頭50文字） → "無題" の順に採用する。
+    返金（sign=-1）の場合は金額を負数にし、計上日時をDBの現在時刻にする。
+    """
+    plan_prices = plan_price_subquery()
+    title = func.coalesce(
+        func.nullif(Plans.name, ""),
+        func.nullif(func.left(Posts.description, 50), ""),
+        literal("無題"),
+    )
+
+    return (
+        select(
+            Plans.creator_user_id,
+            Purchases.id,
+            Purchases.user_id,
+            Plans.type,
+            title,
+            func.coalesce(plan_prices.c.price, 0) * sign,
+            Purchases.created_at if sign > 0 else func.now(),
+        )
+        .select_from(Purchases)
+        .join(Plans, Purchases.plan_id == Plans.id)
+        .outerjoin(plan_prices, plan_prices.c.plan_id == Plans.id)
+        .outerjoin(Posts, Purchases.post_id == Posts.id)
+    )
+
+_LEDGER_COLUMNS = ["creator_user_id", "purchase_id", "buyer_user_id", "type", "title", "amount", "created_at"]
+
+def _append_entry(db: Session, purchase_id: UUID, sign: int) -> Optional[Tuple[UUID, int]]:
+    source = _ledger_source(sign).where(Purchases.id == purchase_id)
+    stmt = (
+        insert(CreatorSalesLedger)
+        .from_select(_LEDGER_COLUMNS, source)
+        .returning(CreatorSalesLedger.creator_user_id, CreatorSalesLedger.amount)
+    )
+    row = db.execute(stmt).first()
+    return (row.creator_user_id, row.amount) if row else None
+
+def record_purchase_entry(db: Session, purchase_id: UUID) -> Optional[Tuple[UUID, int]]:
+    """
+    購入1件分の売上を台帳へ追記（呼び出し元と同じトランザクションで実行される）
+
+    Returns:
+        Optional[Tuple[UUID, int]]: 計上先のクリエイターIDと金額
+    """
+    return _append_entry(db, purchase_id, 1)
+
+def record_refund_entry(db: Session, purchase_id: UUID) -> Optional[Tuple[UUID, int]]:
+    """
+    購入1件分の返金を負の金額で台帳へ追記（呼び出し元と同じトランザクションで実行される）
+
+    Returns:
+        Optional[Tuple[UUID, int]]: 計上先のクリエイターIDと金額（負数）
+    """
+    return _append_entry(db, purchase_id, -1)
+
+def record_order_entries(db: Session, order_id: UUID) -> List[Tuple[UUID, int]]:
+    """
+    決済完了した注文の明細ごとの売上を台帳へ追記（呼び出し元と同じトランザクションで実行される）
+
+    計上日時は決済完了時（DBの現在時刻）にする（注文日時にすると確定済みの期間に入り、残高が確定されないため）。
+    種別はプランの種類（プランのない明細は単品）、タイトルは購入と同じくプラン名 → 投稿の説明 → "無題" の順に採用する。
+
+    Returns:
+        List[Tuple[UUID, int]]: クリエイターIDごとの計上額
+    """
+    title = func.coalesce(
+        func.nullif(Plans.name, ""),
+        func.nullif(func.left(Posts.description, 50), ""),
+        literal("無題"),
+    )
+    source = (
+        select(
+            OrderItems.creator_user_id,
+            OrderItems.id,
+            Orders.user_id,
+            func.coalesce(Plans.type, PlanStatus.SINGLE),
+            title,
+            OrderItems.amount,
+            func.now(),
+        )
+        .select_from(OrderItems)
+        .join(Orders, OrderItems.order_id == Orders.id)
+        .outerjoin(Plans, OrderItems.plan_id == Plans.id)
+        .outerjoin(Posts, OrderItems.post_id == Posts.id)
+        .where(OrderItems.order_id == order_id)
+    )
+    rows = db.execute(
+        insert(CreatorSalesLedger)
+        .from_select(
+            ["creator_user_id", "order_item_id", "buyer_user_id", "type", "title", "amount", "created_at"],
+            source,
+        )
+        .returning(CreatorSalesLedger.creator_user_id, CreatorSalesLedger.amount)
+    ).all()
+
+    totals: Dict[UUID, int] = {}
+    for row in rows:
+        totals[row.creator_user_id] = totals.get(row.creator_user_id, 0) + row.amount
+    return list(totals.items())
+
+def get_ledger_entries_by_creator_id(
+    db: Session,
+    creator_id: UUID,
+    limit: int = 50,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
+    """
+    クリエイターの売上台帳を新しい順に取得
+
+    Args:
+        db: データベースセッション
+        creator_id: クリエイターのユーザーID
+        limit: 取得件数
+        cursor: 前ページ最後の (created_at, id)
+
+    Returns:
+        List[tuple]: 台帳行と購入者の表示名
+    """
+    query = (
+        db.query(
+            CreatorSalesLedger,
+            Users.profile_name.label('buyer_name'),
+            Profiles.username.label('buyer_username')
+        )
+        .outerjoin(Users, CreatorSalesLedger.buyer_user_id == Users.id)
+        .outerjoin(Profiles, Users.id == Profiles.user_id)
+        .filter(CreatorSalesLedger.creator_user_id == creator_id)
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(CreatorSalesLedger.created_at, CreatorSalesLedger.id) < tuple_(*cursor))
+    return (
+        query
+        .order_by(CreatorSalesLedger.created_at.desc(), CreatorSalesLedger.id.desc())
+        .limit(limit)
+        .all()
+    )
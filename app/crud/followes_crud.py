@@ -1,19 +1,23 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, or_
 from app.models.social import Follows
 from app.models.user import Users
 from uuid import UUID
-from typing import List
+from typing import List, Set, Dict
 
 def get_follower_count(db: Session, user_id: UUID) -> dict:
     """
-    フォロワー数を取得
+    フォロワー数・フォロー数を取得（1クエリ）
     """
-    followers_count = db.query(Follows).filter(Follows.creator_user_id == user_id).count()
-    following_count = db.query(Follows).filter(Follows.follower_user_id == user_id).count()
+    counts = db.query(
+        func.count().filter(Follows.creator_user_id == user_id).label("followers_count"),
+        func.count().filter(Follows.follower_user_id == user_id).label("following_count"),
+    ).filter(
+        or_(Follows.creator_user_id == user_id, Follows.follower_user_id == user_id)
+    ).one()
     return {
-        "followers_count": followers_count,
-        "following_count": following_count
+        "followers_count": counts.followers_count,
+        "following_count": counts.following_count
     }
 
 def create_follow(db: Session, follower_user_id: UUID, creator_user_id: UUID) -> Follows:
@@ -67,6 +71,34 @@ def is_following(db: Session, follower_user_id: UUID, creator_user_id: UUID) ->
     )
     return follow is not None
 
+def get_following_creator_ids(db: Session, follower_user_id: UUID, creator_ids: List[UUID]) -> Set[UUID]:
+    """
+    指定したクリエイターのうち、ユーザーがフォローしているクリエイターIDを取得（1クエリ）
+    """
+    if not creator_ids:
+        return set()
+    rows = (
+        db.query(Follows.creator_user_id)
+        .filter(Follows.follower_user_id == follower_user_id)
+        .filter(Follows.creator_user_id.in_(creator_ids))
+        .all()
+    )
+    return {creator_id for (creator_id,) in rows}
+
+def get_followers_counts(db: Session, creator_ids: List[UUID]) -> Dict[UUID, int]:
+    """
+    指定したクリエイターのフォロワー数を取得（1クエリ、フォロワーがいない場合は含まれない）
+    """
+    if not creator_ids:
+        return {}
+    rows = (
+        db.query(Follows.creator_user_id, func.count())
+        .filter(Follows.creator_user_id.in_(creator_ids))
+        .group_by(Follows.creator_user_id)
+        .all()
+    )
+    return {creator_id: count for creator_id, count in rows}
+
 def get_followers(
     db: Session, 
     user_id: UUID, 
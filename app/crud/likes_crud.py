@@ -2,15 +2,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from app.models.social import Likes
 from app.models.posts import Posts
+from app.crud import post_stats_crud, ranking_crud
 from uuid import UUID
-from typing import List
+from typing import List, Set
 
 def get_likes_count(db: Session, post_id: UUID) -> int:
     """
     いいね数を取得
     """
-    likes_count = db.query(Likes).filter(Likes.post_id == post_id).count()
-    return likes_count
+    return post_stats_crud.get_likes_count(db, post_id)
 
 def create_like(db: Session, user_id: UUID, post_id: UUID) -> Likes:
     """
@@ -21,6 +21,9 @@ def create_like(db: Session, user_id: UUID, post_id: UUID) -> Likes:
         post_id=post_id
     )
     db.add(like)
+    db.flush()
+    post_stats_crud.update_post_stats(db, post_id, likes=1)
+    ranking_crud.update_like_bucket(db, post_id, None, 1)
     db.commit()
     db.refresh(like)
     return like
@@ -41,7 +44,11 @@ def delete_like(db: Session, user_id: UUID, post_id: UUID) -> bool:
     )
     
     if like:
+        liked_on = like.created_at.date()
         db.delete(like)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, likes=-1)
+        ranking_crud.update_like_bucket(db, post_id, liked_on, -1)
         db.commit()
         return True
     
@@ -63,6 +70,20 @@ def is_liked(db: Session, user_id: UUID, post_id: UUID) -> bool:
     )
     return like is not None
 
+def get_liked_post_ids(db: Session, user_id: UUID, post_ids: List[UUID]) -> Set[UUID]:
+    """
+    指定した投稿のうち、ユーザーがいいねしている投稿IDを取得（1クエリ）
+    """
+    if not post_ids:
+        return set()
+    rows = (
+        db.query(Likes.post_id)
+        .filter(Likes.user_id == user_id)
+        .filter(Likes.post_id.in_(post_ids))
+        .all()
+    )
+    return {post_id for (post_id,) in rows}
+
 def get_liked_posts_by_user_id(
     db: Session, 
     user_id: UUID, 
@@ -99,12 +120,19 @@ def toggle_like(db: Session, user_id: UUID, post_id: UUID) -> dict:
     
     if existing_like:
         # いいね削除
+        liked_on = existing_like.created_at.date()
         db.delete(existing_like)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, likes=-1)
+        ranking_crud.update_like_bucket(db, post_id, liked_on, -1)
         db.commit()
         return {"liked": False, "message": "いいねを取り消しました"}
     else:
         # いいね追加
         like = Likes(user_id=user_id, post_id=post_id)
         db.add(like)
+        db.flush()
+        post_stats_crud.update_post_stats(db, post_id, likes=1)
+        ranking_crud.update_like_bucket(db, post_id, None, 1)
         db.commit()
         return {"liked": True, "message": "いいねしました"}
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from app.models.media_assets import MediaAssets
 from app.models.posts import Posts
@@ -52,6 +52,8 @@ def get_media_asset_by_post_id(db: Session, post_id: str, type: str) -> MediaAss
             MediaAssets.created_at,
             MediaAssets.storage_key,
             MediaAssets.mime_type,
+            MediaAssets.bytes,
+            MediaAssets.hash_sha256,
             Posts.creator_user_id
         ).join(
             Posts, MediaAssets.post_id == Posts.id
@@ -67,4 +69,14 @@ def get_media_asset_by_id(db: Session, asset_id: str) -> MediaAssets:
     """
     メディアアセット取得
     """
-    return db.query(MediaAssets).filter(MediaAssets.id == asset_id).first()
\ No newline at end of file
+    return db.query(MediaAssets).filter(MediaAssets.id == asset_id).first()
+
+def set_media_asset_hash(db: Session, asset_id: str, hash_sha256: bytes) -> None:
+    """
+    メディアアセットの内容ハッシュ（SHA-256）を保存
+    """
+    db.execute(
+        update(MediaAssets)
+        .where(MediaAssets.id == asset_id)
+        .values(hash_sha256=hash_sha256)
+    )
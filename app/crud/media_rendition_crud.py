@@ -1,5 +1,15 @@
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from app.models.media_renditions import MediaRenditions
+from app.models.media_rendition_jobs import MediaRenditionJobs
+from app.models.media_assets import MediaAssets
+from app.models.posts import Posts
+from app.constants.enums import MediaRenditionJobKind, MediaRenditionJobStatus, MediaRenditionKind
+from typing import List, Optional
+from uuid import UUID
+
+# 再利用時に複製するレンディションの列
+REUSABLE_RENDITION_COLUMNS = ("kind", "storage_key", "mime_type", "bytes", "width", "height", "duration_sec")
 
 def create_media_rendition(db: Session, media_rendition: dict) -> MediaRenditions:
     """
@@ -8,4 +18,90 @@ def create_media_rendition(db: Session, media_rendition: dict) -> MediaRendition
     db_media_rendition = MediaRenditions(**media_rendition)
     db.add(db_media_rendition)
     db.flush()
-    return db_media_rendition
\ No newline at end of file
+    return db_media_rendition
+
+def create_media_renditions(db: Session, media_renditions: List[dict]) -> None:
+    """
+    メディアレンディション一括作成（1つの INSERT 文で登録）
+    """
+    if not media_renditions:
+        return
+    db.execute(insert(MediaRenditions).values(media_renditions))
+
+# ========== 同一内容アセットのレンディション再利用 ==========
+
+def rendition_copy_data(rendition: MediaRenditions, asset_id: UUID) -> dict:
+    """
+    レンディションを別アセット用に複製する登録データ（S3 オブジェクトは共有する）
+
+    オブジェクトのキーはクリエイター・投稿ごとのプレフィックス配下にあるため、
+    共有は同じクリエイターのアセット間に限る（get_reusable_* で絞り込む）。
+    """
+    data = {column: getattr(rendition, column) for column in REUSABLE_RENDITION_COLUMNS}
+    data["asset_id"] = asset_id
+    return data
+
+def get_reusable_image_renditions(
+    db: Session, asset_id: UUID, creator_user_id: UUID, hash_sha256: bytes
+) -> List[MediaRenditions]:
+    """
+    同じクリエイターの同じ内容の画像アセットで、画像派生ジョブが完了しているものの派生画像を取得する
+
+    Args:
+        db (Session): データベースセッション
+        asset_id (UUID): 対象アセットID（自身は除外）
+        creator_user_id (UUID): 対象アセットの投稿のクリエイターID
+        hash_sha256 (bytes): 内容ハッシュ
+
+    Returns:
+        List[MediaRenditions]: 派生画像（見つからない場合は空）
+    """
+    source_asset_id = (
+        select(MediaRenditionJobs.asset_id)
+        .join(MediaAssets, MediaAssets.id == MediaRenditionJobs.asset_id)
+        .join(Posts, Posts.id == MediaAssets.post_id)
+        .where(MediaAssets.hash_sha256 == hash_sha256)
+        .where(MediaAssets.id != asset_id)
+        .where(Posts.creator_user_id == creator_user_id)
+        .where(MediaRenditionJobs.kind == MediaRenditionJobKind.IMAGE_VARIANTS)
+        .where(MediaRenditionJobs.status == MediaRenditionJobStatus.COMPLETE)
+        .order_by(MediaRenditionJobs.updated_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return (
+        db.query(MediaRenditions)
+        .filter(MediaRenditions.asset_id == source_asset_id)
+        .filter(MediaRenditions.kind == MediaRenditionKind.FFMPEG)
+        .order_by(MediaRenditions.created_at)
+        .all()
+    )
+
+def get_reusable_video_rendition(
+    db: Session, asset_id: UUID, creator_user_id: UUID, hash_sha256: bytes
+) -> Optional[MediaRenditions]:
+    """
+    同じクリエイターの同じ内容の動画アセットで、HLS 変換が完了しているもののレンディションを取得する
+
+    Args:
+        db (Session): データベースセッション
+        asset_id (UUID): 対象アセットID（自身は除外）
+        creator_user_id (UUID): 対象アセットの投稿のクリエイターID
+        hash_sha256 (bytes): 内容ハッシュ
+
+    Returns:
+        Optional[MediaRenditions]: HLS マスターのレンディション
+    """
+    return (
+        db.query(MediaRenditions)
+        .join(MediaRenditionJobs, MediaRenditionJobs.rendition_id == MediaRenditions.id)
+        .join(MediaAssets, MediaAssets.id == MediaRenditionJobs.asset_id)
+        .join(Posts, Posts.id == MediaAssets.post_id)
+        .filter(MediaAssets.hash_sha256 == hash_sha256)
+        .filter(MediaAssets.id != asset_id)
+        .filter(Posts.creator_user_id == creator_user_id)
+        .filter(MediaRenditionJobs.kind == MediaRenditionJobKind.HLS_ABR4)
+        .filter(MediaRenditionJobs.status == MediaRenditionJobStatus.COMPLETE)
+        .order_by(MediaRenditionJobs.updated_at.desc())
+        .first()
+    )
@@ -1,6 +1,18 @@
-from sqlalchemy import select
+from sqlalchemy import select, update, func, or_, literal
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.models.media_rendition_jobs import MediaRenditionJobs
+from app.models.media_assets import MediaAssets
+from app.models.posts import Posts
+from app.constants.enums import (
+    MediaRenditionJobKind,
+    MediaRenditionJobBackend,
+    MediaRenditionJobStatus,
+    MediaAssetKind,
+)
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
 
 def create_media_rendition_job(db: Session, media_rendition_job_data: dict) -> MediaRenditionJobs:
     """
@@ -32,4 +44,146 @@ def get_media_rendition_job_by_id(db: Session, media_rendition_job_id: str) -> M
     """
     メディアレンディションジョブ取得
     """
-    return db.query(MediaRenditionJobs).filter(MediaRenditionJobs.id == media_rendition_job_id).first()
\ No newline at end of file
+    return db.query(MediaRenditionJobs).filter(MediaRenditionJobs.id == media_rendition_job_id).first()
+
+# ========== 画像派生ジョブ ==========
+
+def enqueue_image_rendition_jobs(db: Session, post_id: str) -> int:
+    """
+    投稿の画像アセットごとに画像派生ジョブを登録する
+
+    実行待ち・実行中・完了済みのジョブがあるアセットは対象外（再実行時は失敗分のみ登録される）。
+
+    Args:
+        db (Session): データベースセッション
+        post_id (str): 投稿ID
+
+    Returns:
+        int: 登録したジョブ数
+    """
+    active_job = (
+        select(MediaRenditionJobs.id)
+        .where(MediaRenditionJobs.asset_id == MediaAssets.id)
+        .where(MediaRenditionJobs.kind == MediaRenditionJobKind.IMAGE_VARIANTS)
+        .where(MediaRenditionJobs.status != MediaRenditionJobStatus.FAILED)
+    )
+    source = (
+        select(
+            MediaAssets.id,
+            MediaAssets.storage_key,
+            literal(MediaRenditionJobKind.IMAGE_VARIANTS),
+            literal(MediaRenditionJobBackend.IMAGE_WORKER),
+            literal(MediaRenditionJobStatus.PENDING),
+        )
+        .where(MediaAssets.post_id == post_id)
+        .where(MediaAssets.kind == MediaAssetKind.IMAGES)
+        .where(~active_job.exists())
+    )
+    result = db.execute(
+        insert(MediaRenditionJobs).from_select(
+            ["asset_id", "input_key", "kind", "backend", "status"], source
+        )
+    )
+    return result.rowcount or 0
+
+def claim_image_rendition_jobs(db: Session, limit: int, reclaim_before: Optional[datetime] = None) -> List[tuple]:
+    """
+    実行待ちの画像派生ジョブを取得して実行中にする
+
+    FOR UPDATE SKIP LOCKED で取得するため、複数ワーカーが同時に実行しても同じジョブは取得されない。
+    reclaim_before を指定した場合、その時刻より前から実行中のジョブ（停止したワーカーの分）も取得する。
+
+    Returns:
+        List[tuple]: (ジョブID, アセットID, 投稿ID, クリエイターID, 入力キー)
+    """
+    claimable = MediaRenditionJobs.status == MediaRenditionJobStatus.PENDING
+    if reclaim_before is not None:
+        claimable = or_(
+            claimable,
+            (MediaRenditionJobs.status == MediaRenditionJobStatus.SUBMITTED)
+            & (MediaRenditionJobs.updated_at < reclaim_before),
+        )
+
+    job_ids = (
+        select(MediaRenditionJobs.id)
+        .where(MediaRenditionJobs.kind == MediaRenditionJobKind.IMAGE_VARIANTS)
+        .where(claimable)
+        .order_by(MediaRenditionJobs.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    claimed = (
+        update(MediaRenditionJobs)
+        .where(MediaRenditionJobs.id.in_(job_ids))
+        .values(status=MediaRenditionJobStatus.SUBMITTED, updated_at=func.now())
+        .returning(MediaRenditionJobs.id, MediaRenditionJobs.asset_id, MediaRenditionJobs.input_key)
+        .cte("claimed")
+    )
+    return db.execute(
+        select(
+            claimed.c.id,
+            claimed.c.asset_id,
+            MediaAssets.post_id,
+            Posts.creator_user_id,
+            claimed.c.input_key,
+        )
+        .join(MediaAssets, MediaAssets.id == claimed.c.asset_id)
+        .join(Posts, Posts.id == MediaAssets.post_id)
+    ).all()
+
+def finish_media_rendition_job(
+    db: Session,
+    media_rendition_job_id: UUID,
+    status: int,
+    output_key: Optional[str] = None,
+    error_message: Optional[str] = None,
+    extra: Optional[dict] = None,
+) -> None:
+    """
+    メディアレンディションジョブの完了・失敗を記録する
+    """
+    db.execute(
+        update(MediaRenditionJobs)
+        .where(MediaRenditionJobs.id == media_rendition_job_id)
+        .values(
+            status=status,
+            output_key=output_key,
+            error_message=error_message,
+            extra=extra,
+            percent_complete=100 if status == MediaRenditionJobStatus.COMPLETE else None,
+            updated_at=func.now(),
+        )
+    )
+
+def count_unfinished_image_assets(db: Session, post_id: UUID) -> int:
+    """
+    投稿の画像アセットのうち、画像派生ジョブが完了していないものの件数を取得する
+
+    失敗後に再登録されたアセットは、新しいジョブが完了していれば完了扱いとする。
+    """
+    completed_job = (
+        select(MediaRenditionJobs.id)
+        .where(MediaRenditionJobs.asset_id == MediaAssets.id)
+        .where(MediaRenditionJobs.kind == MediaRenditionJobKind.IMAGE_VARIANTS)
+        .where(MediaRenditionJobs.status == MediaRenditionJobStatus.COMPLETE)
+    )
+    return db.scalar(
+        select(func.count())
+        .select_from(MediaAssets)
+        .where(MediaAssets.post_id == post_id)
+        .where(MediaAssets.kind == MediaAssetKind.IMAGES)
+        .where(~completed_job.exists())
+    ) or 0
+
+def get_media_rendition_jobs_by_post_id(db: Session, post_id: str) -> List[MediaRenditionJobs]:
+    """
+    投稿のメディアレンディションジョブ一覧を取得する（アセット作成順）
+    """
+    return (
+        db.query(MediaRenditionJobs)
+        .join(MediaAssets, MediaAssets.id == MediaRenditionJobs.asset_id)
+        .filter(MediaAssets.post_id == post_id)
+        .order_by(MediaAssets.created_at, MediaRenditionJobs.created_at)
+        .all()
+    )
@@ -0,0 +1,30 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from app.models.orders import Orders
+from app.constants.enums import OrderStatus
+from app.crud import creator_sales_ledger_crud, creator_balances_crud
+from uuid import UUID
+
+def complete_order(db: Session, order_id: UUID) -> bool:
+    """
+    注文を決済完了にする（明細を売上台帳へ追記し、クリエイターの未確定残高へ加算する）
+
+    決済待ちの注文のみ更新することで、同時実行時の二重計上を防ぐ。
+    支払い（payouts_crud）は台帳の確定済みの行を対象にするため、決済完了した注文の明細だけが支払われる。
+
+    Returns:
+        bool: 決済完了にした場合 True（存在しない・決済待ちでない場合 False）
+    """
+    completed = db.execute(
+        update(Orders)
+        .where(Orders.id == order_id)
+        .where(Orders.status == OrderStatus.PENDING)
+        .values(status=OrderStatus.COMPLETED, updated_at=func.now())
+        .returning(Orders.id)
+    ).first()
+    if not completed:
+        return False
+
+    for creator_id, amount in creator_sales_ledger_crud.record_order_entries(db, order_id):
+        creator_balances_crud.add_pending(db, creator_id, amount)
+    return True
@@ -0,0 +1,142 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update, exists, literal
+from sqlalchemy.dialects.postgresql import insert
+from app.models.payouts import Payouts, PayoutItems, CreatorBalances
+from app.models.creator_sales_ledger import CreatorSalesLedger
+from app.models.purchases import Purchases
+from app.crud.creator_balances_crud import ledger_sold_at
+from app.constants.enums import PayoutStatus
+from uuid import UUID
+from datetime import datetime
+from typing import List, Optional
+
+def _unpaid_ledger_entries(until: datetime):
+    """
+    支払い対象の売上台帳の行（until より前の売上で、確定済みかつまだ支払いに含まれていないもの）
+
+    残高（creator_balances）と同じ台帳を元にするため、支払う行の合計は確定済み残高 available と一致する。
+    返金行（負数）も含め、支払い済みの売上の返金は次回の支払い額から差し引かれる。
+    """
+    paid = exists().where(PayoutItems.ledger_entry_id == CreatorSalesLedger.id)
+    sold_at = ledger_sold_at()
+    return (
+        select(
+            CreatorSalesLedger.id,
+            CreatorSalesLedger.creator_user_id,
+            CreatorSalesLedger.order_item_id,
+            CreatorSalesLedger.amount,
+        )
+        .select_from(CreatorSalesLedger)
+        .outerjoin(Purchases, Purchases.id == CreatorSalesLedger.purchase_id)
+        .join(CreatorBalances, CreatorBalances.creator_user_id == CreatorSalesLedger.creator_user_id)
+        .where(sold_at <= CreatorBalances.settled_until)
+        .where(sold_at < until)
+        .where(~paid)
+    )
+
+def _payable_ledger_entries(creator_ids: List[UUID], until: datetime):
+    """
+    支払う台帳の行と、クリエイターごとの支払い額のサブクエリ
+
+    支払い額（行の合計）が正で、確定済み残高 available 以下のクリエイターのみを対象にし、残高が負にならないようにする。
+
+    Returns:
+        (台帳の行, クリエイターごとの支払い額)
+    """
+    entries = (
+        _unpaid_ledger_entries(until)
+        .where(CreatorSalesLedger.creator_user_id.in_(creator_ids))
+        .subquery()
+    )
+    amount = func.sum(entries.c.amount)
+    totals = (
+        select(entries.c.creator_user_id, amount.label("amount"))
+        .join(CreatorBalances, CreatorBalances.creator_user_id == entries.c.creator_user_id)
+        .group_by(entries.c.creator_user_id, CreatorBalances.available)
+        .having(amount > 0)
+        .having(amount <= CreatorBalances.available)
+        .subquery()
+    )
+    return entries, totals
+
+def get_unpaid_creator_ids(
+    db: Session,
+    after_creator_id: Optional[UUID] = None,
+    limit: int = 1000
+) -> List[UUID]:
+    """
+    確定済み残高を持つクリエイターIDをID順に取得（残高の主キー順に走査する）
+    """
+    query = (
+        select(CreatorBalances.creator_user_id)
+        .where(CreatorBalances.available > 0)
+        .order_by(CreatorBalances.creator_user_id)
+        .limit(limit)
+    )
+    if after_creator_id is not None:
+        query = query.where(CreatorBalances.creator_user_id > after_creator_id)
+    return list(db.execute(query).scalars())
+
+def create_payouts_for_creators(db: Session, creator_ids: List[UUID], until: datetime) -> int:
+    """
+    クリエイターごとの未払いの確定済み売上から支払いを作成（呼び出し元と同じトランザクションで実行される）
+
+    支払い・支払い明細の作成と残高の減算をそれぞれ1文の INSERT ... SELECT / UPDATE で行う。
+    支払い明細は売上台帳の行（購入・決済完了した注文明細・返金）ごとに作成し、支払い額を available から差し引く。
+
+    Args:
+        db: データベースセッション
+        creator_ids: 対象クリエイターID
+        until: この日時より前の売上を対象にする
+
+    Returns:
+        int: 作成した支払い件数
+    """
+    if not creator_ids:
+        return 0
+
+    # 支払い額の算出から減算までの間に残高が変わらないよう、対象クリエイターの残高行をロックする
+    db.execute(
+        select(CreatorBalances.creator_user_id)
+        .where(CreatorBalances.creator_user_id.in_(creator_ids))
+        .order_by(CreatorBalances.creator_user_id)
+        .with_for_update()
+    )
+    entries, totals = _payable_ledger_entries(creator_ids, until)
+
+    # クリエイターごとに支払いを作成
+    payout_rows = db.execute(
+        insert(Payouts)
+        .from_select(
+            ["creator_user_id", "amount", "currency", "status"],
+            select(
+                totals.c.creator_user_id,
+                totals.c.amount,
+                literal("JPY"),
+                literal(PayoutStatus.PENDING),
+            )
+        )
+        .returning(Payouts.id)
+    ).scalars().all()
+    if not payout_rows:
+        return 0
+
+    # 作成した支払いへ台帳の行を紐付け
+    db.execute(
+        insert(PayoutItems).from_select(
+            ["payout_id", "ledger_entry_id", "order_item_id", "amount"],
+            select(Payouts.id, entries.c.id, entries.c.order_item_id, entries.c.amount)
+            .join(entries, entries.c.creator_user_id == Payouts.creator_user_id)
+            .where(Payouts.id.in_(payout_rows))
+        )
+    )
+
+    # 支払い額を確定済み残高から差し引く
+    db.execute(
+        update(CreatorBalances)
+        .where(CreatorBalances.creator_user_id == Payouts.creator_user_id)
+        .where(Payouts.id.in_(payout_rows))
+        .values(available=CreatorBalances.available - Payouts.amount),
+        execution_options={"synchronize_session": False},
+    )
+    return len(payout_rows)
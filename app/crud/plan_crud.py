@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from app.models.plans import Plans
 from app.models.subscriptions import Subscriptions
 from app.models.prices import Prices
+from app.crud.price_crud import get_plan_prices_by_plan_ids
 from uuid import UUID
 from typing import List
 from app.schemas.plan import PlanCreateRequest, PlanResponse, SubscribedPlanResponse
@@ -14,7 +15,8 @@ from app.models.posts import Posts
 from app.models.media_assets import MediaAssets
 from app.constants.enums import MediaAssetKind
 from app.models.user import Users
-from sqlalchemy import func
+from sqlalchemy import func, exists, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 import os
 
 BASE_URL = os.getenv("CDN_BASE_URL")
@@ -23,19 +25,33 @@ from app.constants.enums import PostStatus
 def get_plan_by_user_id(db: Session, user_id: UUID) -> dict:
     """
     ユーザーが加入中のプラン数と詳細を取得
+
+    価格・クリエイター・投稿数・サムネイルは相関サブクエリで取得し、加入プラン数に関わらず1クエリで取得する
     """
 
     # 購入したサブスクリプションプラン（type=2）を取得
     subscribed_purchases = (
-        db.query(Purchases)
+        db.query(
+            Purchases,
+            Plans,
+            _plan_price_subquery().label("price"),
+            Profiles.avatar_url.label("creator_avatar_url"),
+            Profiles.username.label("creator_username"),
+            Users.profile_name.label("creator_profile_name"),
+            _plan_post_count_subquery().label("post_count"),
+            _plan_thumbnail_keys_subquery().label("thumbnail_keys"),
+        )
         .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
+        .outerjoin(Users, (Users.id == Plans.creator_user_id) & Users.deleted_at.is_(None))
+        .outerjoin(Profiles, Profiles.user_id == Users.id)
         .filter(
             Purchases.user_id == user_id,
             Plans.type == PlanStatus.PLAN,  # サブスクリプションプラン（type=2）
             Plans.deleted_at.is_(None),  # 削除されていないプラン
-            Purchases.deleted_at.is_(None)  # 削除されていない購入
+            Purchases.deleted_at.is_(None),  # 削除されていない購入
+            exists().where(Prices.plan_id == Plans.id)
         )
+        .order_by(Purchases.created_at)
         .all()
     )
 
@@ -44,80 +60,24 @@ def get_plan_by_user_id(db: Session, user_id: UUID) -> dict:
     subscribed_plan_names = []
     subscribed_plan_details = []
 
-    # 加入中のプランの詳細情報を取得
-    for purchase in subscribed_purchases:
-        price = (
-            db.query(
-                Prices
-            )
-            .filter(Prices.plan_id == purchase.plan_id)
-            .first()
-        )
-
-        # クリエイター情報を取得
-        creator_profile = (
-            db.query(
-                Profiles.avatar_url,
-                Profiles.username,
-                Users.profile_name,
-            )
-            .join(Users, Profiles.user_id == Users.id)
-            .filter(
-                Users.id == purchase.plan.creator_user_id,
-                Profiles.user_id == purchase.plan.creator_user_id,
-                Users.deleted_at.is_(None)
-            )
-            .first()
-        )
-
-        # プランに紐づく投稿数を取得
-        post_count = (
-            db.query(
-                func.count(PostPlans.post_id)
-            )
-            .join(Posts, PostPlans.post_id == Posts.id)
-            .filter(
-                PostPlans.plan_id == purchase.plan_id,
-                Posts.deleted_at.is_(None),
-                Posts.status == PostStatus.APPROVED
-            ).scalar()
-        )
-
-        # プランに紐づく投稿のサムネイルを取得（最大4件）
-        thumbnails = (
-            db.query(MediaAssets.storage_key)
-            .join(Posts, MediaAssets.post_id == Posts.id)
-            .join(PostPlans, Posts.id == PostPlans.post_id)
-            .filter(
-                PostPlans.plan_id == purchase.plan_id,
-                MediaAssets.kind == MediaAssetKind.THUMBNAIL,
-                Posts.deleted_at.is_(None),
-                Posts.status == PostStatus.APPROVED
-            )
-            .order_by(Posts.created_at.desc())
-            .limit(4)
-            .all()
-        )
-
-        thumbnail_keys = [thumb.storage_key for thumb in thumbnails]
-
+    for purchase, plan, price, creator_avatar_url, creator_username, creator_profile_name, post_count, thumbnail_keys in subscribed_purchases:
         if price:
-            subscribed_total_price += price.price
-            subscribed_plan_names.append(purchase.plan.name)
+            subscribed_total_price += price
+            subscribed_plan_names.append(plan.name)
 
             # 詳細情報を追加
             subscribed_plan_details.append({
                 "purchase_id": str(purchase.id),
-                "plan_id": str(purchase.plan.id),
-                "plan_name": purchase.plan.name,
-                "plan_description": purchase.plan.description,
-                "price": price.price,
+                "plan_id": str(plan.id),
+                "plan_name": plan.name,
+                "plan_description": plan.description,
+                "price": price,
                 "purchase_created_at": purchase.created_at,
-                "creator_avatar_url": creator_profile.avatar_url if creator_profile and creator_profile.avatar_url else None,
-                "creator_username": creator_profile.username if creator_profile else None,
-                "creator_profile_name": creator_profile.profile_name if creator_profile else None,
-                "post_count": post_count or 0,
-                "thumbnail_keys": thumbnail_keys
+                "creator_avatar_url": creator_avatar_url or None,
+                "creator_username": creator_username,
+                "creator_profile_name": creator_profile_name,
+                "post_count": post_count,
+                "thumbnail_keys": thumbnail_keys or []
             })
 
     return {
@@ -142,18 +102,18 @@ def get_user_plans(db: Session, user_id: UUID) -> List[PlanResponse]:
     """
     ユーザーのプラン一覧を取得
     """
-    # priceテーブルと結合して金額情報を取得する
     plans = db.query(Plans).filter(
         Plans.creator_user_id == user_id,
         Plans.type == PlanStatus.PLAN,
         Plans.deleted_at.is_(None)
-    ).join(Prices, Plans.id == Prices.plan_id).all()
+    ).all()
+    # プランごとの価格（最初に登録されたもの）を一括取得する
+    prices = get_plan_prices_by_plan_ids(db, [plan.id for plan in plans])
 
     # レスポンス内容を整形する
     plans_response = []
     for plan in plans:
-        # プランに関連する価格を取得（最初の価格を使用）
-        price = db.query(Prices).filter(Prices.plan_id == plan.id).first()
+        price = prices.get(plan.id)
         if price:
             plans_response.append(PlanResponse(
                 id=plan.id,
@@ -169,7 +129,7 @@ def get_posts_by_plan_id(db: Session, plan_id: UUID, user_id: UUID) -> List[tupl
     プランに紐づく投稿一覧を取得
     ユーザーがそのプランを購入しているか確認してから返す
     """
-    from app.models.social import Likes, Comments
+    from app.models.post_stats import PostStats
     from sqlalchemy.orm import aliased
 
     ThumbnailAssets = aliased(MediaAssets)
@@ -197,30 +157,68 @@ def get_posts_by_plan_id(db: Session, plan_id: UUID, user_id: UUID) -> List[tupl
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             ThumbnailAssets.duration_sec,
-            func.count(func.distinct(Likes.user_id)).label('likes_count'),
-            func.count(func.distinct(Comments.id)).label('comments_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+            func.coalesce(PostStats.comments_count, 0).label('comments_count'),
             Posts.created_at
         )
         .join(PostPlans, Posts.id == PostPlans.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         .outerjoin(ThumbnailAssets, (Posts.id == ThumbnailAssets.post_id) & (ThumbnailAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(Comments, Posts.id == Comments.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .filter(
             PostPlans.plan_id == plan_id,
             Posts.deleted_at.is_(None),
             Posts.status == PostStatus.APPROVED
         )
-        .group_by(
-            Posts.id,
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            ThumbnailAssets.storage_key,
-            ThumbnailAssets.duration_sec,
-            Posts.created_at
-        )
         .order_by(Posts.created_at.desc())
         .all()
-    )
\ No newline at end of file
+    )
+
+# ========== 内部関数 ==========
+
+def _plan_price_subquery():
+    """プランの価格（最初に登録されたもの、price_crud.get_plan_prices_by_plan_ids と同じ）"""
+    return (
+        select(Prices.price)
+        .where(Prices.plan_id == Plans.id)
+        .order_by(Prices.created_at)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+def _plan_post_count_subquery():
+    """プランに紐づく公開中の投稿数"""
+    return (
+        select(func.count(PostPlans.post_id))
+        .join(Posts, PostPlans.post_id == Posts.id)
+        .where(
+            PostPlans.plan_id == Plans.id,
+            Posts.deleted_at.is_(None),
+            Posts.status == PostStatus.APPROVED
+        )
+        .scalar_subquery()
+    )
+
+def _plan_thumbnail_keys_subquery(per_plan: int = 4):
+    """プランの新しい投稿のサムネイル（最大 per_plan 件、新しい順の配列）"""
+    recent = (
+        select(MediaAssets.storage_key, Posts.created_at)
+        .select_from(PostPlans)
+        .join(Posts, PostPlans.post_id == Posts.id)
+        .join(MediaAssets, MediaAssets.post_id == Posts.id)
+        .where(
+            PostPlans.plan_id == Plans.id,
+            MediaAssets.kind == MediaAssetKind.THUMBNAIL,
+            Posts.deleted_at.is_(None),
+            Posts.status == PostStatus.APPROVED
+        )
+        .order_by(Posts.created_at.desc())
+        .limit(per_plan)
+        .correlate(Plans)
+        .subquery()
+    )
+    return (
+        select(func.array_agg(aggregate_order_by(recent.c.storage_key, recent.c.created_at.desc())))
+        .scalar_subquery()
+    )
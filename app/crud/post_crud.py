@@ -1,6 +1,6 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session, aliased
-from sqlalchemy import func, desc, exists
+from sqlalchemy.orm import Session, aliased, lazyload
+from sqlalchemy import func, desc, exists, tuple_, select, literal_column
 from app.models.posts import Posts
 from app.models.social import Likes, Bookmarks, Comments
 from uuid import UUID
@@ -19,11 +19,21 @@ from app.models.media_renditions import MediaRenditions
 from app.api.commons.utils import get_video_duration
 from app.constants.enums import PlanStatus
 from app.models.purchases import Purchases
-from datetime import datetime, timedelta
+from app.models.post_stats import PostStats
+from app.services.cache.post_detail import invalidate_post_detail_on_commit
 
 # エイリアスを定義
 ThumbnailAssets = aliased(MediaAssets)
 
+# ステータス別投稿一覧のセクション名とステータス
+POST_STATUS_SECTIONS = {
+    "pending_posts": PostStatus.PENDING,
+    "rejected_posts": PostStatus.REJECTED,
+    "unpublished_posts": PostStatus.UNPUBLISHED,
+    "deleted_posts": PostStatus.DELETED,
+    "approved_posts": PostStatus.APPROVED,
+}
+
 # ========== 投稿管理 ==========
 
 
@@ -33,10 +43,10 @@ def get_total_likes_by_user_id(db: Session, user_id: UUID) -> int:
     ユーザーの投稿についた総合いいね数を取得
     """
     
-    # いいねテーブルと結合していいね数を取得
+    # 投稿ごとの集計値を合算していいね数を取得
     total_likes = (
-        db.query(func.count(Likes.post_id))
-        .join(Posts, Likes.post_id == Posts.id)
+        db.query(func.sum(PostStats.likes_count))
+        .join(Posts, PostStats.post_id == Posts.id)
         .filter(Posts.creator_user_id == user_id)
         .filter(Posts.deleted_at.is_(None))  # 削除されていない投稿のみ
         .scalar()
@@ -46,40 +56,40 @@ def get_total_likes_by_user_id(db: Session, user_id: UUID) -> int:
 
 def get_posts_count_by_user_id(db: Session, user_id: UUID) -> dict:
     """
-    各ステータスの投稿数を取得
+    各ステータスの投稿数を取得（GROUP BY status の1クエリ）
     """
-    
-    # 審査中
-    peding_posts_count = db.query(Posts).filter(Posts.creator_user_id == user_id).filter(Posts.deleted_at.is_(None)).filter(Posts.status == PostStatus.PENDING).count()
-
-    # 修正
-    rejected_posts_count = db.query(Posts).filter(Posts.creator_user_id == user_id).filter(Posts.deleted_at.is_(None)).filter(Posts.status == PostStatus.REJECTED).count()
-
-    # 非公開
-    unpublished_posts_count = db.query(Posts).filter(Posts.creator_user_id == user_id).filter(Posts.deleted_at.is_(None)).filter(Posts.status == PostStatus.UNPUBLISHED).count()
-
-    # 削除
-    deleted_posts_count = db.query(Posts).filter(Posts.creator_user_id == user_id).filter(Posts.deleted_at.is_(None)).filter(Posts.status == PostStatus.DELETED).count()
-
-    # 公開
-    approved_posts_count = db.query(Posts).filter(Posts.creator_user_id == user_id).filter(Posts.deleted_at.is_(None)).filter(Posts.status == PostStatus.APPROVED).count()
+    counts = dict(
+        db.query(Posts.status, func.count(Posts.id))
+        .filter(Posts.creator_user_id == user_id)
+        .filter(Posts.deleted_at.is_(None))
+        .group_by(Posts.status)
+        .all()
+    )
 
     return {
-        "peding_posts_count": peding_posts_count,
-        "rejected_posts_count": rejected_posts_count,
-        "unpublished_posts_count": unpublished_posts_count,
-        "deleted_posts_count": deleted_posts_count,
-        "approved_posts_count": approved_posts_count
+        "peding_posts_count": counts.get(PostStatus.PENDING, 0),
+        "rejected_posts_count": counts.get(PostStatus.REJECTED, 0),
+        "unpublished_posts_count": counts.get(PostStatus.UNPUBLISHED, 0),
+        "deleted_posts_count": counts.get(PostStatus.DELETED, 0),
+        "approved_posts_count": counts.get(PostStatus.APPROVED, 0)
     }
 
-def get_posts_by_category_slug(db: Session, slug: str) -> List[Posts]:
+def get_posts_by_category_slug(
+    db: Session,
+    slug: str,
+    limit: int = 20,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
     """
-    カテゴリーに紐づく投稿を取得
+    カテゴリーに紐づく投稿を取得（(created_at, id) のキーセットページネーション）
+
+    Args:
+        cursor: 前ページ最終行の (Posts.created_at, Posts.id)。Noneの場合は先頭から
     """
-    return (
+    query = (
         db.query(
             Posts,
-            func.count(Likes.post_id).label('likes_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
             Users.profile_name,
             Profiles.username,
             Profiles.avatar_url,
@@ -90,187 +100,134 @@ def get_posts_by_category_slug(db: Session, slug: str) -> List[Posts]:
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .filter(Categories.slug == slug)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(Posts.created_at, Posts.id) < tuple_(*cursor))
+    return (
+        query
+        .order_by(desc(Posts.created_at), desc(Posts.id))
+        .limit(limit)
         .all()
     )
 
-def get_post_status_by_user_id(db: Session, user_id: UUID) -> dict:
+def get_post_status_by_user_id(db: Session, user_id: UUID, limit_per_status: int = 20) -> dict:
     """
-    ユーザーの投稿ステータスを取得
+    ユーザーの投稿をステータスごとに取得（1クエリ）
+
+    ROW_NUMBER() OVER (PARTITION BY status) で各ステータスを limit_per_status + 1 件までに絞り込む。
+    続きは get_posts_by_status_for_user で (created_at, id) のカーソルを使って取得する。
+
+    Returns:
+        dict: ステータスごとの投稿（各 limit_per_status + 1 件まで、呼び出し側で次ページの有無を判定する）
     """
-    
-    # 審査中の投稿を取得
-    pending_posts = (
+    ranked = (
         db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            func.min(Prices.price).label('post_price'),  # 最安値を取得
-            func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
-            MediaAssets.storage_key.label('thumbnail_key')
+            Posts.id.label('post_id'),
+            func.row_number().over(
+                partition_by=Posts.status,
+                order_by=(desc(Posts.created_at), desc(Posts.id))
+            ).label('rn')
         )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
-        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
-        .outerjoin(Prices, Plans.id == Prices.plan_id)
         .filter(Posts.creator_user_id == user_id)
         .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.PENDING)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
-        .all()
+        .subquery()
     )
 
-    # 拒否された投稿を取得
-    rejected_posts = (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            func.min(Prices.price).label('post_price'),  # 最安値を取得
-            func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
-        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
-        .outerjoin(Prices, Plans.id == Prices.plan_id)
-        .filter(Posts.creator_user_id == user_id)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.REJECTED)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
+    rows = (
+        _post_status_card_query(db, ranked)
+        .filter(ranked.c.rn <= limit_per_status + 1)
+        .order_by(Posts.status, desc(Posts.created_at), desc(Posts.id))
         .all()
     )
 
-    # 非公開の投稿を取得
-    unpublished_posts = (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            func.min(Prices.price).label('post_price'),  # 最安値を取得
-            func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
-        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
-        .outerjoin(Prices, Plans.id == Prices.plan_id)
-        .filter(Posts.creator_user_id == user_id)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.UNPUBLISHED)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
-        .all()
-    )
+    posts_by_status = {status: [] for status in POST_STATUS_SECTIONS.values()}
+    for row in rows:
+        if row.Posts.status in posts_by_status:
+            posts_by_status[row.Posts.status].append(row)
 
-    # 削除された投稿を取得
-    deleted_posts = (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            func.min(Prices.price).label('post_price'),  # 最安値を取得
-            func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
-        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
-        .outerjoin(Prices, Plans.id == Prices.plan_id)
-        .filter(Posts.creator_user_id == user_id)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.DELETED)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
-        .all()
-    )
+    return {
+        section: posts_by_status[status]
+        for section, status in POST_STATUS_SECTIONS.items()
+    }
 
-    # 公開された投稿を取得
-    approved_posts = (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            func.min(Prices.price).label('post_price'),  # 最安値を取得
-            func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
-        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
-        .outerjoin(Prices, Plans.id == Prices.plan_id)
+def get_posts_by_status_for_user(
+    db: Session,
+    user_id: UUID,
+    status: int,
+    limit: int = 20,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
+    """
+    ユーザーの指定ステータスの投稿を取得（(created_at, id) のキーセットページネーション）
+    """
+    query = (
+        _post_status_card_query(db)
         .filter(Posts.creator_user_id == user_id)
         .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc(Posts.created_at))
+        .filter(Posts.status == status)
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(Posts.created_at, Posts.id) < tuple_(*cursor))
+    return (
+        query
+        .order_by(desc(Posts.created_at), desc(Posts.id))
+        .limit(limit)
         .all()
     )
 
-    return {
-        "pending_posts": pending_posts,
-        "rejected_posts": rejected_posts,
-        "unpublished_posts": unpublished_posts,
-        "deleted_posts": deleted_posts,
-        "approved_posts": approved_posts
-    }
-
-def get_post_detail_by_id(db: Session, post_id: str, user_id: str | None) -> dict:
+def get_public_post_detail_by_id(db: Session, post_id: str) -> dict:
     """
-    投稿詳細を取得（メディア情報とクリエイター情報、カテゴリ情報、販売情報を含む）
+    投稿詳細のうち閲覧者に依存しない部分を取得（メディア情報とクリエイター情報、カテゴリ情報、販売情報を含む）
+
+    メディア数に関わらず、以下の3クエリで取得する
+    1. 投稿・クリエイター・プロフィール・いいね数・カテゴリ
+    2. プランと価格
+    3. メディアアセットとレンディション
+
+    購入有無と表示する動画は is_post_purchased の結果で呼び出し側が決定する。
     """
     # 投稿とクリエイター情報を取得
-    post, creator, creator_profile = _get_post_and_creator_info(db, post_id)
-    if not post:
+    row = _get_post_and_creator_info(db, post_id)
+    if not row:
         return None
-    
+
     # 各種情報を取得
-    categories = _get_post_categories(db, post_id)
-    likes_count = _get_likes_count(db, post_id)
     sale_info = _get_sale_info(db, post_id)
-    media_info = _get_media_info(db, post_id, user_id)
-    
+    media_info = _get_media_info(db, post_id)
+
     # 結果を統合して返却
     return {
-        "post": post,
-        "creator": creator,
-        "creator_profile": creator_profile,
-        "categories": categories,
-        "likes_count": likes_count,
+        "post": row.Posts,
+        "creator": row.Users,
+        "creator_profile": row.Profiles,
+        "categories": row.categories,
+        "likes_count": row.likes_count,
         **sale_info,
         **media_info
     }
 
+def is_post_purchased(db: Session, user_id: UUID | None, post_id: UUID) -> bool:
+    """
+    ユーザーが投稿を購入しているかどうかを判定
+
+    Args:
+        db (Session): データベースセッション
+        user_id (UUID | None): ユーザーID（Noneの場合は未購入扱い）
+        post_id (UUID): 投稿ID
+
+    Returns:
+        bool: 購入済みの場合True、未購入の場合False
+    """
+    if user_id is None:
+        return False
+    return db.query(exists().where(
+        Purchases.user_id == user_id,
+        Purchases.post_id == post_id,
+        Purchases.deleted_at.is_(None)  # 削除されていない購入のみ
+    )).scalar()
+
 def get_liked_posts_by_user_id(db: Session, user_id: UUID, limit: int = 50) -> List[tuple]:
     """
     ユーザーがいいねした投稿を取得（top_crud.pyの121-126行目の項目と合わせる）
@@ -298,11 +255,16 @@ def get_liked_posts_by_user_id(db: Session, user_id: UUID, limit: int = 50) -> L
         .all()
     )
 
-def get_bookmarked_posts_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
+def get_bookmarked_posts_by_user_id(
+    db: Session,
+    user_id: UUID,
+    limit: int = 20,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
     """
-    ユーザーがブックマークした投稿を取得
+    ユーザーがブックマークした投稿を取得（(Bookmarks.created_at, post_id) のキーセットページネーション）
     """
-    return (
+    query = (
         db.query(
             Posts,
             Users.profile_name,
@@ -310,37 +272,38 @@ def get_bookmarked_posts_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             ThumbnailAssets.duration_sec,
-            func.count(func.distinct(Likes.user_id)).label('likes_count'),
-            func.count(func.distinct(Comments.id)).label('comments_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+            func.coalesce(PostStats.comments_count, 0).label('comments_count'),
             Bookmarks.created_at.label('bookmarked_at')
         )
         .join(Bookmarks, Posts.id == Bookmarks.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         .outerjoin(ThumbnailAssets, (Posts.id == ThumbnailAssets.post_id) & (ThumbnailAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(Comments, Posts.id == Comments.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .filter(Bookmarks.user_id == user_id)
         .filter(Posts.deleted_at.is_(None))
         .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(
-            Posts.id,
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            ThumbnailAssets.storage_key,
-            ThumbnailAssets.duration_sec,
-            Bookmarks.created_at
-        )
-        .order_by(desc(Bookmarks.created_at))
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(Bookmarks.created_at, Bookmarks.post_id) < tuple_(*cursor))
+    return (
+        query
+        .order_by(desc(Bookmarks.created_at), desc(Bookmarks.post_id))
+        .limit(limit)
         .all()
     )
 
-def get_liked_posts_list_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
+def get_liked_posts_list_by_user_id(
+    db: Session,
+    user_id: UUID,
+    limit: int = 20,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
     """
-    ユーザーがいいねした投稿一覧を取得（カード表示用）
+    ユーザーがいいねした投稿一覧を取得（カード表示用、(Likes.created_at, post_id) のキーセットページネーション）
     """
-    return (
+    query = (
         db.query(
             Posts,
             Users.profile_name,
@@ -348,40 +311,43 @@ def get_liked_posts_list_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             ThumbnailAssets.duration_sec,
-            func.count(func.distinct(Likes.user_id)).label('likes_count'),
-            func.count(func.distinct(Comments.id)).label('comments_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+            func.coalesce(PostStats.comments_count, 0).label('comments_count'),
             Likes.created_at.label('liked_at')
         )
         .join(Likes, Posts.id == Likes.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         .outerjoin(ThumbnailAssets, (Posts.id == ThumbnailAssets.post_id) & (ThumbnailAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Comments, Posts.id == Comments.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .filter(Likes.user_id == user_id)
         .filter(Posts.deleted_at.is_(None))
         .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(
-            Posts.id,
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            ThumbnailAssets.storage_key,
-            ThumbnailAssets.duration_sec,
-            Likes.created_at
-        )
-        .order_by(desc(Likes.created_at))
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(Likes.created_at, Likes.post_id) < tuple_(*cursor))
+    return (
+        query
+        .order_by(desc(Likes.created_at), desc(Likes.post_id))
+        .limit(limit)
         .all()
     )
 
-def get_bought_posts_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
+def get_bought_posts_by_user_id(
+    db: Session,
+    user_id: UUID,
+    limit: int = 20,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
     """
-    ユーザーが購入した投稿を取得
+    ユーザーが購入した投稿を取得（(最新購入日時, post_id) のキーセットページネーション）
     """
-    # サブクエリで投稿ごとの最新購入日時を取得（投稿IDのみでグループ化）
+    # サブクエリで投稿ごとの最新購入日時を取得し、表示する limit 件に絞り込む（投稿IDのみでグループ化）
+    latest_purchase_at = func.max(Purchases.created_at)
     latest_purchases = (
         db.query(
             Posts.id.label('post_id'),
-            func.max(Purchases.created_at).label('latest_purchase_at')
+            latest_purchase_at.label('latest_purchase_at')
         )
         .select_from(Purchases)
         .join(Plans, Purchases.plan_id == Plans.id)
@@ -389,10 +355,20 @@ def get_bought_posts_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
         .join(Posts, PostPlans.post_id == Posts.id)
         .filter(Purchases.user_id == user_id)
         .filter(Purchases.deleted_at.is_(None))
+        .filter(Posts.deleted_at.is_(None))
+        .filter(Posts.status == PostStatus.APPROVED)
         .group_by(Posts.id)
+    )
+    if cursor is not None:
+        latest_purchases = latest_purchases.having(tuple_(latest_purchase_at, Posts.id) < tuple_(*cursor))
+    latest_purchases = (
+        latest_purchases
+        .order_by(desc(latest_purchase_at), desc(Posts.id))
+        .limit(limit)
         .subquery()
     )
 
+    # 絞り込んだ投稿にだけ表示用の情報を結合する
     return (
         db.query(
             Posts,
@@ -401,139 +377,17 @@ def get_bought_posts_by_user_id(db: Session, user_id: UUID) -> List[tuple]:
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             ThumbnailAssets.duration_sec,
-            func.count(func.distinct(Likes.user_id)).label('likes_count'),
-            func.count(func.distinct(Comments.id)).label('comments_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+            func.coalesce(PostStats.comments_count, 0).label('comments_count'),
             latest_purchases.c.latest_purchase_at.label('purchased_at')
         )
-        .select_from(Posts)
-        .join(latest_purchases, Posts.id == latest_purchases.c.post_id)
+        .select_from(latest_purchases)
+        .join(Posts, Posts.id == latest_purchases.c.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         .outerjoin(ThumbnailAssets, (Posts.id == ThumbnailAssets.post_id) & (ThumbnailAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .outerjoin(Comments, Posts.id == Comments.post_id)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(
-            Posts.id,
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            ThumbnailAssets.storage_key,
-            ThumbnailAssets.duration_sec,
-            latest_purchases.c.latest_purchase_at
-        )
-        .order_by(desc(latest_purchases.c.latest_purchase_at))
-        .all()
-    )
-
-def get_ranking_posts_all_time(db: Session, limit: int = 500):
-    """
-    全期間でいいね数が多い投稿を取得
-    """
-    return (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        # TODO: 公開済みの投稿のみにする
-        .filter(Posts.status == PostStatus.APPROVED)  # 公開済みの投稿のみ
-        .filter(Posts.deleted_at.is_(None))  # 削除されていない投稿のみ
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc('likes_count'))
-        .limit(limit)
-        .all()
-    )
-
-def get_ranking_posts_monthly(db: Session, limit: int = 50):
-    """
-    月間でいいね数が多い投稿を取得
-    """
-    one_month_ago = datetime.now() - timedelta(days=30)
-    
-    return (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        # .filter(Posts.status == PostStatus.APPROVED)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.created_at >= one_month_ago)  # 過去30日以内のいいね
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc('likes_count'))
-        .limit(limit)
-        .all()
-    )
-
-def get_ranking_posts_weekly(db: Session, limit: int = 50):
-    """
-    週間でいいね数が多い投稿を取得
-    """
-    one_week_ago = datetime.now() - timedelta(days=7)
-    
-    return (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .filter(Posts.status == PostStatus.APPROVED)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.created_at >= one_week_ago)  # 過去7日以内のいいね
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc('likes_count'))
-        .limit(limit)
-        .all()
-    )
-
-def get_ranking_posts_daily(db: Session, limit: int = 50):
-    """
-    日間でいいね数が多い投稿を取得
-    """
-    one_day_ago = datetime.now() - timedelta(days=1)
-    
-    return (
-        db.query(
-            Posts,
-            func.count(Likes.post_id).label('likes_count'),
-            Users.profile_name,
-            Profiles.username,
-            Profiles.avatar_url,
-            MediaAssets.storage_key.label('thumbnail_key')
-        )
-        .join(Users, Posts.creator_user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .filter(Posts.status == PostStatus.APPROVED)
-        .filter(Posts.deleted_at.is_(None))
-        .filter(Posts.created_at >= one_day_ago)  # 過去1日以内のいいね
-        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key)
-        .order_by(desc('likes_count'))
-        .limit(limit)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
+        .order_by(desc(latest_purchases.c.latest_purchase_at), desc(Posts.id))
         .all()
     )
 
@@ -585,59 +439,87 @@ def update_post_status(db: Session, post_id: UUID, status: int):
     post.updated_at = datetime.now()
     db.add(post)
     db.flush()
+    invalidate_post_detail_on_commit(db, post.id)
     return post
 
 # ========== 内部関数 ==========
 
-def _is_purchased(db: Session, user_id: UUID | None, post_id: UUID) -> bool:
+def _post_status_card_query(db: Session, post_ids=None):
     """
-    ユーザーが投稿を購入しているかどうかを判定
+    ステータス別投稿一覧のカード表示用クエリ（最安値の価格を含む）
 
-    Args:
-        db (Session): データベースセッション
-        user_id (UUID | None): ユーザーID（Noneの場合は未購入扱い）
-        post_id (UUID): 投稿ID
+    post_ids（post_id 列を持つサブクエリ）を渡すと、絞り込み済みの投稿から結合する。
+    結合するテーブル数が join_collapse_limit を超えるため、記述した順がそのまま結合順になる。
+    """
+    query = db.query(
+        Posts,
+        func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+        Users.profile_name,
+        Profiles.username,
+        Profiles.avatar_url,
+        func.min(Prices.price).label('post_price'),  # 最安値を取得
+        func.min(Prices.currency).label('post_currency'),  # 最安値の通貨を取得
+        MediaAssets.storage_key.label('thumbnail_key')
+    )
+    if post_ids is not None:
+        query = query.select_from(post_ids).join(Posts, Posts.id == post_ids.c.post_id)
+    return (
+        query
+        .join(Users, Posts.creator_user_id == Users.id)
+        .join(Profiles, Users.id == Profiles.user_id)
+        .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
+        .outerjoin(PostPlans, Posts.id == PostPlans.post_id)
+        .outerjoin(Plans, PostPlans.plan_id == Plans.id)
+        .outerjoin(Prices, Plans.id == Prices.plan_id)
+        .group_by(Posts.id, Users.profile_name, Profiles.username, Profiles.avatar_url, MediaAssets.storage_key, PostStats.likes_count)
+    )
 
-    Returns:
-        bool: 購入済みの場合True、未購入の場合False
+def _get_post_and_creator_info(db: Session, post_id: str):
     """
-    if user_id is None:
-        return False
-    return db.query(exists().where(
-        Purchases.user_id == user_id,
-        Purchases.post_id == post_id,
-        Purchases.deleted_at.is_(None)  # 削除されていない購入のみ
-    )).scalar()
+    投稿とクリエイター情報、いいね数、カテゴリを1クエリで取得
 
-def _get_post_and_creator_info(db: Session, post_id: str) -> tuple:
-    """投稿とクリエイター情報を取得"""
-    post = db.query(Posts).filter(
-        Posts.id == post_id,
-        Posts.deleted_at.is_(None)
-    ).first()
-    
-    if not post:
-        return None, None, None
-    
-    creator = db.query(Users).filter(Users.id == post.creator_user_id).first()
-    creator_profile = db.query(Profiles).filter(Profiles.user_id == post.creator_user_id).first()
-    
-    return post, creator, creator_profile
+    カテゴリは [{"id", "name", "slug"}, ...] のJSON配列で返す
+    """
+    categories_sq = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    func.json_build_object(
+                        'id', Categories.id,
+                        'name', Categories.name,
+                        'slug', Categories.slug
+                    )
+                ),
+                literal_column("'[]'::json")
+            )
+        )
+        .select_from(PostCategories)
+        .join(Categories, Categories.id == PostCategories.category_id)
+        .where(PostCategories.post_id == Posts.id)
+        .where(Categories.is_active == True)
+        .correlate(Posts)
+        .scalar_subquery()
+    )
 
-def _get_post_categories(db: Session, post_id: str) -> list:
-    """投稿のカテゴリ情報を取得"""
     return (
-        db.query(Categories)
-        .join(PostCategories, Categories.id == PostCategories.category_id)
-        .filter(PostCategories.post_id == post_id)
-        .filter(Categories.is_active == True)
-        .all()
+        db.query(
+            Posts,
+            Users,
+            Profiles,
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
+            categories_sq.label('categories')
+        )
+        .join(Users, Posts.creator_user_id == Users.id)
+        .outerjoin(Profiles, Profiles.user_id == Posts.creator_user_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
+        .filter(Posts.id == post_id)
+        .filter(Posts.deleted_at.is_(None))
+        # 詳細表示では使わない selectin リレーションの追加クエリを抑止
+        .options(lazyload(Users.creator_type), lazyload(Users.genders))
+        .first()
     )
 
-def _get_likes_count(db: Session, post_id: str) -> int:
-    """投稿のいいね数を取得"""
-    return db.query(func.count(Likes.post_id)).filter(Likes.post_id == post_id).scalar() or 0
-
 def _get_sale_info(db: Session, post_id: str) -> dict:
     """販売情報を取得・判定"""
     post_plans = (
@@ -689,42 +571,51 @@ def _get_sale_info(db: Session, post_id: str) -> dict:
         "subscription": subscription
     }
 
-def _get_media_info(db: Session, post_id: str, user_id: str | None) -> dict:
-    """メディア情報を取得・処理"""
-    media_assets = db.query(MediaAssets).filter(MediaAssets.post_id == post_id).all()
-    purchased = _is_purchased(db, user_id, post_id) if user_id else False
-    
-    video_rendition = None
+def _get_media_info(db: Session, post_id: str) -> dict:
+    """メディア情報を取得・処理（アセットとレンディションを1クエリで取得）"""
+    rows = (
+        db.query(MediaAssets, MediaRenditions)
+        .outerjoin(MediaRenditions, MediaRenditions.asset_id == MediaAssets.id)
+        .filter(MediaAssets.post_id == post_id)
+        .order_by(MediaAssets.id, MediaRenditions.created_at)
+        .all()
+    )
+
+    # アセットごとに最初のレンディションのみ使用する
+    media_assets = []
+    renditions_by_asset = {}
+    for media_asset, rendition in rows:
+        if media_asset.id in renditions_by_asset:
+            continue
+        media_assets.append(media_asset)
+        renditions_by_asset[media_asset.id] = rendition
+
+    main_video_key = None
+    sample_video_key = None
     thumbnail_key = None
     main_video_duration = None
     sample_video_duration = None
-    
+
     for media_asset in media_assets:
         if media_asset.kind == MediaAssetKind.THUMBNAIL:
             thumbnail_key = media_asset.storage_key
         elif media_asset.kind in [MediaAssetKind.MAIN_VIDEO, MediaAssetKind.SAMPLE_VIDEO]:
-            renditions = db.query(MediaRenditions).filter(
-                MediaRenditions.asset_id == media_asset.id
-            ).first()
-            
+            renditions = renditions_by_asset[media_asset.id]
+
             if renditions:
-                # 購入状況に応じて適切な動画を設定
-                if purchased and media_asset.kind == MediaAssetKind.MAIN_VIDEO:
-                    video_rendition = renditions.storage_key
-                elif not purchased and media_asset.kind == MediaAssetKind.SAMPLE_VIDEO:
-                    video_rendition = renditions.storage_key
-                
-                # 動画の種類に応じてdurationを設定
+                # 動画の種類に応じてレンディションとdurationを設定
                 if media_asset.kind == MediaAssetKind.MAIN_VIDEO:
+                    main_video_key = renditions.storage_key
                     main_video_duration = get_video_duration(renditions.duration_sec)
                 elif media_asset.kind == MediaAssetKind.SAMPLE_VIDEO:
+                    sample_video_key = renditions.storage_key
                     sample_video_duration = get_video_duration(renditions.duration_sec)
-    
+
     return {
-        "video_rendition": video_rendition,
+        "main_video_key": main_video_key,
+        "sample_video_key": sample_video_key,
         "thumbnail_key": thumbnail_key,
         "main_video_duration": main_video_duration,
         "sample_video_duration": sample_video_duration,
-        "purchased": purchased,
         "media_assets": media_assets
-    }
\ No newline at end of file
+    }
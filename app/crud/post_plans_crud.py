@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.plans import PostPlans
+from app.services.cache.post_detail import invalidate_post_detail_on_commit
 
 def create_post_plan(db: Session, post_plan_data) -> PostPlans:
     """
@@ -8,4 +9,5 @@ def create_post_plan(db: Session, post_plan_data) -> PostPlans:
     db_post_plan = PostPlans(**post_plan_data)
     db.add(db_post_plan)
     db.flush()
+    invalidate_post_detail_on_commit(db, db_post_plan.post_id)
     return db_post_plan
\ No newline at end of file
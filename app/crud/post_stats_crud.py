@@ -0,0 +1,135 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from app.models.post_stats import PostStats
+from app.models.posts import Posts
+from app.models.social import Likes, Comments, Bookmarks
+from uuid import UUID
+from typing import Dict, Iterable, List, Optional
+
+def get_post_stats(db: Session, post_id: UUID) -> Optional[PostStats]:
+    """
+    投稿の集計値を取得
+    """
+    return db.get(PostStats, post_id)
+
+def get_likes_count(db: Session, post_id: UUID) -> int:
+    """
+    投稿のいいね数を取得（post_statsの主キー参照のみ）
+    """
+    likes_count = (
+        db.query(PostStats.likes_count)
+        .filter(PostStats.post_id == post_id)
+        .scalar()
+    )
+    return likes_count or 0
+
+def get_post_stats_by_ids(db: Session, post_ids: List[UUID]) -> Dict[UUID, PostStats]:
+    """
+    複数投稿の集計値を取得（1クエリ、集計行が無い投稿は含まれない）
+    """
+    if not post_ids:
+        return {}
+    rows = db.query(PostStats).filter(PostStats.post_id.in_(post_ids)).all()
+    return {row.post_id: row for row in rows}
+
+def update_post_stats(
+    db: Session,
+    post_id: UUID,
+    likes: int = 0,
+    comments: int = 0,
+    bookmarks: int = 0,
+) -> None:
+    """
+    投稿の集計値を差分で更新（呼び出し元と同じトランザクションで実行される）
+
+    行が無ければ作成し、あれば `x = x + :delta` で原子的に加算する。
+    集計値は0未満にならないよう丸める。
+    """
+    if not (likes or comments or bookmarks):
+        return
+
+    stmt = insert(PostStats).values(
+        post_id=post_id,
+        likes_count=max(likes, 0),
+        comments_count=max(comments, 0),
+        bookmarks_count=max(bookmarks, 0),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PostStats.post_id],
+        set_={
+            "likes_count": func.greatest(PostStats.likes_count + likes, 0),
+            "comments_count": func.greatest(PostStats.comments_count + comments, 0),
+            "bookmarks_count": func.greatest(PostStats.bookmarks_count + bookmarks, 0),
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+def reconcile_post_stats(db: Session, post_ids: Iterable[UUID] | None = None) -> int:
+    """
+    元テーブル（likes / comments / bookmarks）から集計値を再構築する
+
+    Args:
+        db (Session): データベースセッション
+        post_ids (Iterable[UUID] | None): 対象投稿ID（Noneの場合は全投稿）
+
+    Returns:
+        int: 更新した行数
+    """
+    likes_sq = (
+        select(Likes.post_id, func.count().label("cnt"))
+        .group_by(Likes.post_id)
+        .subquery()
+    )
+    comments_sq = (
+        select(Comments.post_id, func.count().label("cnt"))
+        .where(Comments.deleted_at.is_(None))
+        .group_by(Comments.post_id)
+        .subquery()
+    )
+    bookmarks_sq = (
+        select(Bookmarks.post_id, func.count().label("cnt"))
+        .group_by(Bookmarks.post_id)
+        .subquery()
+    )
+
+    source = (
+        select(
+            Posts.id,
+            func.coalesce(likes_sq.c.cnt, 0),
+            func.coalesce(comments_sq.c.cnt, 0),
+            func.coalesce(bookmarks_sq.c.cnt, 0),
+            func.now(),
+        )
+        .outerjoin(likes_sq, likes_sq.c.post_id == Posts.id)
+        .outerjoin(comments_sq, comments_sq.c.post_id == Posts.id)
+        .outerjoin(bookmarks_sq, bookmarks_sq.c.post_id == Posts.id)
+    )
+    if post_ids is not None:
+        post_ids = list(post_ids)
+        if not post_ids:
+            return 0
+        source = source.where(Posts.id.in_(post_ids))
+
+    stmt = insert(PostStats).from_select(
+        ["post_id", "likes_count", "comments_count", "bookmarks_count", "updated_at"],
+        source,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PostStats.post_id],
+        set_={
+            "likes_count": stmt.excluded.likes_count,
+            "comments_count": stmt.excluded.comments_count,
+            "bookmarks_count": stmt.excluded.bookmarks_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        # 値が変わっていない行は書き込まない
+        where=(
+            (PostStats.likes_count != stmt.excluded.likes_count)
+            | (PostStats.comments_count != stmt.excluded.comments_count)
+            | (PostStats.bookmarks_count != stmt.excluded.bookmarks_count)
+        ),
+    )
+    result = db.execute(stmt)
+    return result.rowcount or 0
@@ -1,5 +1,10 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.models.prices import Prices
+from app.models.plans import PostPlans
+from app.services.cache.post_detail import invalidate_post_detail_on_commit
+from uuid import UUID
+from typing import Dict, List
 
 def create_price(db: Session, price_data) -> Prices:
     """
@@ -8,4 +13,44 @@ def create_price(db: Session, price_data) -> Prices:
     db_price = Prices(**price_data)
     db.add(db_price)
     db.flush()
-    return db_price
\ No newline at end of file
+
+    # プランに紐づく投稿の詳細キャッシュを破棄
+    post_ids = db.query(PostPlans.post_id).filter(PostPlans.plan_id == db_price.plan_id).all()
+    for (post_id,) in post_ids:
+        invalidate_post_detail_on_commit(db, post_id)
+    return db_price
+
+# ========== プランの価格 ==========
+# プランの価格は「最初に登録されたもの」を採用する（売上集計・台帳・管理画面・プラン一覧で共通）
+
+def plan_price_subquery():
+    """
+    プランごとの価格（最初に登録されたもの）のサブクエリ
+
+    Returns:
+        Subquery: plan_id, price
+    """
+    return (
+        select(Prices.plan_id, Prices.price)
+        .distinct(Prices.plan_id)
+        .order_by(Prices.plan_id, Prices.created_at)
+        .subquery()
+    )
+
+def get_plan_prices_by_plan_ids(db: Session, plan_ids: List[UUID]) -> Dict[UUID, Prices]:
+    """
+    プランごとの価格（最初に登録されたもの）を取得
+
+    Returns:
+        Dict[UUID, Prices]: プランIDごとの価格
+    """
+    if not plan_ids:
+        return {}
+    prices = (
+        db.query(Prices)
+        .filter(Prices.plan_id.in_(plan_ids))
+        .distinct(Prices.plan_id)
+        .order_by(Prices.plan_id, Prices.created_at)
+        .all()
+    )
+    return {price.plan_id: price for price in prices}
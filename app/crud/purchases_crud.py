@@ -1,17 +1,18 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy import func, String
+from sqlalchemy import func, update
 from app.models.purchases import Purchases
-from app.models.plans import Plans, PostPlans
+from app.models.plans import Plans
 from app.models.posts import Posts
 from app.models.user import Users
 from app.models.profiles import Profiles
 from app.models.media_assets import MediaAssets
 from app.constants.enums import PlanStatus, MediaAssetKind
 from uuid import UUID
-from typing import List, Dict
+from typing import List, Dict, Set
 from app.models.prices import Prices
 from app.schemas.purchases import SinglePurchaseResponse
+from app.crud import creator_daily_sales_crud, creator_sales_ledger_crud, creator_balances_crud
 from datetime import datetime, date, timedelta
 import os
 
@@ -24,8 +25,44 @@ def create_purchase(db: Session, purchase_data: dict):
     purchase = Purchases(**purchase_data)
     db.add(purchase)
     db.flush()
+    creator_daily_sales_crud.record_purchase_sale(db, purchase.plan_id)
+    entry = creator_sales_ledger_crud.record_purchase_entry(db, purchase.id)
+    if entry:
+        creator_balances_crud.add_pending(db, *entry)
     return purchase
 
+def refund_purchase(db: Session, purchase_id: UUID) -> bool:
+    """
+    購入を返金扱いにする（論理削除し、日別売上・売上台帳・残高から差し引く）
+
+    Returns:
+        bool: 返金した場合 True（存在しない・返金済みの場合 False）
+    """
+    # 論理削除済みでない場合のみ更新することで、同時実行時の二重返金を防ぐ
+    refunded = db.execute(
+        update(Purchases)
+        .where(Purchases.id == purchase_id)
+        .where(Purchases.deleted_at.is_(None))
+        .values(deleted_at=func.now(), updated_at=func.now())
+        .returning(
+            Purchases.plan_id,
+            Purchases.created_at,
+            func.date(Purchases.created_at).label("purchased_on"),
+        )
+    ).first()
+    if not refunded:
+        return False
+
+    # 日別売上は購入日の行から差し引く（再構築時の集計と同じ計上日）
+    creator_daily_sales_crud.record_purchase_sale(
+        db, refunded.plan_id, delta=-1, day=refunded.purchased_on
+    )
+    # 残高は購入日時で確定済みかを判定する（確定済みなら available から即時に差し引く）
+    entry = creator_sales_ledger_crud.record_refund_entry(db, purchase_id)
+    if entry:
+        creator_balances_crud.add_refund(db, *entry, sold_at=refunded.created_at)
+    return True
+
 def get_single_purchases_by_user_id(db: Session, user_id: UUID) -> List[SinglePurchaseResponse]:
     """
     ユーザーが単品購入した商品を取得（plan.type = 1）
@@ -96,23 +133,46 @@ def get_single_purchases_count_by_user_id(db: Session, user_id: UUID) -> int:
         .count()
     )
 
-def get_sales_data_by_creator_id(db: Session, creator_id: UUID, period: str = "today") -> Dict:
+def get_purchased_post_ids(db: Session, user_id: UUID, post_ids: List[UUID]) -> Set[UUID]:
     """
-    クリエイターの売上データを取得
+    指定した投稿のうち、ユーザーが購入済みの投稿IDを取得（1クエリ）
+    """
+    if not post_ids:
+        return set()
+    rows = (
+        db.query(Purchases.post_id)
+        .filter(Purchases.user_id == user_id)
+        .filter(Purchases.post_id.in_(post_ids))
+        .filter(Purchases.deleted_at.is_(None))
+        .distinct()
+        .all()
+    )
+    return {post_id for (post_id,) in rows}
+
+def get_sales_data_by_creator_id(
+    db: Session,
+    creator_id: UUID,
+    period: str = "today",
+    start_date: date | None = None,
+    end_date: date | None = None
+) -> Dict:
+    """
+    クリエイターの売上データを取得（日別売上の集計テーブルから1クエリで集計）
 
     Args:
         db: データベースセッション
         creator_id: クリエイターのユーザーID
         period: 期間（"today", "monthly", "last_5_days"）
+        start_date: 任意期間の開始日（指定時は period より優先）
+        end_date: 任意期間の終了日（省略時は今日）
 
     Returns:
         Dict: 売上データ
     """
     # 期間に応じた日付フィルタを設定
     today = date.today()
-    if period == "today":
-        start_date = today
-        end_date = today
+    if start_date is not None:
+        end_date = end_date or today
     elif period == "monthly":
         # 当月の最初の日から今日まで
         start_date = today.replace(day=1)
@@ -125,161 +185,32 @@ def get_sales_data_by_creator_id(db: Session, creator_id: UUID, period: str = "t
         start_date = today
         end_date = today
 
-    # 総売上を計算（自分の投稿に対する購入）
-    total_sales_query = (
-        db.query(func.sum(Prices.price))
-        .select_from(Purchases)
-        .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
-        .join(PostPlans, Plans.id == PostPlans.plan_id)
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(
-            Posts.creator_user_id == creator_id,
-            Purchases.deleted_at.is_(None),
-            Plans.deleted_at.is_(None)
-        )
-    )
-    total_sales = total_sales_query.scalar() or 0
-
-    # 期間内の売上
-    period_sales_query = (
-        db.query(func.sum(Prices.price))
-        .select_from(Purchases)
-        .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
-        .join(PostPlans, Plans.id == PostPlans.plan_id)
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(
-            Posts.creator_user_id == creator_id,
-            func.date(Purchases.created_at) >= start_date,
-            func.date(Purchases.created_at) <= end_date,
-            Purchases.deleted_at.is_(None),
-            Plans.deleted_at.is_(None)
-        )
-    )
-    period_sales = period_sales_query.scalar() or 0
-
-    # 期間内の単品売上
-    single_item_sales_query = (
-        db.query(func.sum(Prices.price))
-        .select_from(Purchases)
-        .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
-        .join(PostPlans, Plans.id == PostPlans.plan_id)
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(
-            Posts.creator_user_id == creator_id,
-            Plans.type == PlanStatus.SINGLE,
-            func.date(Purchases.created_at) >= start_date,
-            func.date(Purchases.created_at) <= end_date,
-            Purchases.deleted_at.is_(None),
-            Plans.deleted_at.is_(None)
-        )
-    )
-    single_item_sales = single_item_sales_query.scalar() or 0
-
-    # 期間内のプラン売上
-    plan_sales_query = (
-        db.query(func.sum(Prices.price))
-        .select_from(Purchases)
-        .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
-        .join(PostPlans, Plans.id == PostPlans.plan_id)
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(
-            Posts.creator_user_id == creator_id,
-            Plans.type == PlanStatus.PLAN,
-            func.date(Purchases.created_at) >= start_date,
-            func.date(Purchases.created_at) <= end_date,
-            Purchases.deleted_at.is_(None),
-            Plans.deleted_at.is_(None)
-        )
-    )
-    plan_sales = plan_sales_query.scalar() or 0
+    summary = creator_daily_sales_crud.get_sales_summary(db, creator_id, start_date, end_date)
 
     # 出金可能額（総売上の90%）
-    withdrawable_amount = int(float(total_sales) * 0.9)
+    withdrawable_amount = int(float(summary["total_sales"]) * 0.9)
 
     return {
         "withdrawable_amount": withdrawable_amount,
-        "total_sales": int(total_sales),
-        "period_sales": int(period_sales),
-        "single_item_sales": int(single_item_sales),
-        "plan_sales": int(plan_sales)
+        **summary
     }
 
-def get_sales_transactions_by_creator_id(db: Session, creator_id: UUID, limit: int = 50) -> List[Dict]:
+def get_sales_transactions_by_creator_id(
+    db: Session,
+    creator_id: UUID,
+    limit: int = 50,
+    cursor: tuple[datetime, UUID] | None = None
+) -> List[tuple]:
     """
-    クリエイターの売上履歴を取得
+    クリエイターの売上履歴を取得（売上台帳から新しい順に取得）
 
     Args:
         db: データベースセッション
         creator_id: クリエイターのユーザーID
         limit: 取得件数
+        cursor: 前ページ最後の (created_at, id)
 
     Returns:
-        List[Dict]: 売上履歴
+        List[tuple]: 台帳行と購入者の表示名
     """
-    # 特定クリエイターのPlan IDを取得するサブクエリ
-    creator_plans_subquery = (
-        db.query(Plans.id.label('plan_id'))
-        .select_from(Plans)
-        .join(PostPlans, Plans.id == PostPlans.plan_id)
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(Posts.creator_user_id == creator_id)
-        .distinct()
-        .subquery()
-    )
-
-    # 各Planに対する最初のPostを取得するサブクエリ（文字列としてminを取得）
-    post_subquery = (
-        db.query(
-            PostPlans.plan_id,
-            func.min(func.cast(Posts.id, String)).label('first_post_id')
-        )
-        .join(Posts, PostPlans.post_id == Posts.id)
-        .filter(Posts.creator_user_id == creator_id)
-        .group_by(PostPlans.plan_id)
-        .subquery()
-    )
-
-    transactions = (
-        db.query(
-            Purchases.id,
-            Purchases.created_at,
-            Plans.type,
-            Plans.name.label('plan_name'),
-            Posts.description.label('post_title'),
-            Prices.price,
-            Users.profile_name.label('buyer_name'),
-            Profiles.username.label('buyer_username')
-        )
-        .select_from(Purchases)
-        .join(Plans, Purchases.plan_id == Plans.id)
-        .join(Prices, Plans.id == Prices.plan_id)
-        .join(Users, Purchases.user_id == Users.id)
-        .join(Profiles, Users.id == Profiles.user_id)
-        .join(creator_plans_subquery, Plans.id == creator_plans_subquery.c.plan_id)
-        .outerjoin(post_subquery, Plans.id == post_subquery.c.plan_id)
-        .outerjoin(Posts, func.cast(Posts.id, String) == post_subquery.c.first_post_id)
-        .filter(
-            Purchases.deleted_at.is_(None),
-            Plans.deleted_at.is_(None)
-        )
-        .order_by(Purchases.created_at.desc())
-        .limit(limit)
-        .all()
-    )
-
-    result = []
-    for transaction in transactions:
-        result.append({
-            "id": str(transaction.id),
-            "date": transaction.created_at.strftime('%Y/%m/%d'),
-            "type": "single" if transaction.type == PlanStatus.SINGLE else "plan",
-            "title": transaction.plan_name or (transaction.post_title[:50] if transaction.post_title else "無題"),
-            "amount": int(transaction.price or 0),
-            "buyer": transaction.buyer_name or transaction.buyer_username
-        })
-
-    return result
\ No newline at end of file
+    return creator_sales_ledger_crud.get_ledger_entries_by_creator_id(db, creator_id, limit, cursor)
@@ -0,0 +1,175 @@
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, select, delete, desc, literal
+from sqlalchemy.dialects.postgresql import insert
+from app.models.rankings import PostLikeDaily, RankingSnapshots
+from app.models.post_stats import PostStats
+from app.models.posts import Posts
+from app.models.social import Likes
+from app.models.user import Users
+from app.models.profiles import Profiles
+from app.models.media_assets import MediaAssets
+from app.constants.enums import PostStatus, MediaAssetKind, RankingPeriod
+from uuid import UUID
+from datetime import date
+from typing import List, Optional
+
+# エイリアスを定義
+ThumbnailAssets = aliased(MediaAssets)
+
+# 集計期間ごとの対象日数（Noneは全期間）
+# 直近N日間のいいねを取りこぼさないよう、N日前の日付バケットから当日分までを集計する
+RANKING_PERIOD_DAYS = {
+    RankingPeriod.DAILY: 1,
+    RankingPeriod.WEEKLY: 7,
+    RankingPeriod.MONTHLY: 30,
+    RankingPeriod.ALL_TIME: None,
+}
+
+# スナップショットに保存する件数
+RANKING_SNAPSHOT_SIZE = 100
+
+# ========== 日別いいね数 ==========
+
+def update_like_bucket(db: Session, post_id: UUID, day: date | None, delta: int) -> None:
+    """
+    日別いいね数を差分で更新（呼び出し元と同じトランザクションで実行される）
+
+    Args:
+        db (Session): データベースセッション
+        post_id (UUID): 投稿ID
+        day (date | None): いいねの日付（Noneの場合はDBの当日）
+        delta (int): 増減数
+    """
+    if not delta:
+        return
+
+    day_value = day if day is not None else func.current_date()
+    stmt = insert(PostLikeDaily).values(
+        post_id=post_id,
+        day=day_value,
+        likes_count=max(delta, 0),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PostLikeDaily.post_id, PostLikeDaily.day],
+        set_={"likes_count": func.greatest(PostLikeDaily.likes_count + delta, 0)},
+    )
+    db.execute(stmt)
+
+def rebuild_like_buckets(db: Session, since: date | None = None) -> int:
+    """
+    Likes.created_at から日別いいね数を再構築する
+
+    Args:
+        db (Session): データベースセッション
+        since (date | None): この日以降のバケットのみ再構築（Noneの場合は全期間）
+
+    Returns:
+        int: 作成した行数
+    """
+    like_day = func.date(Likes.created_at)
+
+    delete_stmt = delete(PostLikeDaily)
+    source = select(Likes.post_id, like_day, func.count())
+    if since is not None:
+        delete_stmt = delete_stmt.where(PostLikeDaily.day >= since)
+        source = source.where(Likes.created_at >= since)
+    source = source.group_by(Likes.post_id, like_day)
+
+    db.execute(delete_stmt)
+    result = db.execute(
+        insert(PostLikeDaily).from_select(["post_id", "day", "likes_count"], source)
+    )
+    return result.rowcount or 0
+
+def prune_like_buckets(db: Session, before: date) -> int:
+    """
+    集計期間外になった日別いいね数を削除する
+
+    Returns:
+        int: 削除した行数
+    """
+    result = db.execute(delete(PostLikeDaily).where(PostLikeDaily.day < before))
+    return result.rowcount or 0
+
+# ========== ランキングスナップショット ==========
+
+def build_ranking_snapshot(db: Session, period: int, limit: int = RANKING_SNAPSHOT_SIZE) -> int:
+    """
+    集計期間のランキング上位をスナップショットテーブルへ書き込む
+
+    同一トランザクション内で入れ替えるため、読み取り側は常に旧版か新版のどちらかを参照する。
+
+    Returns:
+        int: 書き込んだ件数
+    """
+    days = RANKING_PERIOD_DAYS[period]
+
+    if days is None:
+        likes_sq = (
+            select(
+                PostStats.post_id.label("post_id"),
+                PostStats.likes_count.label("likes_count"),
+            )
+            .where(PostStats.likes_count > 0)
+            .subquery()
+        )
+    else:
+        likes_sq = (
+            select(
+                PostLikeDaily.post_id.label("post_id"),
+                func.sum(PostLikeDaily.likes_count).label("likes_count"),
+            )
+            .where(PostLikeDaily.day >= func.current_date() - days)
+            .group_by(PostLikeDaily.post_id)
+            .subquery()
+        )
+
+    ranked = (
+        select(
+            literal(period).label("period"),
+            func.row_number().over(
+                order_by=(desc(likes_sq.c.likes_count), desc(Posts.created_at))
+            ).label("rank"),
+            Posts.id,
+            likes_sq.c.likes_count,
+        )
+        .join(likes_sq, likes_sq.c.post_id == Posts.id)
+        .where(Posts.status == PostStatus.APPROVED)
+        .where(Posts.deleted_at.is_(None))
+        .order_by(desc(likes_sq.c.likes_count), desc(Posts.created_at))
+        .limit(limit)
+    )
+
+    db.execute(delete(RankingSnapshots).where(RankingSnapshots.period == period))
+    result = db.execute(
+        insert(RankingSnapshots).from_select(
+            ["period", "rank", "post_id", "likes_count"], ranked
+        )
+    )
+    return result.rowcount or 0
+
+def get_ranking_snapshot(db: Session, period: int, limit: Optional[int] = None) -> List[tuple]:
+    """
+    スナップショットからランキングを取得（カード表示用）
+    """
+    query = (
+        db.query(
+            Posts,
+            RankingSnapshots.rank,
+            RankingSnapshots.likes_count,
+            Users.profile_name,
+            Profiles.username,
+            Profiles.avatar_url,
+            ThumbnailAssets.storage_key.label('thumbnail_key')
+        )
+        .select_from(RankingSnapshots)
+        .join(Posts, RankingSnapshots.post_id == Posts.id)
+        .join(Users, Posts.creator_user_id == Users.id)
+        .join(Profiles, Users.id == Profiles.user_id)
+        .outerjoin(ThumbnailAssets, (Posts.id == ThumbnailAssets.post_id) & (ThumbnailAssets.kind == MediaAssetKind.THUMBNAIL))
+        .filter(RankingSnapshots.period == period)
+        .order_by(RankingSnapshots.rank)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
@@ -1,14 +1,17 @@
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, tuple_
 from app.models.categories import Categories
 from app.models.post_categories import PostCategories
 from app.models.posts import Posts
-from app.models.social import Likes, Follows
+from app.models.social import Follows
 from app.models.user import Users
 from app.models.profiles import Profiles
 from app.models.media_assets import MediaAssets
 from app.models.media_renditions import MediaRenditions
+from app.models.post_stats import PostStats
 from app.constants.enums import AccountType, MediaAssetKind, PostStatus
+from datetime import datetime
+from uuid import UUID
 
 # エイリアスを定義
 ThumbnailAssets = aliased(MediaAssets)
@@ -40,14 +43,14 @@ def get_ranking_posts(db: Session, limit: int = 5):
     return (
         db.query(
             Posts,
-            func.count(Likes.post_id).label('likes_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
             Users.profile_name,
             Profiles.username,
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             MediaRenditions.duration_sec.label('duration_sec')
         )
-        .outerjoin(Likes, Posts.id == Likes.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         # サムネイル用のMediaAssets（kind=2）
@@ -63,7 +66,8 @@ def get_ranking_posts(db: Session, limit: int = 5):
             Profiles.username, 
             Profiles.avatar_url, 
             ThumbnailAssets.storage_key, 
-            MediaRenditions.duration_sec
+            MediaRenditions.duration_sec,
+            PostStats.likes_count
         )
         .order_by(desc('likes_count'))
         .limit(limit)
@@ -112,10 +116,25 @@ def get_new_creators(db: Session, limit: int = 5):
     )
 
 
-def get_recent_posts(db: Session, limit: int = 50):
+def get_recent_posts(db: Session, limit: int = 50, cursor: tuple[datetime, UUID] | None = None):
     """
-    最新の投稿を取得（いいね数も含む）
+    最新の投稿を取得（いいね数も含む、(created_at, id) のキーセットページネーション）
+
+    先に最新の投稿IDを limit 件に絞り込み、その投稿にだけ表示用の情報を結合する。
     """
+    latest = (
+        db.query(Posts.id.label('post_id'))
+        .filter(Posts.status == PostStatus.APPROVED)
+        .filter(Posts.deleted_at.is_(None))
+    )
+    if cursor is not None:
+        latest = latest.filter(tuple_(Posts.created_at, Posts.id) < tuple_(*cursor))
+    latest = (
+        latest
+        .order_by(desc(Posts.created_at), desc(Posts.id))
+        .limit(limit)
+        .subquery()
+    )
     return (
         db.query(
             Posts,
@@ -124,8 +143,10 @@ def get_recent_posts(db: Session, limit: int = 50):
             Profiles.avatar_url,
             ThumbnailAssets.storage_key.label('thumbnail_key'),
             MediaRenditions.duration_sec.label('duration_sec'),
-            func.count(Likes.post_id).label('likes_count')
+            func.coalesce(PostStats.likes_count, 0).label('likes_count')
         )
+        .select_from(latest)
+        .join(Posts, Posts.id == latest.c.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(Profiles, Users.id == Profiles.user_id)
         # サムネイル用のMediaAssets（kind=2）
@@ -134,18 +155,18 @@ def get_recent_posts(db: Session, limit: int = 50):
         .outerjoin(VideoAssets, (Posts.id == VideoAssets.post_id) & (VideoAssets.kind == MediaAssetKind.MAIN_VIDEO))
         # メインビデオのMediaRenditions
         .outerjoin(MediaRenditions, VideoAssets.id == MediaRenditions.asset_id)
-        # いいね数を取得するためのLikesテーブル
-        .outerjoin(Likes, Posts.id == Likes.post_id)
-        .filter(Posts.status == PostStatus.APPROVED)
+        # いいね数は集計テーブルから取得
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .group_by(
             Posts.id,
             Users.profile_name,
             Profiles.username,
             Profiles.avatar_url,
             ThumbnailAssets.storage_key,
-            MediaRenditions.duration_sec
+            MediaRenditions.duration_sec,
+            PostStats.likes_count
         )
-        .order_by(desc(Posts.created_at))
+        .order_by(desc(Posts.created_at), desc(Posts.id))
         .limit(limit)
         .all()
     )
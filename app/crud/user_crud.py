@@ -5,7 +5,7 @@ from app.models.profiles import Profiles
 from app.schemas.user import UserCreate
 from app.core.security import hash_password
 from sqlalchemy import select, desc, func, update
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, lazyload
 from datetime import datetime, timezone
 from uuid import UUID
 from app.constants.enums import (
@@ -17,7 +17,8 @@ from app.models.posts import Posts
 from app.models.plans import Plans, PostPlans
 from app.models.orders import Orders, OrderItems
 from app.models.media_assets import MediaAssets
-from app.models.social import Likes, Follows
+from app.models.social import Follows
+from app.models.post_stats import PostStats
 from app.models.prices import Prices
 from app.constants.enums import PostStatus, MediaAssetKind, PlanStatus
 
@@ -80,16 +81,15 @@ def get_user_profile_by_username(db: Session, username: str) -> dict:
     posts = (
         db.query(
             Posts,
-            func.count(Likes.post_id).label('likes_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
             MediaAssets.storage_key.label('thumbnail_key')
         )
-        .outerjoin(Likes, Posts.id == Likes.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .outerjoin(MediaAssets, (Posts.id == MediaAssets.post_id) & (MediaAssets.kind == MediaAssetKind.THUMBNAIL))
         .filter(Posts.creator_user_id == user.id)
         .filter(Posts.deleted_at.is_(None))
         .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(Posts.id, MediaAssets.storage_key)  # GROUP BY句を追加
         .order_by(desc(Posts.created_at))
         .all()
     )
@@ -113,10 +113,10 @@ def get_user_profile_by_username(db: Session, username: str) -> dict:
     individual_purchases = (
         db.query(
             Posts, 
-            func.count(Likes.post_id).label('likes_count'),
+            func.coalesce(PostStats.likes_count, 0).label('likes_count'),
             MediaAssets.storage_key.label('thumbnail_key')
         )
-        .outerjoin(Likes, Posts.id == Likes.post_id)
+        .outerjoin(PostStats, Posts.id == PostStats.post_id)
         .join(Users, Posts.creator_user_id == Users.id)
         .join(PostPlans, Posts.id == PostPlans.post_id)  # PostPlansテーブルを通じて結合
         .join(Plans, PostPlans.plan_id == Plans.id)  # Plansテーブルと結合
@@ -126,7 +126,7 @@ def get_user_profile_by_username(db: Session, username: str) -> dict:
         .filter(Plans.type == PlanStatus.SINGLE)  # typeが1（SINGLE）のもののみ
         .filter(Plans.deleted_at.is_(None))  # 削除されていないプランのみ
         .filter(Posts.status == PostStatus.APPROVED)
-        .group_by(Posts.id, MediaAssets.storage_key)
+        .group_by(Posts.id, MediaAssets.storage_key, PostStats.likes_count)
         .order_by(desc(Posts.created_at))
         .all()
     )
@@ -159,9 +159,10 @@ def get_user_by_id(db: Session, user_id: str) -> Users:
     Returns:
         Users: ユーザー情報（Profile情報も含む）
     """
+    # 認証のたびに呼ばれるため、selectin の関連（creator_type・genders）は参照時のみ読み込む
     return (
         db.query(Users)
-        .options(joinedload(Users.profile))
+        .options(joinedload(Users.profile), lazyload(Users.creator_type), lazyload(Users.genders))
         .filter(Users.id == user_id)
         .first()
     )
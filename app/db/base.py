@@ -1,16 +1,60 @@
+from fastapi import Request
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.core.cookies import RECENT_WRITE_COOKIE, RECENT_WRITE_HEADER
+from app.db.pool_stats import InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+from app.db.query_stats import install_query_hooks
 
 # DB接続用URL（.envから取得）
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# エンジン作成
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+# プール設定（同期・非同期エンジン共通）
+ENGINE_OPTIONS = dict(
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SEC,
+    pool_recycle=settings.DB_POOL_RECYCLE_SEC,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
+
+# エンジン作成（アプリ全体でこのエンジンを共有する）
+engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, **ENGINE_OPTIONS)
 
 # セッション作成
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 非同期エンジン・セッション作成（async def のエンドポイント用、asyncpg）
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+    **ENGINE_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 読み取り専用レプリカ（未設定の場合はプライマリのエンジンを共有する）
+if settings.HAS_READ_REPLICA:
+    read_engine = create_engine(settings.READ_DATABASE_URL, poolclass=InstrumentedQueuePool, **ENGINE_OPTIONS)
+    async_read_engine = create_async_engine(
+        settings.ASYNC_READ_DATABASE_URL,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+        **ENGINE_OPTIONS,
+    )
+else:
+    read_engine = engine
+    async_read_engine = async_engine
+# リクエストごとのSQL件数・時間の計測（app/middlewares/sql_timing.py で集計）
+if settings.SQL_TIMING_ENABLED:
+    for _engine in (engine, async_engine.sync_engine, read_engine, async_read_engine.sync_engine):
+        install_query_hooks(_engine)
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
 # Naming convention helps Alembic autogenerate sensible constraint names
 NAMING_CONVENTION = {
     "ix": "ix_%(column_0_label)s",
@@ -34,3 +78,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# FastAPI用の非同期DB依存関数
+# 既存の同期CRUDは `await db.run_sync(crud_func, ...)` で呼び出すと、
+# DBの待ち時間中にイベントループをブロックしない
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _pinned_to_primary(request: Request) -> bool:
+    """直前に書き込みを行ったクライアントかどうか（Cookie またはヘッダー）"""
+    return bool(request.cookies.get(RECENT_WRITE_COOKIE) or request.headers.get(RECENT_WRITE_HEADER))
+
+
+# FastAPI用の読み取り専用DB依存関数（カタログ系の参照エンドポイント用）
+def get_read_db(request: Request):
+    db = SessionLocal() if _pinned_to_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    session_factory = AsyncSessionLocal if _pinned_to_primary(request) else AsyncReadSessionLocal
+    async with session_factory() as db:
+        yield db
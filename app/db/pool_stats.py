@@ -0,0 +1,90 @@
+# app/db/pool_stats.py
+from __future__ import annotations
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolStats:
+    """
+    コネクションプールの取得回数・待ち時間・タイムアウト・オーバーフローの累計
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_sec = 0.0
+        self.max_wait_sec = 0.0
+        self.max_overflow_used = 0
+
+    def record(self, wait_sec: float, overflow: int, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_sec += wait_sec
+            self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+            self.max_overflow_used = max(self.max_overflow_used, overflow)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_sec / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_sec * 1000, 3),
+                "max_overflow_used": self.max_overflow_used,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    connect()（プールからの取得）に掛かった時間を PoolStats に記録する
+
+    recreate() でプールが作り直された場合は統計もリセットされる。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, self.overflow(), timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start, max(self.overflow(), 0))
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool) -> Dict[str, Any]:
+    """
+    プールの現在の状態と累計統計を返す
+    """
+    status: Dict[str, Any] = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "timeout_sec": pool.timeout(),
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
@@ -0,0 +1,86 @@
+# app/db/query_stats.py
+from __future__ import annotations
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# バインドパラメータ・リテラルを除いてSQLを比較する
+_PARAM_RE = re.compile(r"%\(\w+\)s|\$\d+|'(?:[^']|'')*'|\b\d+\b")
+_PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    同じ形のSQLを同一視するため、パラメータ・数値・空白を正規化する
+    """
+    normalized = _PARAM_RE.sub("?", statement)
+    normalized = _PARAM_LIST_RE.sub("?", normalized)
+    return _SPACE_RE.sub(" ", normalized).strip()
+
+
+class RequestQueryStats:
+    """
+    1リクエスト内で実行されたSQLの件数・合計時間・正規化済みSQLごとの件数
+
+    スレッドプールで並行に読み込む処理からも記録されるためロックで保護する。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_sec = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed_sec: float) -> None:
+        normalized = normalize_statement(statement)
+        with self._lock:
+            self.count += 1
+            self.total_sec += elapsed_sec
+            self.statements[normalized] += 1
+
+    def repeated_statements(self, threshold: int) -> List[Dict[str, Any]]:
+        """
+        threshold 回を超えて実行された同一形のSQL（N+1 の疑い）
+        """
+        with self._lock:
+            return [
+                {"statement": statement[:200], "count": count}
+                for statement, count in self.statements.most_common()
+                if count > threshold
+            ]
+
+
+# 現在のリクエストの集計（リクエスト外の実行では None）
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_query_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_query_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """
+    エンジンにSQL計測用のイベントフックを登録する（非同期エンジンは sync_engine を渡す）
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,8 +1,2 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
-
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 互換用: エンジン・セッションは app.db.base の1つを共有する
+from app.db.base import SQLALCHEMY_DATABASE_URL, engine, SessionLocal  # noqa: F401
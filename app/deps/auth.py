@@ -1,11 +1,13 @@
 # app/deps/auth.py
 from fastapi import Depends, HTTPException, status, Cookie, Header
 from sqlalchemy.orm import Session
-from app.db.base import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import get_db, get_async_db
 from app.core.security import decode_token
 from app.core.cookies import ACCESS_COOKIE
 from app.models.user import Users
 from app.crud.user_crud import get_user_by_id
+from uuid import UUID
 import time, os, jwt
 
 def get_current_user(
@@ -26,6 +28,29 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="User not found")
     return user
 
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    access_token: str | None = Cookie(default=None, alias=ACCESS_COOKIE),
+):
+    """
+    get_current_user の非同期版（async def のエンドポイント用）
+
+    ユーザーはリクエストの AsyncSession で取得するため、同期プールの接続を使わず、スレッドプールもブロックしない。
+    """
+    if not access_token:
+        raise HTTPException(status_code=401, detail="Missing access token")
+    try:
+        payload = decode_token(access_token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid or expired access token")
+    if payload.get("type") != "access":
+        raise HTTPException(status_code=401, detail="Invalid token type")
+    user_id = payload.get("sub")
+    user = await db.run_sync(get_user_by_id, user_id)
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
 def get_current_user_optional(
     db: Session = Depends(get_db),
     access_token: str | None = Cookie(default=None, alias=ACCESS_COOKIE),
@@ -43,6 +68,25 @@ def get_current_user_optional(
     except Exception:
         return None
 
+def get_current_user_id_optional(
+    access_token: str | None = Cookie(default=None, alias=ACCESS_COOKIE),
+) -> UUID | None:
+    """
+    オプショナル認証（ユーザーIDのみ） - トークンがない・無効な場合はNoneを返す
+
+    DBを参照しないため、閲覧者のIDだけを使うエンドポイントでDB接続を取得しない。
+    ユーザーが存在しない場合もIDを返すため、IDで絞り込む処理（購入判定など）にのみ使う。
+    """
+    if not access_token:
+        return None
+    try:
+        payload = decode_token(access_token)
+        if payload.get("type") != "access":
+            return None
+        return UUID(payload.get("sub"))
+    except Exception:
+        return None
+
 def get_current_admin_user(
     db: Session = Depends(get_db),
     authorization: str = Header(None),
@@ -0,0 +1,45 @@
+"""
+ランキングのスナップショットを作成するジョブ
+
+    python -m app.jobs.build_ranking_snapshots
+    python -m app.jobs.build_ranking_snapshots --rebuild-days 31
+
+cron などから数分おきに実行する。/ranking はこのジョブが書き込んだ
+ranking_snapshots のみを参照するため、いいね数に関わらず応答時間は一定になる。
+"""
+import argparse
+from datetime import date, timedelta
+
+from app.db.base import SessionLocal
+from app.crud import ranking_crud
+
+
+def run(rebuild_days: int = 0) -> dict:
+    db = SessionLocal()
+    try:
+        # 日別いいね数の補正（いいね時に差分更新しているため通常は不要）
+        if rebuild_days > 0:
+            ranking_crud.rebuild_like_buckets(db, since=date.today() - timedelta(days=rebuild_days))
+
+        # 最長の集計期間より古いバケットは不要
+        max_days = max(d for d in ranking_crud.RANKING_PERIOD_DAYS.values() if d is not None)
+        ranking_crud.prune_like_buckets(db, before=date.today() - timedelta(days=max_days + 1))
+
+        written = {}
+        for period in ranking_crud.RANKING_PERIOD_DAYS:
+            written[period] = ranking_crud.build_ranking_snapshot(db, period)
+        db.commit()
+        return written
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild-days", type=int, default=0, help="日別いいね数を再構築する日数")
+    args = parser.parse_args()
+    written = run(rebuild_days=args.rebuild_days)
+    print(f"ranking snapshots built: {written}")
@@ -0,0 +1,152 @@
+"""
+画像派生ジョブ（media_rendition_jobs.kind = IMAGE_VARIANTS）を実行するワーカー
+
+    python -m app.jobs.process_image_jobs
+    python -m app.jobs.process_image_jobs --loop --cpu-workers 4 --io-workers 16
+
+/transcodes/transcode_mc はジョブを登録してすぐに応答し、画像の取得・変換・保存はこのワーカーが行う。
+投稿の画像ジョブがすべて完了した時点で投稿を承認済みにする。
+同じクリエイターの同じ内容（SHA-256）の画像が処理済みの場合は、その派生画像を再利用する。
+"""
+import argparse
+import time
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.db.base import SessionLocal
+from app.constants.enums import MediaRenditionJobStatus, MediaRenditionKind, PostStatus
+from app.crud import media_rendition_jobs_crud
+from app.crud.media_rendition_crud import (
+    create_media_renditions,
+    get_reusable_image_renditions,
+    rendition_copy_data,
+)
+from app.crud.media_assets_crud import set_media_asset_hash
+from app.crud.post_crud import update_post_status
+from app.services.s3.image_pipeline import run_image_job
+
+# エラーメッセージの保存上限
+ERROR_MESSAGE_MAX_LEN = 1000
+
+
+def _find_reusable_renditions(asset_id, creator_user_id, hash_sha256: bytes) -> list:
+    """処理済みの同一画像の派生画像を取得する（ワーカースレッドから呼ばれるため専用のセッションを使う）"""
+    db = SessionLocal()
+    try:
+        return [
+            rendition_copy_data(rendition, asset_id)
+            for rendition in get_reusable_image_renditions(db, asset_id, creator_user_id, hash_sha256)
+        ]
+    finally:
+        db.close()
+
+
+def _run_batch(db, jobs, cpu_pool, io_pool, task_pool) -> dict:
+    counts = {"completed": 0, "reused": 0, "failed": 0, "approved": 0}
+    futures = {
+        io_pool.submit(
+            run_image_job,
+            str(job.creator_user_id),
+            str(job.post_id),
+            job.input_key,
+            cpu_pool,
+            task_pool,
+            partial(_find_reusable_renditions, job.asset_id, job.creator_user_id),
+        ): job
+        for job in jobs
+    }
+
+    # 終わったものから順に記録する（1件の失敗で他のジョブを巻き戻さない）
+    for future in as_completed(futures):
+        job = futures[future]
+        try:
+            result = future.result()
+            renditions = result["renditions"]
+            set_media_asset_hash(db, job.asset_id, result["hash_sha256"])
+            create_media_renditions(db, [
+                {"asset_id": job.asset_id, "kind": MediaRenditionKind.FFMPEG, **rendition}
+                for rendition in renditions
+            ])
+            media_rendition_jobs_crud.finish_media_rendition_job(
+                db, job.id, MediaRenditionJobStatus.COMPLETE,
+                output_key=renditions[0]["storage_key"],
+                extra={"reused": True} if result["reused"] else None,
+            )
+            db.commit()
+            counts["reused" if result["reused"] else "completed"] += 1
+        except Exception as e:
+            db.rollback()
+            print(f"画像派生ジョブにてエラーが発生しました。({job.id}): {e}")
+            media_rendition_jobs_crud.finish_media_rendition_job(
+                db, job.id, MediaRenditionJobStatus.FAILED, error_message=str(e)[:ERROR_MESSAGE_MAX_LEN],
+            )
+            db.commit()
+            counts["failed"] += 1
+
+    # 画像ジョブがすべて完了した投稿を承認済みにする
+    for post_id in {job.post_id for job in jobs}:
+        if media_rendition_jobs_crud.count_unfinished_image_assets(db, post_id) == 0:
+            update_post_status(db, post_id, PostStatus.APPROVED)
+            db.commit()
+            counts["approved"] += 1
+
+    return counts
+
+
+def run(
+    batch_size: int = 20,
+    cpu_workers: Optional[int] = None,
+    io_workers: int = 8,
+    reclaim_after_min: int = 15,
+    loop: bool = False,
+    idle_sec: float = 5.0,
+) -> dict:
+    totals = {"completed": 0, "reused": 0, "failed": 0, "approved": 0}
+    db = SessionLocal()
+    try:
+        with ProcessPoolExecutor(max_workers=cpu_workers) as cpu_pool, \
+                ThreadPoolExecutor(max_workers=io_workers) as io_pool, \
+                ThreadPoolExecutor(max_workers=io_workers * 4) as task_pool:
+            while True:
+                reclaim_before = datetime.now() - timedelta(minutes=reclaim_after_min)
+                jobs = media_rendition_jobs_crud.claim_image_rendition_jobs(db, batch_size, reclaim_before)
+                # 取得したジョブを確定し、他のワーカーから見えるようにする
+                db.commit()
+
+                if not jobs:
+                    if not loop:
+                        break
+                    time.sleep(idle_sec)
+                    continue
+
+                counts = _run_batch(db, jobs, cpu_pool, io_pool, task_pool)
+                for key, value in counts.items():
+                    totals[key] += value
+        return totals
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=20, help="1回に取得するジョブ数")
+    parser.add_argument("--cpu-workers", type=int, default=None, help="画像変換のプロセス数（省略時はCPU数）")
+    parser.add_argument("--io-workers", type=int, default=8, help="同時に処理するアセット数（S3・Rekognition のスレッド数）")
+    parser.add_argument("--reclaim-after-min", type=int, default=15, help="実行中のまま止まったジョブを再取得するまでの分数")
+    parser.add_argument("--loop", action="store_true", help="ジョブを待ち続ける")
+    parser.add_argument("--idle-sec", type=float, default=5.0, help="ジョブがないときの待機秒数（--loop 時）")
+    args = parser.parse_args()
+    totals = run(
+        batch_size=args.batch_size,
+        cpu_workers=args.cpu_workers,
+        io_workers=args.io_workers,
+        reclaim_after_min=args.reclaim_after_min,
+        loop=args.loop,
+        idle_sec=args.idle_sec,
+    )
+    print(f"image jobs processed: {totals}")
@@ -0,0 +1,36 @@
+"""
+creator_daily_sales を購入履歴から再構築するジョブ
+
+    python -m app.jobs.rebuild_creator_daily_sales [--days N]
+
+cron などから定期実行し、日別売上のズレ（購入の取り消し・価格修正など）を補正する。
+--days を指定した場合は直近N日分のみ再構築する。
+"""
+import argparse
+from datetime import date, timedelta
+
+from app.db.base import SessionLocal
+from app.crud.creator_daily_sales_crud import rebuild_creator_daily_sales
+
+
+def run(days: int | None = None) -> int:
+    since = date.today() - timedelta(days=days) if days is not None else None
+    db = SessionLocal()
+    try:
+        rebuilt = rebuild_creator_daily_sales(db, since)
+        db.commit()
+        return rebuilt
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=None, help="直近N日分のみ再構築する")
+    args = parser.parse_args()
+
+    rebuilt = run(args.days)
+    print(f"creator_daily_sales rebuilt: {rebuilt} rows")
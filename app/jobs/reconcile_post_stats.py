@@ -0,0 +1,27 @@
+"""
+post_stats の集計値を元テーブルから再構築するジョブ
+
+    python -m app.jobs.reconcile_post_stats
+
+cron などから定期実行し、カウンタのズレ（手動でのデータ修正など）を補正する。
+"""
+from app.db.base import SessionLocal
+from app.crud.post_stats_crud import reconcile_post_stats
+
+
+def run() -> int:
+    db = SessionLocal()
+    try:
+        updated = reconcile_post_stats(db)
+        db.commit()
+        return updated
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    updated = run()
+    print(f"post_stats reconciled: {updated} rows updated")
@@ -0,0 +1,46 @@
+"""
+未払いの確定済み売上からクリエイターへの支払い（payouts / payout_items）を作成するジョブ
+
+    python -m app.jobs.run_payouts [--until YYYY-MM-DD] [--chunk-size N]
+
+月末などに実行し、--until（省略時は当月1日）より前の売上のうち確定済みのものを支払い対象にする。
+支払い明細は売上台帳（creator_sales_ledger）の行ごとに作成するため、残高と同じく購入と決済完了した注文明細の両方が対象になる。
+確定済み残高（creator_balances.available）を持つクリエイターをID順に chunk_size 人ずつ処理し、チャンクごとにコミットする。
+"""
+import argparse
+from datetime import date, datetime
+
+from app.db.base import SessionLocal
+from app.crud.payouts_crud import get_unpaid_creator_ids, create_payouts_for_creators
+
+
+def run(until: date | None = None, chunk_size: int = 1000) -> int:
+    until = until or date.today().replace(day=1)
+    until_at = datetime.combine(until, datetime.min.time())
+    db = SessionLocal()
+    created = 0
+    last_creator_id = None
+    try:
+        while True:
+            creator_ids = get_unpaid_creator_ids(db, last_creator_id, chunk_size)
+            if not creator_ids:
+                break
+            created += create_payouts_for_creators(db, creator_ids, until_at)
+            db.commit()
+            last_creator_id = creator_ids[-1]
+        return created
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--until", type=date.fromisoformat, default=None, help="この日より前の売上を対象にする（YYYY-MM-DD）")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="1トランザクションで処理するクリエイター数")
+    args = parser.parse_args()
+
+    created = run(args.until, args.chunk_size)
+    print(f"payouts created: {created}")
@@ -0,0 +1,44 @@
+"""
+creator_balances の未確定売上（pending）を確定済み（available）へ移すジョブ
+
+    python -m app.jobs.settle_creator_balances [--hold-days N] [--batch-size N]
+
+cron などから日次で実行し、売上から N 日経過した分を確定する。
+クリエイターID順に batch_size 件ずつ処理し、バッチごとにコミットする。
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from app.db.base import SessionLocal
+from app.crud.creator_balances_crud import settle_pending_balances
+
+
+def run(hold_days: int = 7, batch_size: int = 1000) -> int:
+    cutoff = datetime.now() - timedelta(days=hold_days)
+    db = SessionLocal()
+    settled = 0
+    last_creator_id = None
+    try:
+        while True:
+            creator_ids = settle_pending_balances(db, cutoff, last_creator_id, batch_size)
+            if not creator_ids:
+                break
+            db.commit()
+            settled += len(creator_ids)
+            last_creator_id = creator_ids[-1]
+        return settled
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hold-days", type=int, default=7, help="売上から確定までの日数")
+    parser.add_argument("--batch-size", type=int, default=1000, help="1トランザクションで処理するクリエイター数")
+    args = parser.parse_args()
+
+    settled = run(args.hold_days, args.batch_size)
+    print(f"creator_balances settled: {settled} creators")
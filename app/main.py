@@ -4,6 +4,9 @@ from fastapi import Request
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.middlewares.csrf import CSRFMiddleware
+from app.middlewares.read_your_writes import ReadYourWritesMiddleware
+from app.middlewares.sql_timing import SQLTimingMiddleware
+from app.core.config import settings
 from starlette.middleware.sessions import SessionMiddleware
 
 # ========================
@@ -66,6 +69,17 @@ app.add_middleware(
 # ========================
 app.add_middleware(CSRFMiddleware)
 
+# ========================
+# 書き込み直後はプライマリから読む（レプリカ遅延対策）
+# ========================
+app.add_middleware(ReadYourWritesMiddleware)
+
+# ========================
+# SQL計測（Server-Timing ヘッダー・N+1 検出ログ）
+# ========================
+if settings.SQL_TIMING_ENABLED:
+    app.add_middleware(SQLTimingMiddleware)
+
 @app.get("/healthz")
 def healthz():
     return {"ok": True}
@@ -0,0 +1,19 @@
+# app/middlewares/read_your_writes.py
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from app.core.cookies import set_recent_write_cookie
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    書き込みリクエストが成功した場合に recent_write Cookie を付与する
+
+    Cookie の有効期間中は get_read_db / get_async_read_db がプライマリを使うため、
+    レプリカの遅延があっても直前の書き込みを読み取れる。
+    """
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            set_recent_write_cookie(response)
+        return response
@@ -0,0 +1,88 @@
+# app/middlewares/sql_timing.py
+import json
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from app.core.config import settings
+from app.db.query_stats import RequestQueryStats, current_query_stats
+
+# エンドポイント（ルートのパス）ごとのSQL件数の上限（認証ユーザーの取得1件を含む）
+# 件数はデータ量に依存しないこと。超過した場合は over_budget としてログに出す
+# tests/test_query_budgets.py がシードDBで各エンドポイントを呼び出し、上限を超えたら失敗する（追加時はテストにも追加）
+QUERY_BUDGETS = {
+    "/top/": 9,
+    "/ranking/": 4,
+    "/category/": 1,
+    "/categories/genres": 1,
+    "/categories/categories": 1,
+    "/categories/recommended": 1,
+    "/categories/recent": 2,
+    "/creators/list": 3,
+    "/creators/profile": 4,
+    "/users/profile": 8,
+    "/plans/list": 3,
+    "/plans/{plan_id}/posts": 3,
+    "/post/new-arrivals": 1,
+    # 投稿詳細3件（投稿・メディア・派生画像）+ 購入判定（閲覧者はトークンのIDのみ使用）
+    "/post/detail": 4,
+    # 認証 + プロフィール・いいね数・投稿数・残高・いいねした投稿・フォロー数・加入プラン・単品購入数・単品購入
+    "/account/info": 10,
+    "/account/posts": 2,
+    "/account/bookmarks": 2,
+    "/account/likes": 2,
+    "/account/bought": 2,
+    "/social/state": 7,
+    "/purchases/sales": 2,
+    "/purchases/transactions": 2,
+    "/conversations/delusion": 3,
+    "/conversations/delusion/messages": 6,
+    "/admin/dashboard/stats": 8,
+    "/admin/sales": 2,
+    "/admin/conversations/delusion/list": 3,
+}
+
+def route_path(request: Request) -> str:
+    """
+    QUERY_BUDGETS のキー（パスパラメータの値を名前に戻したパス、例: /plans/{plan_id}/posts）
+    """
+    names = {str(value): name for name, value in request.path_params.items()}
+    return "/".join(
+        f"{{{names[segment]}}}" if segment in names else segment
+        for segment in request.url.path.split("/")
+    )
+
+class SQLTimingMiddleware(BaseHTTPMiddleware):
+    """
+    リクエストごとのSQL実行件数・合計時間を集計する
+
+    - Server-Timing ヘッダー（db;dur=ミリ秒;desc="N queries"）で返す
+    - 1行のJSONログを出力し、同一形のSQLが閾値を超えて実行された場合は N+1 の疑いとして含める
+    - QUERY_BUDGETS の上限を超えた場合は over_budget を true にする
+    """
+    async def dispatch(self, request: Request, call_next):
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            current_query_stats.reset(token)
+
+        db_ms = stats.total_sec * 1000
+        response.headers.append("Server-Timing", f'db;dur={db_ms:.1f};desc="{stats.count} queries"')
+
+        if stats.count:
+            n_plus_one = stats.repeated_statements(settings.SQL_N_PLUS_ONE_THRESHOLD)
+            route = route_path(request)
+            budget = QUERY_BUDGETS.get(route)
+            print(json.dumps({
+                "event": "sql_stats",
+                "method": request.method,
+                "path": request.url.path,
+                "route": route,
+                "status": response.status_code,
+                "queries": stats.count,
+                "db_ms": round(db_ms, 1),
+                "budget": budget,
+                "over_budget": budget is not None and stats.count > budget,
+                "n_plus_one": n_plus_one,
+            }, ensure_ascii=False))
+        return response
@@ -32,6 +32,10 @@ from .email_verification_tokens import EmailVerificationTokens
 from .conversations import Conversations
 from .conversation_messages import ConversationMessages
 from .conversation_participants import ConversationParticipants
+from .post_stats import PostStats
+from .rankings import PostLikeDaily, RankingSnapshots
+from .creator_daily_sales import CreatorDailySales
+from .creator_sales_ledger import CreatorSalesLedger
 
 __all__ = [
     "Users", "Profiles", "Creators", "Genres", "Categories", "Posts", "PostCategories",
@@ -41,5 +45,7 @@ __all__ = [
     "Reports", "AuditLogs", "PayoutAccounts", "Payouts", "PayoutItems",
     "CreatorBalances", "Tags", "PostTags", "I18nLanguages", "I18nTexts",
     "CreatorType", "Gender", "Purchases", "PostModerationEvents", "MediaRenditionJobs", "Preregistrations",
-    "EmailVerificationTokens", "Conversations", "ConversationMessages", "ConversationParticipants"
+    "EmailVerificationTokens", "Conversations", "ConversationMessages", "ConversationParticipants",
+    "PostStats", "PostLikeDaily", "RankingSnapshots", "CreatorDailySales",
+    "CreatorSalesLedger"
 ]
@@ -3,7 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -28,4 +28,8 @@ class ConversationMessages(Base):
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
 
     conversation: Mapped["Conversations"] = relationship("Conversations")
-    sender: Mapped["Users"] = relationship("Users")
\ No newline at end of file
+    sender: Mapped["Users"] = relationship("Users")
+
+    __table_args__ = (
+        Index("idx_conversation_messages_conversation_created", "conversation_id", "created_at"),
+    )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from uuid import UUID
+from datetime import datetime, date
+
+from sqlalchemy import ForeignKey, BigInteger, Integer, Date, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from .user import Users
+
+class CreatorDailySales(Base):
+    """クリエイターごとの日別売上（購入作成時に差分で更新される集計テーブル）"""
+    __tablename__ = "creator_daily_sales"
+
+    creator_user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    single_item_sales: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    plan_sales: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    purchases_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+
+    creator: Mapped["Users"] = relationship("Users")
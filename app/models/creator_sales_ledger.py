@@ -0,0 +1,43 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+from uuid import UUID
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, BigInteger, SmallInteger, Text, func, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from .user import Users
+    from .purchases import Purchases
+    from .orders import OrderItems
+
+class CreatorSalesLedger(Base):
+    """クリエイターの売上台帳（購入作成時・注文の決済完了時に1売上1行で追記される。残高・支払いの元になる）"""
+    __tablename__ = "creator_sales_ledger"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    creator_user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    purchase_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("purchases.id", ondelete="SET NULL"), nullable=True)
+    order_item_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("order_items.id", ondelete="SET NULL"), nullable=True)
+    buyer_user_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    type: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+
+    creator: Mapped["Users"] = relationship("Users", foreign_keys=[creator_user_id])
+    buyer: Mapped[Optional["Users"]] = relationship("Users", foreign_keys=[buyer_user_id])
+    purchase: Mapped[Optional["Purchases"]] = relationship("Purchases")
+    order_item: Mapped[Optional["OrderItems"]] = relationship("OrderItems")
+
+    __table_args__ = (
+        Index("idx_creator_sales_ledger_creator_created_id", "creator_user_id", "created_at", "id"),
+        # 注文明細を二重に計上しない
+        Index(
+            "uq_creator_sales_ledger_order_item_id", "order_item_id",
+            unique=True, postgresql_where=text("order_item_id IS NOT NULL"),
+        ),
+    )
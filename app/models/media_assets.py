@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Text, BigInteger, SmallInteger, Integer, func, LargeBinary
+from sqlalchemy import ForeignKey, Text, BigInteger, SmallInteger, Integer, func, LargeBinary, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, NUMERIC
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -34,3 +34,9 @@ class MediaAssets(Base):
     post: Mapped["Posts"] = relationship("Posts", back_populates="media_assets")
     renditions: Mapped[List["MediaRenditions"]] = relationship("MediaRenditions", back_populates="asset")
     rendition_jobs: Mapped[List["MediaRenditionJobs"]] = relationship("MediaRenditionJobs", back_populates="asset")
+
+    __table_args__ = (
+        Index("idx_media_assets_post_kind", "post_id", "kind"),
+        # 同一内容のアセット検索（レンディションの再利用）
+        Index("idx_media_assets_hash_sha256", "hash_sha256", postgresql_where=text("hash_sha256 IS NOT NULL")),
+    )
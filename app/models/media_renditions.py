@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Text, BigInteger, SmallInteger, Integer, func
+from sqlalchemy import ForeignKey, Text, BigInteger, SmallInteger, Integer, func, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, NUMERIC
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -30,3 +30,8 @@ class MediaRenditions(Base):
 
     asset: Mapped["MediaAssets"] = relationship("MediaAssets", back_populates="renditions")
     jobs: Mapped[List["MediaRenditionJobs"]] = relationship("MediaRenditionJobs", back_populates="rendition", foreign_keys="MediaRenditionJobs.rendition_id")
+
+    __table_args__ = (
+        # アセットごとの派生ファイルの取得（一覧のサムネイル・再利用の検索）
+        Index("idx_media_renditions_asset_id", "asset_id"),
+    )
@@ -3,7 +3,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -44,6 +44,10 @@ class OrderItems(Base):
     plan: Mapped[Optional["Plans"]] = relationship("Plans")
     creator: Mapped["Users"] = relationship("Users")
 
+    __table_args__ = (
+        Index("idx_order_items_creator_user_id", "creator_user_id"),
+    )
+
 if TYPE_CHECKING:
     from .user import Users
     from .posts import Posts
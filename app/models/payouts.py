@@ -3,7 +3,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, CHAR
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, CHAR, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -12,6 +12,7 @@ from app.db.base import Base
 if TYPE_CHECKING:
     from .user import Users
     from .orders import OrderItems
+    from .creator_sales_ledger import CreatorSalesLedger
 
 class PayoutAccounts(Base):
     __tablename__ = "payout_accounts"
@@ -42,11 +43,20 @@ class PayoutItems(Base):
 
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     payout_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("payouts.id", ondelete="CASCADE"), nullable=False)
-    order_item_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("order_items.id"), nullable=False)
+    # 支払った売上台帳の行（購入・注文明細・返金）。注文明細の場合は order_item_id も記録する
+    ledger_entry_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("creator_sales_ledger.id"), nullable=True)
+    order_item_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("order_items.id"), nullable=True)
     amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     payout: Mapped["Payouts"] = relationship("Payouts", back_populates="items")
-    order_item: Mapped["OrderItems"] = relationship("OrderItems")
+    ledger_entry: Mapped[Optional["CreatorSalesLedger"]] = relationship("CreatorSalesLedger")
+    order_item: Mapped[Optional["OrderItems"]] = relationship("OrderItems")
+
+    __table_args__ = (
+        # 同じ注文明細・台帳の行を二重に支払わない
+        Index("uq_payout_items_order_item_id", "order_item_id", unique=True),
+        Index("uq_payout_items_ledger_entry_id", "ledger_entry_id", unique=True),
+    )
 
 class CreatorBalances(Base):
     __tablename__ = "creator_balances"
@@ -55,5 +65,7 @@ class CreatorBalances(Base):
     available: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     pending: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     currency: Mapped[str] = mapped_column(CHAR(3), nullable=False, default="JPY")
+    # この日時までの売上は pending から available へ確定済み
+    settled_until: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     creator: Mapped["Users"] = relationship("Users")
@@ -3,7 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, Index, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -37,6 +37,10 @@ class Plans(Base):
 
 class PostPlans(Base):
     __tablename__ = "post_plans"
+    __table_args__ = (
+        # 購入したプランから投稿を引く（主キーは (post_id, plan_id) のため plan_id 単独では使えない）
+        Index("idx_post_plans_plan_id", "plan_id"),
+    )
 
     post_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
     plan_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("plans.id", ondelete="CASCADE"), primary_key=True)
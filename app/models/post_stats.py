@@ -0,0 +1,25 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from uuid import UUID
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, BigInteger, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from .posts import Posts
+
+class PostStats(Base):
+    """投稿ごとのエンゲージメント集計（likes / comments / bookmarks の非正規化カウンタ）"""
+    __tablename__ = "post_stats"
+
+    post_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    likes_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    comments_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    bookmarks_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+
+    post: Mapped["Posts"] = relationship("Posts")
@@ -3,7 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -45,3 +45,9 @@ class Posts(Base):
     moderation_events: Mapped[List["PostModerationEvents"]] = relationship("PostModerationEvents", back_populates="post")
     post_plans: Mapped[List["PostPlans"]] = relationship("PostPlans", back_populates="post")
     pure_purchases: Mapped[List["Purchases"]] = relationship("Purchases", back_populates="post")
+
+    __table_args__ = (
+        Index("idx_posts_created_at_id", "created_at", "id"),
+        Index("idx_posts_status_created_at", "status", "created_at", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_posts_creator_status_created_at", "creator_user_id", "status", "created_at"),
+    )
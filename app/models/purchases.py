@@ -3,7 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, BigInteger, func, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -28,4 +28,8 @@ class Purchases(Base):
     # Relationships
     user: Mapped["Users"] = relationship("Users", back_populates="pure_purchases")
     post: Mapped["Posts"] = relationship("Posts", back_populates="pure_purchases")
-    plan: Mapped["Plans"] = relationship("Plans", back_populates="pure_purchases")
\ No newline at end of file
+    plan: Mapped["Plans"] = relationship("Plans", back_populates="pure_purchases")
+
+    __table_args__ = (
+        Index("idx_purchases_user_post", "user_id", "post_id"),
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from uuid import UUID
+from datetime import datetime, date
+
+from sqlalchemy import ForeignKey, BigInteger, SmallInteger, Integer, Date, func, Index
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from .posts import Posts
+
+class PostLikeDaily(Base):
+    """投稿ごとの日別いいね数（Likes.created_at の日付で集計）"""
+    __tablename__ = "post_like_daily"
+
+    post_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    likes_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+
+    post: Mapped["Posts"] = relationship("Posts")
+
+    __table_args__ = (
+        Index("idx_post_like_daily_day", "day"),
+    )
+
+class RankingSnapshots(Base):
+    """集計期間ごとのランキング上位（定期ジョブで作成）"""
+    __tablename__ = "ranking_snapshots"
+
+    period: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    post_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    likes_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+
+    post: Mapped["Posts"] = relationship("Posts")
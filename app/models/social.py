@@ -3,7 +3,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, SmallInteger, func
+from sqlalchemy import ForeignKey, Text, SmallInteger, func, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -23,6 +23,11 @@ class Follows(Base):
     follower: Mapped["Users"] = relationship("Users", foreign_keys=[follower_user_id])
     creator: Mapped["Users"] = relationship("Users", foreign_keys=[creator_user_id])
 
+    __table_args__ = (
+        # クリエイターのフォロワー一覧・フォロワー数（主キーは follower_user_id 始まり）
+        Index("idx_follows_creator_user_id", "creator_user_id"),
+    )
+
 class Likes(Base):
     __tablename__ = "likes"
 
@@ -33,6 +38,12 @@ class Likes(Base):
     user: Mapped["Users"] = relationship("Users")
     post: Mapped["Posts"] = relationship("Posts")
 
+    __table_args__ = (
+        Index("idx_likes_user_created_post", "user_id", "created_at", "post_id"),
+        # 投稿ごとのいいね数・いいね状態（主キーは user_id 始まり）
+        Index("idx_likes_post_id", "post_id"),
+    )
+
 class Comments(Base):
     __tablename__ = "comments"
 
@@ -60,3 +71,7 @@ class Bookmarks(Base):
 
     user: Mapped["Users"] = relationship("Users")
     post: Mapped["Posts"] = relationship("Posts")
+
+    __table_args__ = (
+        Index("idx_bookmarks_user_created_post", "user_id", "created_at", "post_id"),
+    )
@@ -17,7 +17,7 @@ from app.api.endpoints.admin import (
 )
 
 # Debug routes
-from app.api.endpoints.debug import debug_email
+from app.api.endpoints.debug import debug_email, debug_db
 
 
 # Hook routes
@@ -60,4 +60,5 @@ api_router.include_router(admin_conversations.router, prefix="/admin", tags=["Ad
 api_router.include_router(admin_preregistrations.router, prefix="/admin", tags=["Admin Preregistrations"])
 
 # Debug routes
-api_router.include_router(debug_email.router, prefix="/_debug", tags=["Debug"])
\ No newline at end of file
+api_router.include_router(debug_email.router, prefix="/_debug", tags=["Debug"])
+api_router.include_router(debug_db.router, prefix="/_debug", tags=["Debug"])
\ No newline at end of file
@@ -124,12 +124,15 @@ class PostCardResponse(BaseModel):
 
 class BookmarkedPostsResponse(BaseModel):
     bookmarks: List[PostCardResponse]
+    next_cursor: Optional[str] = None
 
 class LikedPostsListResponse(BaseModel):
     liked_posts: List[PostCardResponse]
+    next_cursor: Optional[str] = None
 
 class BoughtPostsResponse(BaseModel):
     bought_posts: List[PostCardResponse]
+    next_cursor: Optional[str] = None
 
 class AccountPostResponse(BaseModel):
     id: str
@@ -147,4 +150,10 @@ class AccountPostStatusResponse(BaseModel):
     rejected_posts: List[AccountPostResponse] = []
     unpublished_posts: List[AccountPostResponse] = []
     deleted_posts: List[AccountPostResponse] = []
-    approved_posts: List[AccountPostResponse] = []
\ No newline at end of file
+    approved_posts: List[AccountPostResponse] = []
+    # セクション名（pending_posts 等）ごとの次ページのカーソル
+    next_cursors: Dict[str, Optional[str]] = {}
+
+class AccountPostListResponse(BaseModel):
+    posts: List[AccountPostResponse]
+    next_cursor: Optional[str] = None
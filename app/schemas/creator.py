@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 class CreatorCreate(BaseModel):
@@ -35,6 +35,12 @@ class CreatorOut(BaseModel):
     class Config:
         from_attributes = True
 
+class CreatorProfileOut(BaseModel):
+    creator: CreatorOut
+    follower_count: Dict[str, int]
+    likes_count: int
+    posts_count: Dict[str, int]
+
 class IdentityVerificationCreate(BaseModel):
     user_id: UUID
 
@@ -30,6 +30,10 @@ class PostCategoryResponse(BaseModel):
 	username: str
 	creator_avatar_url: Optional[str] = None
 
+class PostCategoryListResponse(BaseModel):
+	posts: List[PostCategoryResponse]
+	next_cursor: Optional[str] = None
+
 class NewArrivalsResponse(BaseModel):
     id: str
     description: str
@@ -38,4 +42,8 @@ class NewArrivalsResponse(BaseModel):
     username: str
     creator_avatar_url: Optional[str] = None
     duration: Optional[str] = None
-    likes_count: int = 0
\ No newline at end of file
+    likes_count: int = 0
+
+class NewArrivalsListResponse(BaseModel):
+    posts: List[NewArrivalsResponse]
+    next_cursor: Optional[str] = None
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Literal, List, Union
+from typing import Literal, List, Union, Optional
+from datetime import datetime
 from app.schemas.commons import PresignResponseItem
 from uuid import UUID
 
@@ -17,6 +18,11 @@ class PostMediaVideoFileSpec(BaseModel):
     kind: VideoKind
     content_type: Literal["video/mp4", "video/webm", "video/quicktime"]
     ext: Literal["mp4", "webm", "mov"]
+    sha256: Optional[str] = Field(
+        None,
+        pattern=r"^[A-Za-z0-9+/]{43}=$",
+        description='動画の SHA-256（Base64）。指定するとアップロード時に S3 が内容を検証し、変換済み動画の再利用に使う',
+    )
 
 class PostMediaImagePresignRequest(BaseModel):
     files: List[PostMediaImageFileSpec] = Field(..., description='例: [{"kind":"ogp","ext":"jpg"}, ...]')
@@ -35,4 +41,21 @@ class PostRequest(BaseModel):
     category_ids: List[str]
     
 class PoseMediaCovertRequest(BaseModel):
-    post_id: UUID
\ No newline at end of file
+    post_id: UUID
+
+class MediaRenditionJobResponse(BaseModel):
+    id: UUID
+    asset_id: UUID
+    kind: int
+    status: int
+    output_key: Optional[str] = None
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class MediaRenditionJobListResponse(BaseModel):
+    post_id: UUID
+    jobs: List[MediaRenditionJobResponse]
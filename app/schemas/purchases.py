@@ -43,4 +43,5 @@ class SalesTransactionResponse(BaseModel):
     buyer: str
 
 class SalesTransactionsListResponse(BaseModel):
-    transactions: list[SalesTransactionResponse]
\ No newline at end of file
+    transactions: list[SalesTransactionResponse]
+    next_cursor: Optional[str] = None
\ No newline at end of file
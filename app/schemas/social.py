@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict
 from uuid import UUID
 from datetime import datetime
 
@@ -67,4 +67,20 @@ class SocialStatsResponse(BaseModel):
     bookmarks_count: int
     is_liked: bool = False
     is_bookmarked: bool = False
-    is_following: bool = False
\ No newline at end of file
+    is_following: bool = False
+
+class PostViewerState(BaseModel):
+    liked: bool = False
+    bookmarked: bool = False
+    purchased: bool = False
+    likes_count: int = 0
+    comments_count: int = 0
+    bookmarks_count: int = 0
+
+class CreatorViewerState(BaseModel):
+    following: bool = False
+    followers_count: int = 0
+
+class ViewerStateResponse(BaseModel):
+    posts: Dict[UUID, PostViewerState]
+    creators: Dict[UUID, CreatorViewerState]
@@ -0,0 +1,53 @@
+# app/services/cache/lru_cache.py
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LRUCache(Generic[T]):
+    """
+    プロセス内の TTL 付き LRU キャッシュ
+
+    - 最大 max_entries 件を保持し、超過時は最も古く参照されたものから破棄する
+    - ttl 秒を過ぎたエントリは未登録として扱う
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._mutex = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        キャッシュから値を取得する（未登録・期限切れの場合はNone）
+        """
+        with self._mutex:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._mutex:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._mutex:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._mutex:
+            self._entries.clear()
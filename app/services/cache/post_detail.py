@@ -0,0 +1,39 @@
+# app/services/cache/post_detail.py
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.cache.lru_cache import LRUCache
+
+# セッションに積んだ破棄対象の投稿IDを保持する session.info のキー
+_PENDING_KEY = "post_detail_cache_invalidations"
+
+# 投稿詳細のうち閲覧者に依存しない部分（投稿IDごと）
+post_detail_cache: LRUCache[Dict[str, Any]] = LRUCache(
+    ttl=settings.POST_DETAIL_CACHE_TTL_SEC,
+    max_entries=settings.POST_DETAIL_CACHE_MAX_ENTRIES,
+)
+
+
+def invalidate_post_detail_on_commit(db: Session, post_id: UUID | str) -> None:
+    """
+    トランザクションのコミット後に投稿詳細のキャッシュを破棄する
+
+    コミット前に破棄すると、並行リクエストが更新前のデータを再キャッシュしうるため、
+    CRUD からはこちらを呼び出す。ロールバックされた場合は何もしない。
+    """
+    db.info.setdefault(_PENDING_KEY, set()).add(str(post_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for post_id in session.info.pop(_PENDING_KEY, ()):
+        post_detail_cache.invalidate(post_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
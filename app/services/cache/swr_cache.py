@@ -0,0 +1,110 @@
+# app/services/cache/swr_cache.py
+from __future__ import annotations
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Entry(Generic[T]):
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: T, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class SWRCache(Generic[T]):
+    """
+    プロセス内の stale-while-revalidate キャッシュ
+
+    - ttl 秒以内: キャッシュをそのまま返す
+    - ttl 超過〜ttl + stale_ttl 秒以内: 古い値を即座に返し、裏で1件だけ再計算する
+    - それ以降 / 未計算: 再計算する（同一キーの同時リクエストは1件の計算結果を待つ）
+
+    再計算はキーごとに同時に1つだけ実行される（single-flight）。
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[Hashable, _Entry[T]] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._refreshing: set = set()
+        self._mutex = threading.Lock()
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        with self._mutex:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def _store(self, key: Hashable, value: T) -> None:
+        now = time.monotonic()
+        self._entries[key] = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+
+    def _load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        lock = self._lock_for(key)
+        with lock:
+            # 待機中に他スレッドが計算済みであればそれを使う
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry.fresh_until:
+                return entry.value
+            value = loader()
+            self._store(key, value)
+            return value
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], T]) -> None:
+        with self._mutex:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _run():
+            try:
+                self._load(key, loader)
+            except Exception as e:
+                # 古い値の配信を継続し、次のリクエストで再試行する
+                print(f"SWRCache refresh error ({key}): {e}")
+            finally:
+                with self._mutex:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_run, daemon=True).start()
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        キャッシュから値を取得する（必要に応じて loader で再計算）
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                return entry.value
+            if now < entry.stale_until:
+                self._refresh_in_background(key, loader)
+                return entry.value
+
+        return self._load(key, loader)
+
+    def peek(self, key: Hashable) -> Optional[T]:
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def mark_stale(self, key: Hashable) -> None:
+        """
+        キャッシュを古い扱いにする（次のリクエストで裏側の再計算が走る）
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.fresh_until = 0.0
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        キャッシュを破棄する（次のリクエストは再計算を待つ）
+        """
+        self._entries.pop(key, None)
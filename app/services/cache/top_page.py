@@ -0,0 +1,21 @@
+# app/services/cache/top_page.py
+from app.core.config import settings
+from app.services.cache.swr_cache import SWRCache
+from app.schemas.top import TopPageResponse
+
+TOP_PAGE_CACHE_KEY = "top"
+
+# トップページ（匿名ユーザー共通）のレスポンスキャッシュ
+top_page_cache: SWRCache[TopPageResponse] = SWRCache(
+    ttl=settings.TOP_PAGE_CACHE_TTL_SEC,
+    stale_ttl=settings.TOP_PAGE_CACHE_STALE_SEC,
+)
+
+
+def mark_top_page_stale() -> None:
+    """
+    トップページのキャッシュを古い扱いにする
+
+    投稿の承認・いいね等、トップページの内容が変わる操作のコミット後に呼び出す。
+    """
+    top_page_cache.mark_stale(TOP_PAGE_CACHE_KEY)
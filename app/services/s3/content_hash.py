@@ -0,0 +1,42 @@
+# app/services/s3/content_hash.py
+import base64
+import hashlib
+from typing import BinaryIO, Optional
+
+from .client import s3_client
+
+def sha256_file(fileobj: BinaryIO) -> bytes:
+    """
+    ファイルの SHA-256 を計算（先頭から分割して読み込み、読み込み位置は先頭に戻す）
+
+    Args:
+        fileobj (BinaryIO): ファイル
+
+    Returns:
+        bytes: ダイジェスト（32バイト）
+    """
+    fileobj.seek(0)
+    digest = hashlib.file_digest(fileobj, "sha256").digest()
+    fileobj.seek(0)
+    return digest
+
+def s3_object_sha256_checksum(bucket: str, key: str) -> Optional[bytes]:
+    """
+    アップロード時に S3 が検証した SHA-256 チェックサムを取得（オブジェクト本体は読み込まない）
+
+    プレサインURLに ChecksumSHA256 を含めた単一 PUT では、S3 が受信した内容と照合してから保存するため、
+    オブジェクト全体の SHA-256 として使える。マルチパートの合成チェックサム（COMPOSITE）は
+    パートごとのハッシュのハッシュのため使わない。
+
+    Args:
+        bucket (str): バケット
+        key (str): キー
+
+    Returns:
+        Optional[bytes]: ダイジェスト（32バイト）。チェックサム付きでアップロードされていない場合は None
+    """
+    head = s3_client().head_object(Bucket=bucket, Key=key, ChecksumMode="ENABLED")
+    checksum = head.get("ChecksumSHA256")
+    if not checksum or head.get("ChecksumType") == "COMPOSITE" or "-" in checksum:
+        return None
+    return base64.b64decode(checksum)
@@ -0,0 +1,132 @@
+# app/services/s3/image_pipeline.py
+"""
+画像派生ジョブの実行処理（app.jobs.process_image_jobs から利用）
+
+- S3 の保存はスレッドプールで並行実行する
+- モデレーションは先に小さな CPU タスクで作る 1080w の JPEG（保存しない）を Bytes で Rekognition に渡す
+  （取り込み元は 15MB を超えうる・WebP は判定できないため）。判定は派生生成と並行して行い、
+  アップロード前に結果を待つ。Rekognition の障害はジョブの失敗にする
+- Pillow のデコード・リサイズ・WebP エンコードは CPU を占有するためプロセスプールで実行する
+- 取り込み元は一時ファイルへ分割ダウンロードし、プロセスプールにはパスのみを渡す
+  （元画像のバイト列をメモリに保持しない・プロセス間でコピーしない）
+- 同じ内容（SHA-256）の処理済みアセットがある場合は、その派生画像を再利用する
+"""
+import tempfile
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Tuple
+
+from fastapi import HTTPException
+
+from app.services.s3.client import MEDIA_BUCKET_NAME, INGEST_BUCKET
+from app.services.s3.keygen import transcode_mc_ffmpeg_key
+from app.services.s3.content_hash import sha256_file
+from app.services.s3.image_screening import (
+    _s3_download_to_file,
+    _s3_put_bytes,
+    _is_supported_magic,
+    _sanitize_and_variants,
+    _moderation_check,
+    _make_variant_keys,
+    IMAGE_VARIANT_SPECS,
+    MODERATION_IMAGE_NAME,
+    MODERATION_IMAGE_SPEC,
+)
+
+
+class ImageJobError(Exception):
+    """ジョブを失敗として記録するエラー（再実行しても結果が変わらないもの）"""
+
+
+def _build(src_path: str, specs: Dict[str, Dict]) -> Dict[str, Tuple[bytes, str]]:
+    """
+    取り込み元から specs の画像を生成する（プロセスプールで実行される）
+
+    HTTPException はプロセス間で受け渡せないため ImageJobError に変換する。
+    """
+    with open(src_path, "rb") as src:
+        if not _is_supported_magic(src.read(12)):
+            raise ImageJobError("Unsupported image format")
+        src.seek(0)
+        try:
+            return _sanitize_and_variants(src, specs)
+        except HTTPException as e:
+            raise ImageJobError(e.detail)
+
+
+def build_moderation_image(src_path: str) -> bytes:
+    """
+    モデレーション用の画像を生成する（プロセスプールで実行される）
+
+    JPEG は 1080w の大きさ付近まで縮小しながらデコードするため、派生画像の生成より軽い。
+    """
+    image_bytes, _ = _build(src_path, {MODERATION_IMAGE_NAME: MODERATION_IMAGE_SPEC})[MODERATION_IMAGE_NAME]
+    return image_bytes
+
+
+def build_image_variants(src_path: str) -> Dict[str, Tuple[bytes, str]]:
+    """
+    保存する派生画像を生成する（プロセスプールで実行される）
+    """
+    return _build(src_path, IMAGE_VARIANT_SPECS)
+
+
+def run_image_job(
+    creator_id: str,
+    post_id: str,
+    input_key: str,
+    cpu_pool: Executor,
+    task_pool: Executor,
+    find_reusable: Callable[[bytes], List[dict]],
+) -> dict:
+    """
+    画像アセット1件の派生画像を生成して S3 に保存する（スレッドプールで実行される）
+
+    find_reusable は内容ハッシュから再利用できる派生画像を返す（なければ空）。
+    再利用する場合はモデレーション・派生生成・アップロードを行わない。
+    モデレーションは派生生成と並行して行い、アップロード前に結果を待つ（NG の画像は保存しない）。
+
+    Returns:
+        dict: hash_sha256 / renditions（storage_key / mime_type / bytes）/ reused
+    """
+    with tempfile.NamedTemporaryFile(prefix="image-job-") as src:
+        # 1) 取り込み元の取得（サイズ上限を超えるものは取得しない）
+        _s3_download_to_file(INGEST_BUCKET, input_key, src)
+        src.flush()
+
+        # 2) 内容ハッシュで処理済みの同一画像を検索
+        hash_sha256 = sha256_file(src)
+        reusable = find_reusable(hash_sha256)
+        if reusable:
+            return {"hash_sha256": hash_sha256, "renditions": reusable, "reused": True}
+
+        # 3) モデレーション用の画像を先に生成し、判定を派生生成と並行して行う（CPU処理はプロセスプールへ）
+        moderation_bytes = cpu_pool.submit(build_moderation_image, src.name).result()
+        moderation = task_pool.submit(_moderation_check, moderation_bytes, 80.0)
+
+        # 4) 正規化＋派生生成
+        variants = cpu_pool.submit(build_image_variants, src.name).result()
+
+    # 5) モデレーションの結果を待つ（アップロード前）
+    mod = moderation.result()
+    if mod["flagged"]:
+        raise ImageJobError(f"Image rejected by moderation: {mod['labels']}")
+
+    # 6) アップロード（派生画像をすべて並行して保存）
+    base_output_key = transcode_mc_ffmpeg_key(creator_id=creator_id, post_id=post_id, ext="jpg")
+    variant_keys = _make_variant_keys(base_output_key)
+    puts = [
+        task_pool.submit(_s3_put_bytes, MEDIA_BUCKET_NAME, variant_keys[filename], bytes_data, ctype)
+        for filename, (bytes_data, ctype) in variants.items()
+    ]
+    for put in puts:
+        put.result()
+
+    renditions = [
+        {
+            "storage_key": variant_keys[filename],
+            "mime_type": ctype,
+            "bytes": len(bytes_data),
+        }
+        for filename, (bytes_data, ctype) in variants.items()
+    ]
+    return {"hash_sha256": hash_sha256, "renditions": renditions, "reused": False}
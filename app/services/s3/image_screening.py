@@ -1,35 +1,67 @@
 from fastapi import HTTPException
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, ExifTags
 import io
-from typing import Dict, Tuple
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+from app.core.config import settings
 from app.services.s3.client import KMS_ALIAS_MEDIA
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 REGION = "ap-northeast-1"
 S3 = boto3.client("s3", region_name=REGION)
 REKOG = boto3.client("rekognition", region_name=REGION)
 
+# 取り込み画像の上限（ファイルサイズ / デコード後の画素数）
+MAX_IMAGE_BYTES = 50 * 1024 * 1024
+MAX_IMAGE_PIXELS = 120_000_000
+Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+
+# S3 転送設定（1転送あたりのメモリは multipart_chunksize * max_concurrency 程度に収まる）
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    io_chunksize=256 * 1024,
+)
+
 # ---- helpers ----
-def _s3_download_bytes(bucket: str, key: str) -> bytes:
+def _s3_download_to_file(bucket: str, key: str, fileobj: BinaryIO, max_bytes: int = MAX_IMAGE_BYTES) -> int:
+    """
+    S3 オブジェクトをファイルへ分割して書き込む（全体をメモリに読み込まない）
+
+    Returns:
+        int: オブジェクトのサイズ
+    """
     try:
-        obj = S3.get_object(Bucket=bucket, Key=key)
-        return obj["Body"].read()
+        size = S3.head_object(Bucket=bucket, Key=key)["ContentLength"]
     except Exception as e:
-        raise HTTPException(500, f"S3 get_object failed: {e}")
+        raise HTTPException(500, f"S3 head_object failed: {e}")
+    if size > max_bytes:
+        raise HTTPException(400, "Image too large")
+
+    try:
+        S3.download_fileobj(bucket, key, fileobj, Config=TRANSFER_CONFIG)
+    except Exception as e:
+        raise HTTPException(500, f"S3 download_fileobj failed: {e}")
+    fileobj.seek(0)
+    return size
 
 def _s3_put_bytes(bucket: str, key: str, data: bytes, content_type: str) -> None:
     try:
-        S3.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=data,
-            ContentType=content_type,
-            CacheControl="public, max-age=31536000, immutable",
-            ServerSideEncryption="aws:kms",
-            SSEKMSKeyId=KMS_ALIAS_MEDIA,
+        S3.upload_fileobj(
+            io.BytesIO(data),
+            bucket,
+            key,
+            ExtraArgs={
+                "ContentType": content_type,
+                "CacheControl": "public, max-age=31536000, immutable",
+                "ServerSideEncryption": "aws:kms",
+                "SSEKMSKeyId": KMS_ALIAS_MEDIA,
+            },
+            Config=TRANSFER_CONFIG,
         )
     except Exception as e:
-        raise HTTPException(500, f"S3 put_object failed: {e}")
+        raise HTTPException(500, f"S3 upload_fileobj failed: {e}")
 
 def _is_supported_magic(img_bytes: bytes) -> bool:
     sig = img_bytes[:12]
@@ -43,64 +75,162 @@ def _is_supported_magic(img_bytes: bytes) -> bool:
     # HEICはpillow-heifが開ける場合があるので厳密魔法は省略
     return False
 
-def _sanitize_and_variants(img_bytes: bytes) -> Dict[str, Tuple[bytes, str]]:
+# 派生画像の設定（上から順に生成し、2件目以降は直前の派生画像から縮小する）
+#   max_size: 収まる最大サイズ（幅, 高さ）。None の辺は制限なし
+#             JPEG は1件目の大きさ付近まで縮小しながらデコードする
+#   cascade:  False の場合は直前の派生画像から縮小せず、元画像から別にデコードする
+#   save:     Pillow の保存オプション（画質・エンコード負荷）
+IMAGE_VARIANT_SPECS: Dict[str, Dict[str, Any]] = {
+    # 既定では元の解像度のまま保存する（IMAGE_ORIGINAL_MAX_SIZE で長辺の上限を設定できる）
+    # 別にデコードするため、他の派生画像は 1080w の大きさ付近まで縮小しながらデコードされる
+    "original.jpg": {
+        "format": "JPEG",
+        "content_type": "image/jpeg",
+        "max_size": (settings.IMAGE_ORIGINAL_MAX_SIZE, settings.IMAGE_ORIGINAL_MAX_SIZE),
+        "cascade": False,
+        "save": {"quality": 85, "optimize": False},
+    },
+    "1080w.webp": {
+        "format": "WEBP",
+        "content_type": "image/webp",
+        "max_size": (1080, None),
+        "save": {"quality": 78, "method": 4},
+    },
+    "thumb.webp": {
+        "format": "WEBP",
+        "content_type": "image/webp",
+        "max_size": (256, 256),
+        "save": {"quality": 75, "method": 4},
+    },
+}
+
+# モデレーション用の画像（保存しない）。Rekognition の Bytes は JPEG / PNG・5MB までのため、
+# 1080w と同じ大きさの JPEG を派生画像とは別に生成する（判定を派生画像の生成と並行して行う）
+MODERATION_IMAGE_NAME = "moderation.jpg"
+MODERATION_IMAGE_SPEC: Dict[str, Any] = {
+    "format": "JPEG",
+    "content_type": "image/jpeg",
+    "max_size": (1080, None),
+    "save": {"quality": 80},
+}
+
+# 縮小時に先に整数倍で間引く比率（LANCZOS の計算量を抑える。Image.thumbnail と同じ値）
+RESIZE_REDUCING_GAP = 2.0
+
+def _fit_size(size: Tuple[int, int], max_size: Tuple[Optional[int], Optional[int]]) -> Tuple[int, int]:
+    width, height = size
+    ratio = min(
+        (limit / current for limit, current in zip(max_size, size) if limit is not None),
+        default=1,
+    )
+    if ratio >= 1:
+        return size
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+def _open_image(src: Union[bytes, str, BinaryIO], max_size: Tuple[Optional[int], Optional[int]]) -> Image.Image:
     """
-    出力:
-      { "original.jpg": (bytes, "image/jpeg"),
-        "1080w.webp":   (bytes, "image/webp"),
-        "thumb.webp":   (bytes, "image/webp") }
+    画像を開いてデコードする（EXIF の回転を適用した RGB 画像を返す）
+
+    JPEG はデコード時に 1/2, 1/4, 1/8 で縮小できるため、max_size を下回らない範囲で縮小しながらデコードする。
     """
+    if isinstance(src, bytes):
+        src = io.BytesIO(src)
+    elif not isinstance(src, str):
+        src.seek(0)
     try:
-        im = Image.open(io.BytesIO(img_bytes))
+        im = Image.open(src)
+    except Image.DecompressionBombError:
+        raise HTTPException(400, "Image too large")
     except Exception:
         # Pillowで開けない（壊れている等）
         raise HTTPException(400, "Unsupported or corrupted image")
 
+    # デコード前にヘッダーの画素数で展開後のメモリ量を制限する
+    if im.width * im.height > MAX_IMAGE_PIXELS:
+        raise HTTPException(400, "Image too large")
+
+    if im.format == "JPEG":
+        # EXIF で90度回転する画像は、回転後の縦横で上限を判定する
+        rotated = im.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8)
+        size = im.size[::-1] if rotated else im.size
+        target = _fit_size(size, max_size)
+        if target != size:
+            im.draft("RGB", target[::-1] if rotated else target)
+
+    try:
+        im.load()
+    except Exception:
+        raise HTTPException(400, "Unsupported or corrupted image")
+
     # EXIFに基づく自動回転 + sRGB化（簡易）
-    im = ImageOps.exif_transpose(im)
-    im = im.convert("RGB")
-
-    # original（再保存JPEG：EXIF除去・圧縮最適化）
-    out_original = io.BytesIO()
-    im.save(out_original, format="JPEG", quality=85, optimize=True)
-    original_bytes = out_original.getvalue()
-
-    # 1080w（横1080px基準のWebP）
-    w_target = 1080
-    im_1080 = im.copy()
-    if im_1080.width > w_target:
-        h = int(im_1080.height * (w_target / im_1080.width))
-        im_1080 = im_1080.resize((w_target, h), Image.LANCZOS)
-    out_1080 = io.BytesIO()
-    im_1080.save(out_1080, format="WEBP", quality=78, method=6)
-    w1080_bytes = out_1080.getvalue()
-
-    # thumb（256pxサムネWebP）
-    im_t = im.copy()
-    im_t.thumbnail((256, 256), Image.LANCZOS)
-    out_thumb = io.BytesIO()
-    im_t.save(out_thumb, format="WEBP", quality=75, method=6)
-    thumb_bytes = out_thumb.getvalue()
+    ImageOps.exif_transpose(im, in_place=True)
+    if im.mode != "RGB":
+        im = im.convert("RGB")
+    return im
 
-    return {
-        "original.jpg": (original_bytes, "image/jpeg"),
-        "1080w.webp":   (w1080_bytes,   "image/webp"),
-        "thumb.webp":   (thumb_bytes,   "image/webp"),
-    }
+def _save_variant(im: Image.Image, spec: Dict[str, Any]) -> Tuple[Image.Image, Tuple[bytes, str]]:
+    """
+    spec の大きさに縮小して保存する
+
+    Returns:
+        (縮小後の画像, (保存したバイト列, Content-Type))
+    """
+    size = _fit_size(im.size, spec["max_size"])
+    if size != im.size:
+        im = im.resize(size, Image.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+
+    # 再保存によりEXIFは除去される
+    out = io.BytesIO()
+    im.save(out, format=spec["format"], **spec["save"])
+    return im, (out.getvalue(), spec["content_type"])
+
+def _sanitize_and_variants(
+    src: Union[bytes, str, BinaryIO],
+    specs: Dict[str, Dict[str, Any]] = IMAGE_VARIANT_SPECS,
+) -> Dict[str, Tuple[bytes, str]]:
+    """
+    出力:
+      { "original.jpg": (bytes, "image/jpeg"),
+        "1080w.webp":   (bytes, "image/webp"),
+        "thumb.webp":   (bytes, "image/webp") }
+
+    src は画像のバイト列・ファイルパス・ファイルオブジェクトのいずれか。
+    cascade が False の派生画像（original.jpg）は元画像から個別にデコードする（上限がなければ元の解像度）。
+    それ以外は1回だけデコードし（JPEG は draft で最大の派生サイズ付近まで縮小しながら）、
+    各派生画像は直前の派生画像から縮小する（元画像のコピーは作らない）。
+    デコードした画像は順に解放するため、元の解像度の画像と縮小した画像を同時には保持しない。
+    """
+    outputs: Dict[str, Tuple[bytes, str]] = {}
+    cascade = {filename: spec for filename, spec in specs.items() if spec.get("cascade", True)}
+
+    for filename, spec in specs.items():
+        if filename not in cascade:
+            im = _open_image(src, spec["max_size"])
+            _, outputs[filename] = _save_variant(im, spec)
+            del im
+
+    if cascade:
+        im = _open_image(src, next(iter(cascade.values()))["max_size"])
+        for filename, spec in cascade.items():
+            im, outputs[filename] = _save_variant(im, spec)
+
+    return {filename: outputs[filename] for filename in specs}
 
 def _moderation_check(img_bytes: bytes, min_conf: float = 80.0) -> Dict:
     """
-    任意: 不適切判定。NGなら {'flagged': True, 'labels': [...]} を返す。
+    不適切判定。NGなら {'flagged': True, 'labels': [...]} を返す。
+
+    img_bytes は JPEG / PNG かつ 5MB 以下（Rekognition の Bytes の制限）。
+    Rekognition の障害時は判定せずに通さないよう、エラーにする。
     """
     try:
         resp = REKOG.detect_moderation_labels(Image={"Bytes": img_bytes})
-        labels = resp.get("ModerationLabels", [])
-        flagged = any(l["Confidence"] >= min_conf for l in labels)
-        return {"flagged": flagged, "labels": labels}
-    except Exception:
-        # Rekognition障害時は通し、ログのみ（必要なら厳格にfailに変更）
-        return {"flagged": False, "labels": []}
-    
+    except Exception as e:
+        raise HTTPException(500, f"Rekognition detect_moderation_labels failed: {e}")
+    labels = resp.get("ModerationLabels", [])
+    flagged = any(l["Confidence"] >= min_conf for l in labels)
+    return {"flagged": flagged, "labels": labels}
+
 def _make_variant_keys(base_key: str) -> dict:
     # "transcode-mc/{creator}/{post}/ffmpeg/{uuid}.ext" -> stem=".../{uuid}"
     stem, _ext = base_key.rsplit(".", 1)
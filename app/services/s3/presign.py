@@ -24,7 +24,8 @@ def presign_put(
     resource: Resource,
     key: str,
     content_type: str,
-    expires_in: int = 300
+    expires_in: int = 300,
+    checksum_sha256: Optional[str] = None,
 ) -> dict:
     """
     Presign upload
@@ -34,6 +35,7 @@ def presign_put(
         key (str): キー
         content_type (str): コンテントタイプ
         expires_in (int): 有効期限
+        checksum_sha256 (Optional[str]): 内容の SHA-256（Base64）。指定すると S3 がアップロード内容と照合する
 
     Returns:
         dict: プレシグネットURL
@@ -55,6 +57,11 @@ def presign_put(
     required_headers["x-amz-server-side-encryption"] = "aws:kms"
     required_headers["x-amz-server-side-encryption-aws-kms-key-id"] = kms_alias
 
+    # 内容が一致しない場合 S3 は保存しない（BadDigest）ため、検証済みのハッシュとして後から取得できる
+    if checksum_sha256:
+        params["ChecksumSHA256"] = checksum_sha256
+        required_headers["x-amz-checksum-sha256"] = checksum_sha256
+
     url = client.generate_presigned_url(
         "put_object",
         Params=params,
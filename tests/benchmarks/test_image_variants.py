@@ -0,0 +1,150 @@
+"""
+派生画像生成（image_screening._sanitize_and_variants）のベンチマーク
+
+    python -m pytest tests/benchmarks --benchmark-only
+    python -m pytest tests/benchmarks --benchmark-only --benchmark-json=bench.json
+
+サンプル画像（写真サイズの JPEG・EXIF 回転付き JPEG・透過 PNG・WebP）ごとに、派生画像1種類のみ・
+original 以外のカスケード（derived）・全種類（all）の生成時間を pytest-benchmark で計測する。
+ピークRSS（生成前からの増加量）は新しいプロセスで1回実行して計測し、extra_info["peak_rss_mb"] に記録する。
+"""
+import io
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from PIL import Image  # noqa: E402
+
+from app.services.s3.image_screening import IMAGE_VARIANT_SPECS, _sanitize_and_variants  # noqa: E402
+
+# サンプル名 → (形式, 幅, 高さ, 保存オプション)
+SAMPLES: Dict[str, Dict[str, Any]] = {
+    "jpeg_40mp": {"format": "JPEG", "size": (7296, 5472), "save": {"quality": 92}},
+    "jpeg_12mp_rotated": {"format": "JPEG", "size": (4032, 3024), "save": {"quality": 90}, "orientation": 6},
+    "png_4mp_rgba": {"format": "PNG", "size": (2048, 2048), "save": {}},
+    "webp_8mp": {"format": "WEBP", "size": (3264, 2448), "save": {"quality": 90}},
+}
+
+# ピークRSSの計測間隔
+RSS_SAMPLE_INTERVAL_SEC = 0.002
+
+# 派生画像1種類のみ（デコード＋縮小＋エンコード）と、original 以外のカスケード・全種類
+VARIANTS = list(IMAGE_VARIANT_SPECS) + ["derived", "all"]
+
+
+def _specs_for(variant: str) -> Dict[str, Dict[str, Any]]:
+    if variant == "all":
+        return IMAGE_VARIANT_SPECS
+    if variant == "derived":
+        return {filename: spec for filename, spec in IMAGE_VARIANT_SPECS.items() if spec.get("cascade", True)}
+    return {variant: IMAGE_VARIANT_SPECS[variant]}
+
+
+def _make_sample(path: str, sample: Dict[str, Any]) -> None:
+    """
+    写真に近いサンプル画像を作成する（ノイズ＋グラデーションで圧縮率を実写に近づける）
+    """
+    width, height = sample["size"]
+    noise = Image.effect_noise((width, height), 48)
+    horizontal = Image.linear_gradient("L").rotate(90).resize((width, height))
+    radial = Image.radial_gradient("L").resize((width, height))
+    im = Image.merge("RGB", (noise, horizontal, radial))
+    if sample["format"] == "PNG":
+        im.putalpha(radial)
+
+    save = dict(sample["save"])
+    if "orientation" in sample:
+        exif = Image.Exif()
+        exif[0x0112] = sample["orientation"]
+        save["exif"] = exif
+    im.save(path, format=sample["format"], **save)
+
+
+def _peak_rss_mb(path: str, variant: str) -> float:
+    """
+    派生画像を1回生成し、生成前からのピークRSSの増加量（MB）を返す（計測用の子プロセスで実行される）
+
+    ru_maxrss はインポート時のピークを含むため、実行中のRSSを別スレッドで短い間隔で取得して最大値を求める。
+    """
+    import psutil
+
+    process = psutil.Process()
+    specs = _specs_for(variant)
+    before = process.memory_info().rss
+    peak = before
+    done = threading.Event()
+
+    def _sample():
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, process.memory_info().rss)
+            time.sleep(RSS_SAMPLE_INTERVAL_SEC)
+
+    sampler = threading.Thread(target=_sample)
+    sampler.start()
+    try:
+        _sanitize_and_variants(path, specs)
+    finally:
+        done.set()
+        sampler.join()
+    peak = max(peak, process.memory_info().rss)
+    return (peak - before) / (1024 * 1024)
+
+
+def _measure_peak_rss_mb(path: str, variant: str) -> float:
+    # 以前の計測のメモリが残らないよう、毎回新しいプロセスで実行する
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(_peak_rss_mb, path, variant).result()
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory) -> Dict[str, str]:
+    directory = tmp_path_factory.mktemp("image-corpus")
+    paths = {}
+    for name, sample in SAMPLES.items():
+        path = directory / f"{name}.{sample['format'].lower()}"
+        _make_sample(str(path), sample)
+        paths[name] = str(path)
+    return paths
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("sample", list(SAMPLES))
+def test_variant_generation(benchmark, corpus, sample, variant):
+    path = corpus[sample]
+    specs = _specs_for(variant)
+
+    benchmark.group = sample
+    outputs = benchmark.pedantic(_sanitize_and_variants, args=(path, specs), rounds=3, iterations=1, warmup_rounds=1)
+    assert list(outputs) == list(specs)
+
+    benchmark.extra_info["peak_rss_mb"] = round(_measure_peak_rss_mb(path, variant), 1)
+
+
+def test_large_jpeg_derived_variants_are_decoded_at_reduced_size(corpus):
+    """
+    original 以外の派生画像は、最大の派生サイズより2倍以上大きい JPEG を draft で縮小しながらデコードする
+    （全画素を展開した画像1枚分のメモリ（Pillow の RGB は1画素4バイト）を使わずに生成できる）
+    """
+    width, height = SAMPLES["jpeg_40mp"]["size"]
+    full_decode_mb = width * height * 4 / (1024 * 1024)
+    peak_mb = _measure_peak_rss_mb(corpus["jpeg_40mp"], "derived")
+    assert peak_mb < full_decode_mb, f"peak {peak_mb:.1f} MB (full decode {full_decode_mb:.1f} MB)"
+
+
+def test_original_keeps_full_resolution(corpus):
+    """
+    original は既定（IMAGE_ORIGINAL_MAX_SIZE 未設定）では縮小せず、元の解像度のまま保存する
+    """
+    original = IMAGE_VARIANT_SPECS["original.jpg"]
+    if original["max_size"] != (None, None):
+        pytest.skip("IMAGE_ORIGINAL_MAX_SIZE is set")
+    outputs = _sanitize_and_variants(corpus["jpeg_40mp"], {"original.jpg": original})
+    with Image.open(io.BytesIO(outputs["original.jpg"][0])) as im:
+        assert im.size == SAMPLES["jpeg_40mp"]["size"]
@@ -0,0 +1,134 @@
+"""
+テスト共通のフィクスチャ
+
+- テスト用DB（<POSTGRES_DB>_test、TEST_POSTGRES_DB で変更可）を作り直し、Alembic で最新まで移行してからシードする
+- アプリの設定はインポート時に読み込まれるため、app をインポートする前に接続先DBを差し替える
+- Postgres に接続できない場合、DBを使うテストはスキップする
+"""
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+os.environ["POSTGRES_DB"] = os.environ.get("TEST_POSTGRES_DB") or f"{os.environ.get('POSTGRES_DB', 'mij')}_test"
+
+
+class StatementCounter:
+    """
+    エンジンのイベントフックで実行されたSQLを記録する
+
+    リクエストはテストとは別スレッド（TestClient のイベントループ）で実行されるため、
+    ContextVar ではなく Engine クラス全体のイベントで記録する。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.statements.append(statement)
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementCounter]:
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    counter = StatementCounter()
+    event.listen(Engine, "before_cursor_execute", counter._record)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter._record)
+
+
+def _recreate_test_database() -> None:
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.engine import make_url
+    from app.core.config import settings
+
+    db_name = settings.POSTGRES_DB
+    if not re.fullmatch(r"\w+", db_name):
+        raise RuntimeError(f"invalid test database name: {db_name}")
+
+    admin_url = make_url(settings.DATABASE_URL).set(database="postgres")
+    admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)'))
+            conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+    finally:
+        admin_engine.dispose()
+
+
+def _migrate_test_database() -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ROOT_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(scope="session")
+def database():
+    """
+    移行済みの空のテスト用DB
+    """
+    try:
+        _recreate_test_database()
+    except Exception as e:
+        pytest.skip(f"Postgres に接続できないためスキップします: {e}")
+    _migrate_test_database()
+
+    from app.db.base import engine, async_engine
+    yield engine
+    engine.dispose()
+    async_engine.sync_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def seeded(database):
+    """
+    シードデータを投入したDB（投入したIDを返す）
+    """
+    from app.db.base import SessionLocal
+    from tests.seed import seed_database
+
+    db = SessionLocal()
+    try:
+        return seed_database(db)
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def client(seeded):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(database):
+    from app.db.base import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
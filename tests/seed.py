@@ -0,0 +1,238 @@
+"""
+テスト用のシードデータ
+
+一覧系のエンドポイントが複数ページ分の行を返すよう、各テーブルに N+1 の検出閾値を超える件数を投入する。
+いいね・ブックマーク・フォロー・購入はアプリと同じ CRUD を通して登録し、集計テーブル（post_stats・日別売上・
+売上台帳・残高・ランキング）も本番と同じ経路で作成する。
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.constants.enums import (
+    AccountType, MediaAssetKind, PlanStatus, PostStatus, PostType,
+    PostVisibility, PriceType,
+)
+from app.crud import bookmarks_crud, conversations_crud, followes_crud, likes_crud, purchases_crud
+from app.jobs import build_ranking_snapshots, reconcile_post_stats
+from app.models.categories import Categories
+from app.models.creators import Creators
+from app.models.media_assets import MediaAssets
+from app.models.plans import Plans, PostPlans
+from app.models.post_categories import PostCategories
+from app.models.posts import Posts
+from app.models.prices import Prices
+from app.models.profiles import Profiles
+from app.models.social import Comments
+from app.models.user import Users
+
+CREATORS = 4
+FANS = 8
+POSTS_PER_CREATOR = 12
+# 投稿者ごとの非公開・審査中の投稿数（/account/posts のステータス別一覧用）
+UNPUBLISHED_PER_CREATOR = 3
+PENDING_PER_CREATOR = 3
+MESSAGES_PER_CONVERSATION = 4
+
+
+def _create_user(db: Session, name: str, role: int) -> Users:
+    user = Users(
+        profile_name=name,
+        email=f"{name}@example.com",
+        is_email_verified=True,
+        role=role,
+    )
+    db.add(user)
+    db.flush()
+    db.add(Profiles(user_id=user.id, username=name, avatar_url=f"avatars/{name}.jpg", bio=f"{name} bio"))
+    return user
+
+
+def _create_plan(db: Session, creator_id: UUID, plan_type: int, price: int) -> Plans:
+    plan = Plans(
+        creator_user_id=creator_id,
+        name="単品販売" if plan_type == PlanStatus.SINGLE else "月額プラン",
+        description="seed",
+        type=plan_type,
+    )
+    db.add(plan)
+    db.flush()
+    db.add(Prices(
+        plan_id=plan.id,
+        type=PriceType.SINGLE if plan_type == PlanStatus.SINGLE else PriceType.PLAN,
+        currency="JPY",
+        price=price,
+    ))
+    return plan
+
+
+def _create_post(
+    db: Session,
+    creator_id: UUID,
+    index: int,
+    status: int,
+    created_at: datetime,
+    plan_ids: List[UUID],
+    category_ids: List[UUID],
+) -> Posts:
+    post_type = PostType.VIDEO if index % 2 == 0 else PostType.IMAGE
+    post = Posts(
+        creator_user_id=creator_id,
+        description=f"seed post {index}",
+        visibility=PostVisibility.BOTH,
+        post_type=post_type,
+        status=status,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    db.add(post)
+    db.flush()
+
+    prefix = f"seed/{creator_id}/{post.id}"
+    db.add(MediaAssets(
+        post_id=post.id, kind=MediaAssetKind.THUMBNAIL,
+        storage_key=f"{prefix}/thumbnail.jpg", mime_type="image/jpeg", bytes=50_000,
+    ))
+    db.add(MediaAssets(
+        post_id=post.id, kind=MediaAssetKind.OGP,
+        storage_key=f"{prefix}/ogp.jpg", mime_type="image/jpeg", bytes=80_000,
+    ))
+    if post_type == PostType.VIDEO:
+        db.add(MediaAssets(
+            post_id=post.id, kind=MediaAssetKind.MAIN_VIDEO,
+            storage_key=f"{prefix}/main.m3u8", mime_type="application/vnd.apple.mpegurl",
+            bytes=50_000_000, duration_sec=125,
+        ))
+        db.add(MediaAssets(
+            post_id=post.id, kind=MediaAssetKind.SAMPLE_VIDEO,
+            storage_key=f"{prefix}/sample.mp4", mime_type="video/mp4",
+            bytes=5_000_000, duration_sec=15,
+        ))
+    else:
+        for n in range(3):
+            db.add(MediaAssets(
+                post_id=post.id, kind=MediaAssetKind.IMAGES,
+                storage_key=f"{prefix}/image_{n}.jpg", mime_type="image/jpeg", bytes=900_000,
+            ))
+
+    for plan_id in plan_ids:
+        db.add(PostPlans(post_id=post.id, plan_id=plan_id))
+    for category_id in category_ids:
+        db.add(PostCategories(post_id=post.id, category_id=category_id))
+    return post
+
+
+def seed_database(db: Session, scale: int = 1, prefix: str = "seed") -> Dict[str, object]:
+    """
+    シードデータを投入する
+
+    Args:
+        scale: クリエイター・ファン・投稿の件数の倍率（SQL件数がデータ量に依存しないことの確認用）
+        prefix: ユーザー名の接頭辞（同じDBに複数回投入する場合に変える）
+
+    Returns:
+        dict: admin_id / viewer_id（他のクリエイターの投稿をいいね・購入したクリエイター）/ viewer_username /
+              creator_ids / fan_ids / post_ids（公開済み）/ subscription_plan_id（閲覧ユーザーが購入した月額プラン）/
+              category_slug
+    """
+    categories = db.query(Categories).order_by(Categories.sort_order, Categories.slug).limit(3).all()
+    category_ids = [category.id for category in categories]
+    posts_per_creator = POSTS_PER_CREATOR * scale
+
+    admin = _create_user(db, f"{prefix}_admin", AccountType.ADMIN)
+    creators = [_create_user(db, f"{prefix}_creator_{n}", AccountType.CREATOR) for n in range(CREATORS * scale)]
+    fans = [_create_user(db, f"{prefix}_fan_{n}", AccountType.GENERAL_USER) for n in range(FANS * scale)]
+    for creator in creators:
+        db.add(Creators(user_id=creator.id, name=creator.profile_name, tos_accepted_at=datetime.now()))
+
+    now = datetime.now()
+    approved_posts: List[Posts] = []
+    single_plan_by_post: Dict[UUID, UUID] = {}
+    subscription_by_creator: Dict[UUID, UUID] = {}
+    for c, creator in enumerate(creators):
+        subscription = _create_plan(db, creator.id, PlanStatus.PLAN, 980 + c * 100)
+        subscription_by_creator[creator.id] = subscription.id
+        for n in range(posts_per_creator + UNPUBLISHED_PER_CREATOR + PENDING_PER_CREATOR):
+            if n < posts_per_creator:
+                status = PostStatus.APPROVED
+            elif n < posts_per_creator + UNPUBLISHED_PER_CREATOR:
+                status = PostStatus.UNPUBLISHED
+            else:
+                status = PostStatus.PENDING
+            single = _create_plan(db, creator.id, PlanStatus.SINGLE, 300 + n * 10)
+            post = _create_post(
+                db, creator.id, n, status,
+                created_at=now - timedelta(days=n, minutes=c),
+                plan_ids=[subscription.id, single.id],
+                category_ids=[category_ids[(n + c) % len(category_ids)]] if category_ids else [],
+            )
+            if status == PostStatus.APPROVED:
+                approved_posts.append(post)
+                single_plan_by_post[post.id] = single.id
+    db.commit()
+
+    viewer = creators[0]
+    other_posts = [post for post in approved_posts if post.creator_user_id != viewer.id]
+    viewer_posts = [post for post in approved_posts if post.creator_user_id == viewer.id]
+
+    # 閲覧ユーザー（クリエイター0）と各ファンのいいね・ブックマーク・フォロー・購入
+    for user, posts in [(viewer, other_posts)] + [(fan, approved_posts[f::2]) for f, fan in enumerate(fans)]:
+        for post in posts:
+            likes_crud.toggle_like(db, user.id, post.id)
+        for post in posts[::2]:
+            bookmarks_crud.toggle_bookmark(db, user.id, post.id)
+        for creator in creators:
+            followes_crud.toggle_follow(db, user.id, creator.id)
+        for post in posts[::3]:
+            purchases_crud.create_purchase(db, {
+                "user_id": user.id,
+                "post_id": post.id,
+                "plan_id": single_plan_by_post[post.id],
+            })
+        db.commit()
+
+    # 閲覧ユーザーが購入した月額プラン（/plans/{plan_id}/posts 用）
+    subscribed_post = other_posts[0]
+    subscription_plan_id = subscription_by_creator[subscribed_post.creator_user_id]
+    purchases_crud.create_purchase(db, {
+        "user_id": viewer.id,
+        "post_id": subscribed_post.id,
+        "plan_id": subscription_plan_id,
+    })
+    db.commit()
+
+    # 閲覧ユーザーの投稿の売上（/purchases/sales・/purchases/transactions 用）
+    for fan in fans:
+        for post in viewer_posts[:6]:
+            purchases_crud.create_purchase(db, {
+                "user_id": fan.id,
+                "post_id": post.id,
+                "plan_id": single_plan_by_post[post.id],
+            })
+    for post in approved_posts:
+        for fan in fans[:3]:
+            db.add(Comments(post_id=post.id, user_id=fan.id, body="seed comment"))
+    db.commit()
+
+    # 管理人との妄想メッセージ会話
+    for fan in fans:
+        conversation = conversations_crud.get_or_create_delusion_conversation(db, fan.id)
+        for n in range(MESSAGES_PER_CONVERSATION):
+            sender = fan if n % 2 == 0 else admin
+            conversations_crud.create_message(db, conversation.id, sender.id, f"seed message {n}")
+
+    reconcile_post_stats.run()
+    build_ranking_snapshots.run(rebuild_days=30)
+
+    return {
+        "admin_id": admin.id,
+        "viewer_id": viewer.id,
+        "viewer_username": f"{prefix}_creator_0",
+        "creator_ids": [creator.id for creator in creators],
+        "fan_ids": [fan.id for fan in fans],
+        "post_ids": [post.id for post in approved_posts],
+        "subscription_plan_id": subscription_plan_id,
+        "category_slug": categories[0].slug if categories else None,
+    }
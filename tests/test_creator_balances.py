@@ -0,0 +1,94 @@
+"""
+creator_balances の確定処理と返金の回帰テスト
+
+返金した売上の金額が available に残り、支払い対象にならないことを確認する。
+"""
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.constants.enums import PlanStatus
+from app.crud import purchases_crud
+from app.crud.creator_balances_crud import settle_pending_balances
+from app.models.payouts import CreatorBalances
+from app.models.plans import Plans, PostPlans
+from app.models.posts import Posts
+
+
+def _db_now(db: Session) -> datetime:
+    return db.execute(select(func.localtimestamp())).scalar_one()
+
+
+def _settle(db: Session, cutoff: datetime) -> None:
+    last_creator_id = None
+    while True:
+        creator_ids = settle_pending_balances(db, cutoff, last_creator_id)
+        if not creator_ids:
+            return
+        last_creator_id = creator_ids[-1]
+
+
+def _balance(db: Session, creator_id) -> Tuple[int, int]:
+    row = db.execute(
+        select(CreatorBalances.pending, CreatorBalances.available)
+        .where(CreatorBalances.creator_user_id == creator_id)
+    ).one()
+    return row.pending, row.available
+
+
+def _purchase(db: Session, seeded, sold_at: datetime):
+    """
+    ファンがクリエイター1の投稿を単品購入する（計上日時を指定）
+
+    Returns:
+        (購入, クリエイターID, 価格)
+    """
+    post_id, plan_id, creator_id = db.execute(
+        select(PostPlans.post_id, Plans.id, Posts.creator_user_id)
+        .join(Plans, Plans.id == PostPlans.plan_id)
+        .join(Posts, Posts.id == PostPlans.post_id)
+        .where(Posts.creator_user_id == seeded["creator_ids"][1])
+        .where(Plans.type == PlanStatus.SINGLE)
+        .limit(1)
+    ).one()
+    before = _balance(db, creator_id)
+    purchase = purchases_crud.create_purchase(db, {
+        "user_id": seeded["fan_ids"][0],
+        "post_id": post_id,
+        "plan_id": plan_id,
+        "created_at": sold_at,
+        "updated_at": sold_at,
+    })
+    price = _balance(db, creator_id)[0] - before[0]
+    assert price > 0
+    return purchase, creator_id, price
+
+
+def test_refund_of_settled_sale_is_debited_from_available(db, seeded):
+    now = _db_now(db)
+    purchase, creator_id, price = _purchase(db, seeded, now - timedelta(days=10))
+
+    _settle(db, now - timedelta(days=5))
+    pending, available = _balance(db, creator_id)
+
+    assert purchases_crud.refund_purchase(db, purchase.id)
+    assert _balance(db, creator_id) == (pending, available - price)
+
+    # 返金行は次回の確定処理で再度差し引かれない
+    _settle(db, now - timedelta(days=1))
+    assert _balance(db, creator_id) == (pending, available - price)
+
+
+def test_refund_of_unsettled_sale_is_netted_before_settlement(db, seeded):
+    now = _db_now(db)
+    pending, available = _balance(db, seeded["creator_ids"][1])
+    purchase, creator_id, price = _purchase(db, seeded, now - timedelta(days=10))
+
+    assert purchases_crud.refund_purchase(db, purchase.id)
+    assert _balance(db, creator_id) == (pending, available)
+
+    # 返金が確定期限より後でも、売上と相殺されて available に残らない
+    _settle(db, now - timedelta(days=5))
+    assert _balance(db, creator_id) == (pending, available)
@@ -0,0 +1,93 @@
+"""
+支払い（payouts_crud）の回帰テスト
+
+支払いの対象と残高の減算が同じ売上台帳（購入・決済完了した注文明細・返金）から作られることを確認する。
+"""
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.constants.enums import AccountType, OrderStatus
+from app.crud.creator_balances_crud import settle_pending_balances
+from app.crud.orders_crud import complete_order
+from app.crud.payouts_crud import create_payouts_for_creators
+from app.models.orders import Orders, OrderItems
+from app.models.payouts import CreatorBalances, PayoutItems, Payouts
+from tests.seed import _create_user
+
+
+def _db_now(db: Session) -> datetime:
+    return db.execute(select(func.localtimestamp())).scalar_one()
+
+
+def _settle(db: Session, cutoff: datetime) -> None:
+    last_creator_id = None
+    while True:
+        creator_ids = settle_pending_balances(db, cutoff, last_creator_id)
+        if not creator_ids:
+            return
+        last_creator_id = creator_ids[-1]
+
+
+def _create_order(db: Session, buyer_id, creator_id, amounts: List[int]) -> Orders:
+    order = Orders(user_id=buyer_id, total_amount=sum(amounts), currency="JPY", status=OrderStatus.PENDING)
+    db.add(order)
+    db.flush()
+    for amount in amounts:
+        db.add(OrderItems(order_id=order.id, item_type=2, amount=amount, creator_user_id=creator_id))
+    db.flush()
+    return order
+
+
+def _available(db: Session, creator_id) -> int:
+    return db.execute(
+        select(CreatorBalances.available).where(CreatorBalances.creator_user_id == creator_id)
+    ).scalar_one()
+
+
+def _payouts(db: Session, creator_id) -> List[Payouts]:
+    return list(db.execute(select(Payouts).where(Payouts.creator_user_id == creator_id)).scalars())
+
+
+def test_completed_order_items_are_credited_and_paid(db, seeded):
+    creator = _create_user(db, "payout_order_creator", AccountType.CREATOR)
+    buyer_id = seeded["fan_ids"][0]
+    completed = _create_order(db, buyer_id, creator.id, [1000, 500])
+    pending = _create_order(db, buyer_id, creator.id, [700])
+    assert complete_order(db, completed.id)
+    assert not complete_order(db, completed.id)
+
+    now = _db_now(db)
+    _settle(db, now)
+    assert _available(db, creator.id) == 1500
+
+    assert create_payouts_for_creators(db, [creator.id], now + timedelta(days=1)) == 1
+    [payout] = _payouts(db, creator.id)
+    assert payout.amount == 1500
+    paid_order_items = set(db.execute(
+        select(PayoutItems.order_item_id).where(PayoutItems.payout_id == payout.id)
+    ).scalars())
+    assert paid_order_items == {item.id for item in completed.items}
+    assert not paid_order_items & {item.id for item in pending.items}
+    assert _available(db, creator.id) == 0
+
+    # 支払い済みの行は再度支払わない
+    assert create_payouts_for_creators(db, [creator.id], now + timedelta(days=1)) == 0
+
+
+def test_purchase_revenue_is_paid_from_the_ledger(db, seeded):
+    creator_id = seeded["creator_ids"][1]
+    now = _db_now(db)
+    _settle(db, now)
+    available = _available(db, creator_id)
+    assert available > 0
+
+    assert create_payouts_for_creators(db, [creator_id], now + timedelta(days=1)) == 1
+    [payout] = _payouts(db, creator_id)
+    assert payout.amount == available
+    assert _available(db, creator_id) == 0
+    assert db.execute(
+        select(func.count()).where(PayoutItems.payout_id == payout.id).where(PayoutItems.ledger_entry_id.is_(None))
+    ).scalar_one() == 0
@@ -0,0 +1,106 @@
+"""
+投稿詳細（post_crud.get_public_post_detail_by_id・/post/detail）の回帰テスト
+
+画像1枚の投稿と複数枚の投稿（各画像に派生画像あり）で、発行されるSQL件数が変わらないことを確認する。
+閲覧者の購入判定はトークンのユーザーIDで行われることを確認する。
+"""
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.customer.post import _build_public_post_detail
+from app.constants.enums import MediaAssetKind, MediaRenditionKind, PostStatus, PostType, PostVisibility
+from app.core.security import create_access_token
+from app.crud.post_crud import get_public_post_detail_by_id
+from app.models.media_assets import MediaAssets
+from app.models.media_renditions import MediaRenditions
+from app.models.posts import Posts
+from app.models.purchases import Purchases
+from app.services.cache.post_detail import post_detail_cache
+from tests.conftest import count_statements
+
+# 複数枚の投稿の画像数（N+1 の検出閾値より多くする）
+MANY_IMAGES = 12
+# 画像ごとの派生画像の数
+RENDITIONS_PER_IMAGE = 3
+
+
+def _create_image_post(db: Session, creator_id, images: int) -> Posts:
+    now = datetime.now()
+    post = Posts(
+        creator_user_id=creator_id,
+        description=f"{images} images",
+        visibility=PostVisibility.BOTH,
+        post_type=PostType.IMAGE,
+        status=PostStatus.APPROVED,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(post)
+    db.flush()
+
+    prefix = f"test/{creator_id}/{post.id}"
+    db.add(MediaAssets(
+        post_id=post.id, kind=MediaAssetKind.THUMBNAIL,
+        storage_key=f"{prefix}/thumbnail.jpg", mime_type="image/jpeg", bytes=50_000,
+    ))
+    for n in range(images):
+        asset = MediaAssets(
+            post_id=post.id, kind=MediaAssetKind.IMAGES,
+            storage_key=f"{prefix}/image_{n}.jpg", mime_type="image/jpeg", bytes=900_000,
+        )
+        db.add(asset)
+        db.flush()
+        for r in range(RENDITIONS_PER_IMAGE):
+            db.add(MediaRenditions(
+                asset_id=asset.id, kind=MediaRenditionKind.FFMPEG,
+                storage_key=f"{prefix}/image_{n}/{r}.webp", mime_type="image/webp", bytes=100_000,
+                width=1080, height=1080,
+            ))
+    db.flush()
+    return post
+
+
+def _count_detail_statements(db: Session, post_id) -> int:
+    # 作成時のオブジェクトを使わず、DBから読み込ませる
+    db.expire_all()
+    with count_statements() as counter:
+        post_data = get_public_post_detail_by_id(db, str(post_id))
+        _build_public_post_detail(post_data)
+    assert len(post_data["media_assets"]) > 0
+    return counter.count
+
+
+def test_post_detail_query_count_does_not_grow_with_images(db, seeded):
+    creator_id = seeded["creator_ids"][0]
+    single = _create_image_post(db, creator_id, 1)
+    many = _create_image_post(db, creator_id, MANY_IMAGES)
+
+    single_count = _count_detail_statements(db, single.id)
+    many_count = _count_detail_statements(db, many.id)
+    assert single_count == many_count, f"1 image: {single_count} queries, {MANY_IMAGES} images: {many_count} queries"
+
+
+def test_post_detail_purchased_follows_token_viewer(client, seeded, db):
+    viewer_id = seeded["viewer_id"]
+    purchased_post_ids = set(db.execute(
+        select(Purchases.post_id).where(Purchases.user_id == viewer_id)
+    ).scalars())
+    purchased_post_id = next(post_id for post_id in seeded["post_ids"] if post_id in purchased_post_ids)
+    other_post_id = next(post_id for post_id in seeded["post_ids"] if post_id not in purchased_post_ids)
+    post_detail_cache.clear()
+
+    def purchased(post_id, token=None):
+        client.cookies.clear()
+        if token:
+            client.cookies.set("access_token", token)
+        response = client.get("/post/detail", params={"post_id": str(post_id)})
+        assert response.status_code == 200, response.text
+        return response.json()["purchased"]
+
+    viewer_token = create_access_token(str(viewer_id))
+    assert purchased(purchased_post_id, viewer_token)
+    assert not purchased(other_post_id, viewer_token)
+    assert not purchased(purchased_post_id)
+    assert not purchased(purchased_post_id, "invalid-token")
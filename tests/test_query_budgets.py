@@ -0,0 +1,115 @@
+"""
+エンドポイントごとのSQL件数の上限（app.middlewares.sql_timing.QUERY_BUDGETS）の回帰テスト
+
+シードDBに対して各エンドポイントを TestClient で呼び出し、実行されたSQL件数が上限を超えたら失敗させる。
+一覧は N+1 の検出閾値より多い行を返すため、行ごとにSQLを発行すると上限を超える。
+さらに倍の件数のシードを追加した後も、各エンドポイントのSQL件数が変わらないことを確認する。
+"""
+import pytest
+
+from app.core.security import create_access_token
+from app.middlewares.sql_timing import QUERY_BUDGETS
+from app.services.cache.post_detail import post_detail_cache
+from app.services.cache.top_page import top_page_cache, TOP_PAGE_CACHE_KEY
+from tests.conftest import count_statements
+
+# ルート → (パラメータ, 認証ユーザー: None / "viewer" / "fan" / "admin")
+# パラメータはシードデータ（seeded）から組み立て、ルートのパスパラメータ（{plan_id} など）はパスに埋め込む
+BUDGET_REQUESTS = {
+    "/top/": (lambda s: {}, None),
+    "/ranking/": (lambda s: {}, None),
+    "/category/": (lambda s: {"slug": s["category_slug"]}, None),
+    "/categories/genres": (lambda s: {}, None),
+    "/categories/categories": (lambda s: {}, None),
+    "/categories/recommended": (lambda s: {}, None),
+    "/categories/recent": (lambda s: {}, "viewer"),
+    "/creators/list": (lambda s: {}, None),
+    "/creators/profile": (lambda s: {"user_id": str(s["creator_ids"][1])}, None),
+    "/users/profile": (lambda s: {"username": s["viewer_username"]}, None),
+    "/plans/list": (lambda s: {}, "viewer"),
+    "/plans/{plan_id}/posts": (lambda s: {"plan_id": str(s["subscription_plan_id"])}, "viewer"),
+    "/post/new-arrivals": (lambda s: {}, None),
+    "/post/detail": (lambda s: {"post_id": str(s["post_ids"][-1])}, "viewer"),
+    "/account/info": (lambda s: {}, "viewer"),
+    "/account/posts": (lambda s: {}, "viewer"),
+    "/account/bookmarks": (lambda s: {}, "viewer"),
+    "/account/likes": (lambda s: {}, "viewer"),
+    "/account/bought": (lambda s: {}, "viewer"),
+    "/social/state": (
+        lambda s: {
+            "post_ids": [str(post_id) for post_id in s["post_ids"][:20]],
+            "creator_ids": [str(creator_id) for creator_id in s["creator_ids"]],
+        },
+        "viewer",
+    ),
+    "/purchases/sales": (lambda s: {"period": "monthly"}, "viewer"),
+    "/purchases/transactions": (lambda s: {}, "viewer"),
+    "/conversations/delusion": (lambda s: {}, "fan"),
+    "/conversations/delusion/messages": (lambda s: {}, "fan"),
+    "/admin/dashboard/stats": (lambda s: {}, "admin"),
+    "/admin/sales": (lambda s: {"period": "daily"}, "admin"),
+    "/admin/conversations/delusion/list": (lambda s: {}, "admin"),
+}
+
+# 件数の比較用に追加するシードの倍率
+LARGE_SEED_SCALE = 2
+
+
+def _request(client, seeded, route):
+    build_params, auth = BUDGET_REQUESTS[route]
+    client.cookies.clear()
+    headers = {}
+    if auth == "viewer":
+        client.cookies.set("access_token", create_access_token(str(seeded["viewer_id"])))
+    elif auth == "fan":
+        client.cookies.set("access_token", create_access_token(str(seeded["fan_ids"][0])))
+    elif auth == "admin":
+        headers["Authorization"] = f"Bearer {create_access_token(str(seeded['admin_id']))}"
+
+    params = build_params(seeded)
+    path = route
+    for name in list(params):
+        if f"{{{name}}}" in path:
+            path = path.replace(f"{{{name}}}", params.pop(name))
+
+    # キャッシュから返すと件数が0になるため、毎回DBから組み立てさせる
+    top_page_cache.invalidate(TOP_PAGE_CACHE_KEY)
+    post_detail_cache.clear()
+
+    with count_statements() as counter:
+        response = client.get(path, params=params, headers=headers)
+    assert response.status_code == 200, f"{route}: {response.text}"
+    return counter
+
+
+def test_every_budget_has_a_request():
+    assert set(BUDGET_REQUESTS) == set(QUERY_BUDGETS)
+
+
+@pytest.mark.parametrize("route", sorted(QUERY_BUDGETS))
+def test_query_budget(client, seeded, route):
+    counter = _request(client, seeded, route)
+
+    budget = QUERY_BUDGETS[route]
+    assert counter.count <= budget, (
+        f"{route}: {counter.count} queries (budget {budget})\n" + "\n".join(counter.statements)
+    )
+
+
+def test_query_count_does_not_depend_on_data_size(client, seeded):
+    from app.db.base import SessionLocal
+    from tests.seed import seed_database
+
+    counts = {route: _request(client, seeded, route).count for route in QUERY_BUDGETS}
+
+    # 全体の件数と、閲覧ユーザー・ファンごとの件数が倍になるシードを追加する
+    db = SessionLocal()
+    try:
+        large = seed_database(db, scale=LARGE_SEED_SCALE, prefix=f"seed_x{LARGE_SEED_SCALE}")
+    finally:
+        db.close()
+
+    for data in (seeded, large):
+        grown = {route: _request(client, data, route).count for route in QUERY_BUDGETS}
+        changed = {route: (counts[route], grown[route]) for route in counts if grown[route] != counts[route]}
+        assert not changed, f"queries changed with data size (before, after): {changed}"
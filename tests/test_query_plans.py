@@ -0,0 +1,356 @@
+"""
+主要な CRUD クエリの実行計画の回帰テスト
+
+シードDBに本番相当の件数（利用者・投稿・いいね等）を一括投入して ANALYZE し、CRUD 関数を実行して
+発行されたSQLを記録し、同じパラメータで EXPLAIN する（プランナの設定は変更しない）。
+大きなテーブルに Seq Scan が残る場合と、クエリごとに期待するインデックスが条件（Index Cond）付きで
+使われていない場合（インデックス全体の走査を含む）に失敗させる。
+一括投入した行はテスト終了時にロールバックする。
+"""
+import uuid
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.constants.enums import (
+    AccountType, MediaAssetKind, MediaRenditionJobKind, MediaRenditionJobStatus, MediaRenditionKind,
+    PlanStatus, PostStatus, PostVisibility,
+)
+from app.crud import conversations_crud, followes_crud, media_assets_crud, media_rendition_crud, post_crud, top_crud
+from app.models.conversations import Conversations
+from app.models.media_assets import MediaAssets
+from app.models.posts import Posts
+
+# 件数が利用者数・投稿数に比例して増えるテーブル
+LARGE_TABLES = {
+    "posts",
+    "likes",
+    "bookmarks",
+    "follows",
+    "comments",
+    "purchases",
+    "media_assets",
+    "media_renditions",
+    "media_rendition_jobs",
+    "post_plans",
+    "post_categories",
+    "conversation_messages",
+}
+
+# 一括投入する件数（この件数でテーブル全体を読むよりインデックスを使う方が安くなる）
+BULK_USERS = 4000
+BULK_CREATORS = 400
+BULK_POSTS_PER_CREATOR = 50
+BULK_LIKES_PER_USER = 25
+BULK_BOOKMARKS_PER_USER = 10
+BULK_FOLLOWS_PER_USER = 10
+BULK_PURCHASES_PER_USER = 5
+BULK_CONVERSATIONS = 1000
+BULK_MESSAGES_PER_CONVERSATION = 20
+
+# 一括投入のSQL（bulk_users / bulk_posts / bulk_plans は連番で行を組み合わせるための一時テーブル）
+BULK_INSERTS = [
+    """
+    CREATE TEMP TABLE bulk_users ON COMMIT DROP AS
+    SELECT n, gen_random_uuid() AS id FROM generate_series(1, :users) AS n
+    """,
+    """
+    INSERT INTO users (id, email, profile_name, role, status, is_email_verified)
+    SELECT id, 'bulk_' || n || '@example.com', 'bulk_' || n,
+           CASE WHEN n <= :creators THEN :creator_role ELSE :general_role END, 1, true
+    FROM bulk_users
+    """,
+    "INSERT INTO profiles (user_id, username) SELECT id, 'bulk_' || n FROM bulk_users",
+    """
+    CREATE TEMP TABLE bulk_posts ON COMMIT DROP AS
+    SELECT row_number() OVER () AS n, gen_random_uuid() AS id, u.id AS creator_user_id
+    FROM bulk_users u CROSS JOIN generate_series(1, :posts_per_creator)
+    WHERE u.n <= :creators
+    """,
+    """
+    INSERT INTO posts (id, creator_user_id, description, visibility, status, moderation_state, post_type,
+                       created_at, updated_at)
+    SELECT id, creator_user_id, 'bulk post', :visibility,
+           CASE WHEN n % 10 = 0 THEN :unpublished ELSE :approved END, 0, 1 + n % 2,
+           now() - n * interval '1 minute', now() - n * interval '1 minute'
+    FROM bulk_posts
+    """,
+    "INSERT INTO post_stats (post_id) SELECT id FROM bulk_posts",
+    """
+    INSERT INTO media_assets (post_id, kind, storage_key, mime_type, bytes, status, hash_sha256)
+    SELECT p.id, k.kind, 'bulk/' || p.id || '/' || k.kind, 'image/jpeg', 1000, 1,
+           sha256(convert_to(p.id::text || k.kind, 'UTF8'))
+    FROM bulk_posts p CROSS JOIN (VALUES (:ogp), (:thumbnail), (:images)) AS k(kind)
+    """,
+    """
+    INSERT INTO media_renditions (asset_id, kind, storage_key, mime_type, bytes)
+    SELECT id, :rendition_kind, storage_key || '.webp', 'image/webp', 500
+    FROM media_assets WHERE kind = :images AND storage_key LIKE 'bulk/%%'
+    """,
+    """
+    INSERT INTO media_rendition_jobs (asset_id, kind, backend, status, input_key)
+    SELECT id, :job_kind, 1, :job_status, storage_key
+    FROM media_assets WHERE kind = :images AND storage_key LIKE 'bulk/%%'
+    """,
+    """
+    CREATE TEMP TABLE bulk_plans ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS id, id AS creator_user_id FROM bulk_users WHERE n <= :creators
+    """,
+    """
+    INSERT INTO plans (id, creator_user_id, name, type, status)
+    SELECT id, creator_user_id, 'bulk plan', :plan_type, 1 FROM bulk_plans
+    """,
+    """
+    INSERT INTO prices (plan_id, type, currency, status, price)
+    SELECT id, :plan_type, 'JPY', 1, 980 FROM bulk_plans
+    """,
+    """
+    INSERT INTO post_plans (post_id, plan_id)
+    SELECT p.id, pl.id FROM bulk_posts p JOIN bulk_plans pl ON pl.creator_user_id = p.creator_user_id
+    """,
+    """
+    INSERT INTO post_categories (post_id, category_id)
+    SELECT p.id, c.id
+    FROM bulk_posts p
+    JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS i, count(*) OVER () AS total FROM categories) c
+      ON c.i = p.n % c.total
+    """,
+    """
+    INSERT INTO likes (user_id, post_id)
+    SELECT u.id, p.id
+    FROM bulk_users u CROSS JOIN generate_series(0, :likes_per_user - 1) AS k
+    JOIN bulk_posts p ON p.n = 1 + (u.n * 37 + k * 101) % :post_count
+    """,
+    """
+    INSERT INTO bookmarks (user_id, post_id)
+    SELECT u.id, p.id
+    FROM bulk_users u CROSS JOIN generate_series(0, :bookmarks_per_user - 1) AS k
+    JOIN bulk_posts p ON p.n = 1 + (u.n * 41 + k * 103) % :post_count
+    """,
+    """
+    INSERT INTO follows (follower_user_id, creator_user_id)
+    SELECT u.id, c.id
+    FROM bulk_users u CROSS JOIN generate_series(0, :follows_per_user - 1) AS k
+    JOIN bulk_users c ON c.n = 1 + (u.n * 13 + k * 7) % :creators
+    """,
+    """
+    INSERT INTO purchases (user_id, post_id, plan_id)
+    SELECT u.id, p.id, pl.id
+    FROM bulk_users u CROSS JOIN generate_series(0, :purchases_per_user - 1) AS k
+    JOIN bulk_posts p ON p.n = 1 + (u.n * 53 + k * 211) % :post_count
+    JOIN bulk_plans pl ON pl.creator_user_id = p.creator_user_id
+    """,
+    """
+    INSERT INTO comments (post_id, user_id, body, status)
+    SELECT p.id, u.id, 'bulk comment', 1
+    FROM bulk_posts p JOIN bulk_users u ON u.n = 1 + (p.n * 17) % :users
+    """,
+    """
+    CREATE TEMP TABLE bulk_conversations ON COMMIT DROP AS
+    SELECT n, gen_random_uuid() AS id FROM generate_series(1, :conversations) AS n
+    """,
+    "INSERT INTO conversations (id, type, is_active) SELECT id, 4, true FROM bulk_conversations",
+    """
+    INSERT INTO conversation_messages (conversation_id, sender_user_id, type, body_text, moderation)
+    SELECT c.id, u.id, 1, 'bulk message', 1
+    FROM bulk_conversations c CROSS JOIN generate_series(1, :messages_per_conversation) AS k
+    JOIN bulk_users u ON u.n = 1 + (c.n * 31 + k) % :users
+    """,
+]
+
+BULK_PARAMS = {
+    "users": BULK_USERS,
+    "creators": BULK_CREATORS,
+    "posts_per_creator": BULK_POSTS_PER_CREATOR,
+    "post_count": BULK_CREATORS * BULK_POSTS_PER_CREATOR,
+    "likes_per_user": BULK_LIKES_PER_USER,
+    "bookmarks_per_user": BULK_BOOKMARKS_PER_USER,
+    "follows_per_user": BULK_FOLLOWS_PER_USER,
+    "purchases_per_user": BULK_PURCHASES_PER_USER,
+    "conversations": BULK_CONVERSATIONS,
+    "messages_per_conversation": BULK_MESSAGES_PER_CONVERSATION,
+    "creator_role": AccountType.CREATOR,
+    "general_role": AccountType.GENERAL_USER,
+    "visibility": PostVisibility.BOTH,
+    "approved": PostStatus.APPROVED,
+    "unpublished": PostStatus.UNPUBLISHED,
+    "ogp": MediaAssetKind.OGP,
+    "thumbnail": MediaAssetKind.THUMBNAIL,
+    "images": MediaAssetKind.IMAGES,
+    "rendition_kind": MediaRenditionKind.FFMPEG,
+    "job_kind": MediaRenditionJobKind.IMAGE_VARIANTS,
+    "job_status": MediaRenditionJobStatus.COMPLETE,
+    "plan_type": PlanStatus.PLAN,
+}
+
+
+# (名前, CRUD 呼び出し, 条件付きで使われるべきインデックス)
+# CRUD 呼び出しの引数はシードデータ（閲覧ユーザー等）から取るため、一括投入した行の中から選択的に絞り込む
+CRUD_QUERIES: List[Tuple[str, Callable[[Session, dict], object], Set[str]]] = [
+    (
+        # 1ページ目は idx_posts_created_at_id を条件なしで逆順に読んで LIMIT で止まるため、2ページ目以降で確認する
+        "top_crud.get_recent_posts",
+        lambda db, s: top_crud.get_recent_posts(db, limit=20, cursor=s["recent_cursor"]),
+        {"idx_posts_created_at_id"},
+    ),
+    (
+        "post_crud.get_post_status_by_user_id",
+        lambda db, s: post_crud.get_post_status_by_user_id(db, s["viewer_id"]),
+        {"idx_posts_creator_status_created_at"},
+    ),
+    (
+        "post_crud.get_posts_by_status_for_user",
+        lambda db, s: post_crud.get_posts_by_status_for_user(db, s["viewer_id"], PostStatus.APPROVED),
+        {"idx_posts_creator_status_created_at"},
+    ),
+    (
+        "post_crud.is_post_purchased",
+        lambda db, s: post_crud.is_post_purchased(db, s["viewer_id"], s["post_ids"][-1]),
+        {"idx_purchases_user_post"},
+    ),
+    (
+        "post_crud.get_bought_posts_by_user_id",
+        lambda db, s: post_crud.get_bought_posts_by_user_id(db, s["viewer_id"]),
+        {"idx_purchases_user_post", "idx_post_plans_plan_id"},
+    ),
+    (
+        "post_crud.get_liked_posts_list_by_user_id",
+        lambda db, s: post_crud.get_liked_posts_list_by_user_id(db, s["viewer_id"]),
+        {"idx_likes_user_created_post"},
+    ),
+    (
+        "post_crud.get_bookmarked_posts_by_user_id",
+        lambda db, s: post_crud.get_bookmarked_posts_by_user_id(db, s["viewer_id"]),
+        {"idx_bookmarks_user_created_post"},
+    ),
+    (
+        "media_assets_crud.get_media_asset_by_post_id",
+        lambda db, s: media_assets_crud.get_media_asset_by_post_id(db, s["post_ids"][0], MediaAssetKind.THUMBNAIL),
+        {"idx_media_assets_post_kind"},
+    ),
+    (
+        "media_rendition_crud.get_reusable_image_renditions",
+        lambda db, s: media_rendition_crud.get_reusable_image_renditions(
+            db, s["image_asset_id"], s["creator_ids"][0], uuid.uuid4().bytes * 2
+        ),
+        {"idx_media_assets_hash_sha256", "idx_media_renditions_asset_id"},
+    ),
+    (
+        "media_rendition_crud.get_reusable_video_rendition",
+        lambda db, s: media_rendition_crud.get_reusable_video_rendition(
+            db, s["image_asset_id"], s["creator_ids"][0], uuid.uuid4().bytes * 2
+        ),
+        {"idx_media_assets_hash_sha256"},
+    ),
+    (
+        "followes_crud.get_followers_counts",
+        lambda db, s: followes_crud.get_followers_counts(db, s["creator_ids"]),
+        {"idx_follows_creator_user_id"},
+    ),
+    (
+        "followes_crud.get_followers",
+        lambda db, s: followes_crud.get_followers(db, s["creator_ids"][0]),
+        {"idx_follows_creator_user_id"},
+    ),
+    (
+        "conversations_crud.get_messages_by_conversation",
+        lambda db, s: conversations_crud.get_messages_by_conversation(db, s["conversation_id"]),
+        {"idx_conversation_messages_conversation_created"},
+    ),
+]
+
+
+def _capture_statements(db: Session, call: Callable[[], object]) -> List[Tuple[str, object]]:
+    """
+    call の実行中に発行されたSQLとパラメータを記録する
+    """
+    captured = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            captured.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        call()
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+    return captured
+
+
+def _plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _seq_scans(plan: dict) -> List[str]:
+    """
+    実行計画のうち大きなテーブルへの Seq Scan のテーブル名
+    """
+    return [
+        node["Relation Name"] for node in _plan_nodes(plan)
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES
+    ]
+
+
+def _conditioned_indexes(plan: dict) -> Set[str]:
+    """
+    実行計画のうち条件（Index Cond）付きで使われたインデックス名（条件なしの走査はインデックス全体を読むため含めない）
+    """
+    return {node["Index Name"] for node in _plan_nodes(plan) if "Index Name" in node and node.get("Index Cond")}
+
+
+@pytest.fixture(scope="module")
+def bulk_db(seeded, database) -> Iterator[Tuple[Session, Dict[str, object]]]:
+    """
+    本番相当の件数を一括投入して ANALYZE したセッション（テスト終了時にロールバックする）
+    """
+    connection = database.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection)
+    try:
+        for statement in BULK_INSERTS:
+            db.execute(text(statement), {
+                name: value for name, value in BULK_PARAMS.items() if f":{name}" in statement
+            })
+        db.execute(text("ANALYZE"))
+        params = {
+            **seeded,
+            "image_asset_id": db.query(MediaAssets.id).filter(MediaAssets.kind == MediaAssetKind.IMAGES).limit(1).scalar(),
+            "conversation_id": db.query(Conversations.id).order_by(Conversations.created_at).limit(1).scalar(),
+            "recent_cursor": tuple(
+                db.query(Posts.created_at, Posts.id)
+                .filter(Posts.status == PostStatus.APPROVED)
+                .order_by(Posts.created_at.desc(), Posts.id.desc())
+                .offset(BULK_POSTS_PER_CREATOR * BULK_CREATORS // 2)
+                .limit(1)
+                .one()
+            ),
+        }
+        yield db, params
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.mark.parametrize("name, query, indexes", CRUD_QUERIES, ids=[name for name, _, _ in CRUD_QUERIES])
+def test_crud_query_uses_indexes(bulk_db, name, query, indexes):
+    db, params = bulk_db
+    statements = _capture_statements(db, lambda: query(db, params))
+    assert statements, f"{name}: no statements captured"
+
+    connection = db.connection()
+    used: Set[str] = set()
+    for statement, parameters in statements:
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()[0]["Plan"]
+        seq_scans = _seq_scans(plan)
+        assert not seq_scans, f"{name}: Seq Scan on {seq_scans}\n{statement}"
+        used |= _conditioned_indexes(plan)
+
+    missing = indexes - used
+    assert not missing, f"{name}: {sorted(missing)} not used with an Index Cond (used: {sorted(used)})"